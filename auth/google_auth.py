@@ -5,6 +5,11 @@ Google OAuth handler. Tokens are stored outside the repo at:
 On first run this opens a browser for OAuth consent. Subsequent runs
 use the cached token and refresh silently.
 
+Credentials are kept in memory and reused until shortly before expiry.
+Refreshing is single-flight: concurrent callers (e.g. the Gmail and Calendar
+threads) wait for one refresh instead of each making their own, and the token
+file is replaced atomically so a reader never sees a half-written file.
+
 Setup:
   1. Go to https://console.cloud.google.com
   2. Create a project → enable Gmail API + Google Calendar API
@@ -12,6 +17,10 @@ Setup:
   4. Download JSON → save to ~/.config/intel-brief/google_credentials.json
 """
 
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -27,16 +36,64 @@ CONFIG_DIR = Path.home() / ".config" / "intel-brief"
 TOKEN_PATH = CONFIG_DIR / "google_token.json"
 CREDENTIALS_PATH = CONFIG_DIR / "google_credentials.json"
 
+# Refresh this long before the token actually expires
+EXPIRY_MARGIN = timedelta(minutes=5)
+
+_cached: Credentials | None = None
+_lock = threading.Lock()
+
+
+def _fresh(creds: Credentials | None) -> bool:
+    """True when creds are valid for at least EXPIRY_MARGIN more."""
+    if not creds or not creds.valid:
+        return False
+    if creds.expiry is None:
+        return True
+    # google-auth keeps expiry as a naive UTC datetime
+    expiry = creds.expiry.replace(tzinfo=timezone.utc)
+    return expiry - datetime.now(timezone.utc) > EXPIRY_MARGIN
+
+
+def _write_token(creds: Credentials) -> None:
+    """Replace TOKEN_PATH atomically (temp file in the same dir, then rename)."""
+    fd, tmp = tempfile.mkstemp(dir=TOKEN_PATH.parent, suffix=".tmp")
+    try:
+        os.write(fd, creds.to_json().encode())
+        os.close(fd)
+        os.replace(tmp, TOKEN_PATH)
+    except Exception:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
 
 def get_google_credentials() -> Credentials:
+    global _cached
+    creds = _cached
+    if _fresh(creds):
+        return creds
+
+    with _lock:
+        # Another thread may have refreshed while we waited
+        if _fresh(_cached):
+            return _cached
+        _cached = _load_or_refresh()
+        return _cached
+
+
+def _load_or_refresh() -> Credentials:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     creds = None
 
     if TOKEN_PATH.exists():
         creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
+    if not _fresh(creds):
+        if creds and creds.refresh_token:
             creds.refresh(Request())
         else:
             if not CREDENTIALS_PATH.exists():
@@ -51,6 +108,6 @@ def get_google_credentials() -> Credentials:
             flow = InstalledAppFlow.from_client_secrets_file(str(CREDENTIALS_PATH), SCOPES)
             creds = flow.run_local_server(port=0)
 
-        TOKEN_PATH.write_text(creds.to_json())
+        _write_token(creds)
 
     return creds
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: Confluence HTML-to-text extraction vs. the old regex path.
+
+The regex path strips tags from the whole body and truncates afterwards; the
+extractor tokenizes incrementally and stops at the character budget. The
+regex path is faster on small pages: it does far less (no entities, tables
+or macro removal) and runs entirely in C. The extractor's cost stays flat
+at about a millisecond per page, while the regex path keeps growing with
+page size. Pages
+are synthetic body.view HTML of increasing size (paragraphs, a status table,
+a TOC macro and inline styles).
+
+Usage:
+    python bench_strip_html.py                 # default budget (1500 chars)
+    python bench_strip_html.py --budget 8000   # project-tracker budget
+"""
+import argparse
+import re
+import timeit
+
+from src.connectors.confluence import _strip_html
+
+
+def _regex_strip(html: str, max_chars: int) -> str:
+    """The previous implementation: full-body substitutions, then truncate."""
+    text = re.sub(r"<[^>]+>", " ", html)
+    return " ".join(text.split())[:max_chars]
+
+
+def _make_page(paragraphs: int) -> str:
+    row = "<tr><td>Ledger migration</td><td><b>On</b> track</td><td>Alice &amp; Bob</td></tr>"
+    return (
+        "<style>.c{color:#333}</style>"
+        '<div class="toc-macro"><ul><li>Summary</li><li>Status</li></ul></div>'
+        "<table><tr><th>Project</th><th>State</th><th>Owner</th></tr>" + row * 40 + "</table>"
+        + "<p>Weekly update on <em>pipeline</em> reliability, costs and next steps.</p>" * paragraphs
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Confluence HTML extraction")
+    parser.add_argument("--budget", type=int, default=1500, help="Character budget (default 1500)")
+    parser.add_argument("--number", type=int, default=20, help="Iterations per measurement")
+    args = parser.parse_args()
+
+    print(f"{'page size':>12}  {'regex ms':>10}  {'extractor ms':>13}  {'speedup':>8}")
+    for paragraphs in (10, 100, 1_000, 10_000):
+        html = _make_page(paragraphs)
+        regex = timeit.timeit(lambda: _regex_strip(html, args.budget), number=args.number)
+        streamed = timeit.timeit(lambda: _strip_html(html, max_chars=args.budget), number=args.number)
+        print(
+            f"{len(html):>10,} B  {regex / args.number * 1000:>10.2f}  "
+            f"{streamed / args.number * 1000:>13.2f}  {regex / streamed:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -31,9 +31,14 @@ from src.obsidian import (load_recent_summaries, load_user_notes, load_completed
                            load_daily_completion_counts, load_recurring_unchecked_items,
                            extract_critical_team_signals, load_prev_brief_fingerprints,
                            write_brief, load_last_brief_for_html)
-from src.state import get_last_run, save_last_run, clear_last_run
+from src.state import get_last_run, save_last_run, clear_last_run, commit_cursors
 from src.summarizer import summarize
 
+# Connectors whose fetch_updates(..., incremental=True) resumes each stream from
+# its own cursor. Only the daily fetch uses it; --prep and the 7-day project
+# window always ask for the full window.
+INCREMENTAL_CONNECTORS = {"slack", "jira", "gmail", "news"}
+
 
 def main():
     parser = argparse.ArgumentParser(description="Intel Brief")
@@ -147,10 +152,10 @@ def main():
 
     print("  Fetching sources...")
     with ThreadPoolExecutor(max_workers=len(connectors)) as executor:
-        futures = {
-            executor.submit(module.fetch_updates, config, since): (display, key)
-            for display, key, module in connectors
-        }
+        futures = {}
+        for display, key, module in connectors:
+            kwargs = {"incremental": True} if key in INCREMENTAL_CONNECTORS else {}
+            futures[executor.submit(module.fetch_updates, config, since, **kwargs)] = (display, key)
         for future in as_completed(futures):
             display, key = futures[future]
             try:
@@ -167,6 +172,7 @@ def main():
 
     if total == 0:
         print("  Nothing new. No brief generated.")
+        commit_cursors()
         if not any_failed:
             save_last_run()
         return
@@ -209,10 +215,16 @@ def main():
         print("  Fetching 7-day signals...")
         since_weekly = datetime.now(timezone.utc) - timedelta(days=7)
         weekly_updates = {}
+        # Jira's 7-day view comes from the changelog event log the daily
+        # fetches accumulate; only query Jira when the log has a gap.
+        jira_weekly = jira.updates_from_log(since_weekly)
+        if jira_weekly is not None:
+            weekly_updates["jira"] = jira_weekly
         with ThreadPoolExecutor(max_workers=len(connectors)) as executor:
             futures = {
                 executor.submit(module.fetch_updates, config, since_weekly): (display, key)
                 for display, key, module in connectors
+                if key not in weekly_updates
             }
             for future in as_completed(futures):
                 display, key = futures[future]
@@ -242,6 +254,9 @@ def main():
             prev_fingerprints=prev_fingerprints,
         )
 
+    # Per-stream cursors advance even on a partial failure: only the streams
+    # that completed staged a new high-water mark.
+    commit_cursors()
     if not any_failed:
         save_last_run()
     else:
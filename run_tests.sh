@@ -10,7 +10,7 @@ set -euo pipefail
 cd "$(dirname "$0")"
 
 echo "── 1/2: compiling all .py sources ──"
-python -m compileall -q src run.py search.py migrate_briefs.py
+python -m compileall -q src run.py search.py migrate_briefs.py bench_strip_html.py
 
 echo "── 2/2: pytest ──"
 python -m pytest -q
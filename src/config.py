@@ -19,9 +19,11 @@ DEFAULTS = {
     "obsidian_output_folder": "Intel Briefs",
     "limits": {
         "jira_comment_depth": 3,
+        "jira_max_issues": 2000,
         "gmail_snippet_chars": 300,
         "confluence_body_chars": 1500,
         "confluence_project_chars": 8000,
+        "confluence_delta_chars": 8000,
         "raw_data_max_bytes": 150_000,
         "project_update_max_bytes": 100_000,
         "history_window_days": 3,
@@ -16,6 +16,7 @@ class SlackUpdate(TypedDict):
     text: str
     timestamp: str
     thread_reply_count: int
+    thread_replies: list[dict]
 
 
 class JiraUpdate(TypedDict):
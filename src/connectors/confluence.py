@@ -1,27 +1,281 @@
+import difflib
+import hashlib
+import json
 import logging
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from html import unescape
+from pathlib import Path
+from typing import Iterator
+
 import requests
-from datetime import datetime, timezone
 from requests.auth import HTTPBasicAuth
 
 from src.config import get_limit
+from src.http_client import get_session
 
 log = logging.getLogger("intel_brief")
 
+# Metadata persisted between runs: tenant cloudId, "Project Tracking" page IDs
+# per space, the update page each tracker tree resolved to, and child listings
+# validated with conditional requests.
+_META_CACHE_PATH = Path.home() / ".config" / "intel-brief" / "confluence_cache.json"
+_meta_lock = threading.Lock()
+
+
+def _load_meta() -> dict:
+    try:
+        return json.loads(_META_CACHE_PATH.read_text()) if _META_CACHE_PATH.exists() else {}
+    except Exception:
+        return {}
+
+
+def _get_meta(section: str, key: str):
+    return _load_meta().get(section, {}).get(key)
+
+
+def _set_meta(section: str, key: str, value) -> None:
+    """Read-modify-write one cache entry; value=None removes it."""
+    with _meta_lock:
+        meta = _load_meta()
+        if value is None:
+            meta.get(section, {}).pop(key, None)
+        else:
+            meta.setdefault(section, {})[key] = value
+        _META_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _META_CACHE_PATH.write_text(json.dumps(meta, indent=2))
+
 
 def _get_cloud_id(base_url: str) -> str:
-    resp = requests.get(f"{base_url}/_edge/tenant_info", timeout=10)
+    """Resolve the tenant cloudId, served from disk after the first lookup."""
+    cloud_id = _get_meta("cloud_ids", base_url)
+    if cloud_id:
+        return cloud_id
+    resp = get_session().get(f"{base_url}/_edge/tenant_info", timeout=10)
     resp.raise_for_status()
-    return resp.json()["cloudId"]
+    cloud_id = resp.json()["cloudId"]
+    _set_meta("cloud_ids", base_url, cloud_id)
+    return cloud_id
+
+
+# Stripped page text keyed by page ID and version number, so an unchanged page
+# costs no body download and an edited one can be reduced to what changed.
+_PAGE_STORE_PATH = _META_CACHE_PATH.parent / "confluence_pages.json"
+_PAGE_STORE_DAYS = 30
+
+
+def _load_page_store() -> dict:
+    try:
+        return json.loads(_PAGE_STORE_PATH.read_text()) if _PAGE_STORE_PATH.exists() else {}
+    except Exception:
+        return {}
+
+
+def _save_page_store(entries: dict, max_age_days: int = _PAGE_STORE_DAYS) -> None:
+    """Merge entries into the on-disk store, dropping pages not seen for max_age_days."""
+    if not entries:
+        return
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).isoformat()
+    with _meta_lock:
+        store = _load_page_store()
+        store.update(entries)
+        kept = {k: v for k, v in store.items() if v.get("seen_at", "") >= cutoff}
+        _PAGE_STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _PAGE_STORE_PATH.write_text(json.dumps(kept, indent=2))
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _text_delta(old: str, new: str) -> str:
+    """Sentence-level diff of two stripped page texts: the inserted or
+    rewritten sentences of `new`, joined with an ellipsis. Pure deletions
+    are dropped."""
+    old_parts, new_parts = _SENTENCE_RE.split(old), _SENTENCE_RE.split(new)
+    matcher = difflib.SequenceMatcher(None, old_parts, new_parts, autojunk=False)
+    passages = [
+        " ".join(new_parts[j1:j2])
+        for tag, _, _, j1, j2 in matcher.get_opcodes()
+        if tag in ("insert", "replace")
+    ]
+    return " … ".join(passages)
+
 
+def _store_entry(previous: dict | None, version: int | None, text: str, **extra) -> dict:
+    """Build the store entry for a freshly stripped page version.
 
-def _strip_html(html: str, skip_first_table: bool = False) -> str:
-    """Strip HTML tags, optionally removing the first table element first."""
-    if skip_first_table:
-        html = re.sub(r"<table[\s\S]*?</table>", "", html, count=1, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", html)
-    return " ".join(text.split())
+    The delta against the previous stored version is kept alongside the text;
+    an identical content hash (e.g. a metadata-only edit) carries no delta.
+    """
+    digest = _text_hash(text)
+    delta = ""
+    if previous and previous.get("hash") != digest:
+        delta = _text_delta(previous.get("text", ""), text)
+    return {
+        "version": version,
+        "hash": digest,
+        "text": text,
+        "delta": delta,
+        "previous_version": previous.get("version") if previous else None,
+        "seen_at": datetime.now(timezone.utc).isoformat(),
+        **extra,
+    }
+
+
+_SKIP_TAGS = {"script", "style", "noscript", "template", "svg"}
+# Rendered macro chrome in body.view: table of contents, expand toggles, icons
+_SKIP_CLASSES = ("toc-macro", "expand-control", "aui-icon", "confluence-anchor-link")
+_INLINE_TAGS = {
+    "a", "abbr", "b", "code", "em", "i", "mark", "s", "small", "span",
+    "strong", "sub", "sup", "time", "u",
+}
+_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "source", "track", "wbr",
+}
+# One markup token: a comment, CDATA, doctype/PI, or a start/end tag with its
+# attributes (quoted values may contain ">"). Text between tokens is page text.
+_TOKEN_RE = re.compile(
+    r"<!--.*?(?:-->|$)|<!\[CDATA\[.*?(?:\]\]>|$)|<[!?][^>]*>?"
+    r"""|<(/?)([a-zA-Z][^\s/>]*)((?:[^>"']|"[^"]*"|'[^']*')*)>""",
+    re.S,
+)
+_RAW_TEXT_TAGS = {"script", "style"}   # content is not markup; runs to the end tag
+_CLASS_RE = re.compile(r"""\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""", re.I)
+
+
+class _BudgetReached(Exception):
+    pass
+
+
+class _TextExtractor:
+    """Incremental HTML-to-text over _strip_html()'s token stream: collapses
+    whitespace, drops script/style and macro chrome, and writes table rows as
+    `cell | cell;`. Raises _BudgetReached once `max_chars` characters are
+    collected, abandoning the rest of the document."""
+
+    def __init__(self, max_chars: int | None = None, skip_first_table: bool = False):
+        self.max_chars = max_chars
+        self.done = False
+        self._parts: list[str] = []
+        self._len = 0
+        self._space = False
+        self._skip: list[str] = []       # open tags being skipped, innermost last
+        self._skip_table = skip_first_table
+        self._cells = 0                  # cells emitted in the current row
+
+    def text(self) -> str:
+        out = "".join(self._parts)
+        return out[:self.max_chars] if self.max_chars is not None else out
+
+    def _emit(self, text: str) -> None:
+        if self.done or not text:
+            return
+        if self._space and self._len:
+            self._parts.append(" ")
+            self._len += 1
+        self._space = False
+        self._parts.append(text)
+        self._len += len(text)
+        if self.max_chars is not None and self._len >= self.max_chars:
+            self.done = True
+            raise _BudgetReached
+
+    def handle_starttag(self, tag: str, classes: str) -> None:
+        if self._skip:
+            if tag not in _VOID_TAGS:
+                self._skip.append(tag)
+            return
+        if (
+            tag in _SKIP_TAGS
+            or ":" in tag  # storage-format macros (ac:*, ri:*)
+            or (classes and any(c in classes for c in _SKIP_CLASSES))
+            or (tag == "table" and self._skip_table)
+        ):
+            if tag == "table":
+                self._skip_table = False
+            if tag not in _VOID_TAGS:
+                self._skip.append(tag)
+            return
+        if tag == "tr":
+            self._cells = 0
+        elif tag in ("td", "th"):
+            if self._cells:
+                self._emit("|")
+            self._cells += 1
+        if tag not in _INLINE_TAGS:
+            self._space = True
+
+    def handle_startendtag(self, tag: str) -> None:
+        if not self._skip and tag not in _INLINE_TAGS:
+            self._space = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._skip:
+            if tag in self._skip:
+                # Close through the matching tag (tolerates unclosed children)
+                while self._skip.pop() != tag:
+                    pass
+            return
+        if tag == "tr" and self._cells and self._len and not self.done:
+            self._parts.append(";")
+            self._len += 1
+            self._cells = 0
+        if tag not in _INLINE_TAGS:
+            self._space = True
+
+    def handle_data(self, data: str) -> None:
+        if self._skip or self.done:
+            return
+        if data[:1].isspace():
+            self._space = True
+        words = data.split()
+        if words:
+            self._emit(" ".join(words))
+            if data[-1:].isspace():
+                self._space = True
+
+
+def _strip_html(html: str, skip_first_table: bool = False, max_chars: int | None = None) -> str:
+    """Extract readable text from a Confluence body, stopping at max_chars.
+
+    Tokens are matched lazily with one regex, so a large page is only scanned
+    up to the character budget and a small one costs about as much as a
+    regex tag strip. Optionally drops the first table (page metadata on team
+    update pages).
+    """
+    parser = _TextExtractor(max_chars, skip_first_table)
+    pos = 0
+    try:
+        while token := _TOKEN_RE.search(html, pos):
+            if token.start() > pos:
+                parser.handle_data(unescape(html[pos:token.start()]))
+            pos = token.end()
+            closing, tag, attrs = token.groups()
+            if tag is None:
+                continue  # comment, CDATA or declaration
+            tag = tag.lower()
+            if closing:
+                parser.handle_endtag(tag)
+            elif attrs.endswith("/"):
+                parser.handle_startendtag(tag)
+            else:
+                match = _CLASS_RE.search(attrs) if "class" in attrs.lower() else None
+                parser.handle_starttag(tag, "".join(match.groups("")) if match else "")
+                if tag in _RAW_TEXT_TAGS:
+                    end = re.compile(rf"</{tag}\s*>", re.I).search(html, pos)
+                    pos = end.start() if end else len(html)
+        parser.handle_data(unescape(html[pos:]))
+    except _BudgetReached:
+        pass
+    return parser.text()
 
 
 # Pattern matching date-range week titles (e.g., "2026-04-20 through 2026-04-24")
@@ -30,27 +284,61 @@ _WEEK_TITLE_RE = re.compile(r"\d{4}-\d{2}-\d{2}\s+(through|to|-)\s+\d{4}-\d{2}-\
 _FOLDER_TITLE_RE = re.compile(r"^\d{6}$")
 
 
-def _most_recent_child(api_base: str, auth, parent_id: str, depth: int) -> dict | None:
-    """Drill `depth` levels into the child hierarchy, always picking the
-    most-recently-modified child at each level. Returns the target page dict
-    (with at minimum 'id' and 'title'), or None if any level is empty.
+def _list_children(api_base: str, auth, parent_id: str) -> list[dict]:
+    """List a page's child pages (with version), revalidating the cached listing.
 
-    At the final level (depth=0), prefers pages whose titles look like weekly
-    updates over archive folders, to avoid picking a folder that was incidentally
-    modified more recently.
+    A cached listing is reused when the server answers If-None-Match with 304.
     """
-    resp = requests.get(
+    cached = _get_meta("children", parent_id)
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    resp = get_session().get(
         f"{api_base}/rest/api/content/{parent_id}/child/page",
         auth=auth,
         params={"expand": "version", "limit": 50},
+        headers=headers,
         timeout=30,
     )
+    if resp.status_code == 304 and cached:
+        return cached["results"]
     resp.raise_for_status()
     children = resp.json().get("results", [])
+
+    etag = resp.headers.get("ETag")
+    if etag:
+        _set_meta("children", parent_id, {
+            "etag": etag,
+            "results": [
+                {
+                    "id": c.get("id"),
+                    "title": c.get("title", ""),
+                    "version": {
+                        "when": c.get("version", {}).get("when", ""),
+                        "number": c.get("version", {}).get("number"),
+                    },
+                }
+                for c in children
+            ],
+        })
+    return children
+
+
+def _most_recent_child(api_base: str, auth, parent_id: str, depth: int) -> dict | None:
+    """Drill `depth` levels into the child hierarchy, always picking the
+    most-recently-modified child at each level. Returns the target page dict
+    (with at minimum 'id' and 'title'), or None if any level is empty.
+
+    At the final level (depth=0), prefers pages whose titles look like weekly
+    updates over archive folders, to avoid picking a folder that was incidentally
+    modified more recently.
+    """
+    children = _list_children(api_base, auth, parent_id)
     if not children:
         return None
 
-    children.sort(key=lambda p: p.get("version", {}).get("when", ""), reverse=True)
+    children = sorted(children, key=lambda p: p.get("version", {}).get("when", ""), reverse=True)
 
     if depth == 0:
         # At the final level, prefer weekly update pages over archive folders
@@ -67,6 +355,81 @@ def _most_recent_child(api_base: str, auth, parent_id: str, depth: int) -> dict
     return _most_recent_child(api_base, auth, children[0]["id"], depth - 1)
 
 
+def _tree_unchanged(api_base: str, auth, parent_id: str, since_day: str) -> bool:
+    """True when no page under `parent_id` was created or edited on or after
+    `since_day` (YYYY-MM-DD) — one CQL search instead of a drill-down."""
+    resp = get_session().get(
+        f"{api_base}/rest/api/content/search",
+        auth=auth,
+        params={
+            "cql": f'ancestor = {parent_id} AND type = page AND lastmodified >= "{since_day}"',
+            "limit": 1,
+        },
+        timeout=30,
+    )
+    resp.raise_for_status()
+    return not resp.json().get("results")
+
+
+def _resolve_tracker(api_base: str, auth, space_key: str, parent_id: str, depth: int) -> dict | None:
+    """The most recent update page under `parent_id`.
+
+    The page resolved last time is reused when CQL finds nothing in the tree
+    modified since the day before that check (a day of slack covers CQL's
+    minute granularity and time zone), so an unchanged tracker costs one call
+    rather than depth + 1 child listings.
+    """
+    cache_key = f"{api_base}|{space_key}"
+    cached = _get_meta("trackers", cache_key)
+    today = datetime.now(timezone.utc).date()
+    if cached and cached.get("parent_id") == parent_id and cached.get("depth") == depth:
+        since_day = (datetime.fromisoformat(cached["checked"]).date() - timedelta(days=1)).isoformat()
+        if _tree_unchanged(api_base, auth, parent_id, since_day):
+            _set_meta("trackers", cache_key, {**cached, "checked": today.isoformat()})
+            return cached["target"]
+
+    target = _most_recent_child(api_base, auth, parent_id, depth)
+    if target:
+        _set_meta("trackers", cache_key, {
+            "parent_id": parent_id,
+            "depth": depth,
+            "checked": today.isoformat(),
+            "target": {
+                "id": target["id"],
+                "title": target.get("title", ""),
+                "version": {"number": target.get("version", {}).get("number")},
+            },
+        })
+    return target
+
+
+def _find_project_tracking(api_base: str, auth, space_key: str) -> str | None:
+    """Return the ID of the space's "Project Tracking" page, cached on disk."""
+    cache_key = f"{api_base}|{space_key}"
+    parent_id = _get_meta("project_tracking", cache_key)
+    if parent_id:
+        return parent_id
+
+    search_resp = get_session().get(
+        f"{api_base}/rest/api/content",
+        auth=auth,
+        params={
+            "spaceKey": space_key,
+            "title": "Project Tracking",
+            "type": "page",
+            "expand": "version",
+            "limit": 5,
+        },
+        timeout=30,
+    )
+    search_resp.raise_for_status()
+    pages = search_resp.json().get("results", [])
+    if not pages:
+        return None
+    _set_meta("project_tracking", cache_key, pages[0]["id"])
+    return pages[0]["id"]
+
+
 def fetch_team_project_updates(config: dict) -> list[dict]:
     """For each team space, find the 'Project Tracking' parent page, drill down
     `nesting_depth` levels to reach the most recent update page, and return its content.
@@ -89,80 +452,182 @@ def fetch_team_project_updates(config: dict) -> list[dict]:
 
     email = os.environ["ATLASSIAN_EMAIL"]
     base_url = os.environ["ATLASSIAN_BASE_URL"].rstrip("/")
+    session = get_session()
     cloud_id = _get_cloud_id(base_url)
     api_base = f"https://api.atlassian.com/ex/confluence/{cloud_id}/wiki"
     auth = HTTPBasicAuth(email, os.environ["CONFLUENCE_API_TOKEN"])
     max_chars = get_limit(config, "confluence_project_chars")
+    max_workers = max(1, config.get("confluence", {}).get("max_workers", 4))
+    store = _load_page_store()
 
-    results = []
-    for sc in space_configs:
+    def _fetch_tracker(sc: dict) -> tuple[dict | None, dict]:
+        """Latest update page and its store entry for one space; errors stay in the space."""
         space_key = sc["space"]
         department = sc.get("department", space_key)
         skip_first_table = sc.get("skip_first_table", False)
         nesting_depth = sc.get("nesting_depth", 0)
         try:
             # Find the "Project Tracking" parent page in this space
-            search_resp = requests.get(
-                f"{api_base}/rest/api/content",
-                auth=auth,
-                params={
-                    "spaceKey": space_key,
-                    "title": "Project Tracking",
-                    "type": "page",
-                    "expand": "version",
-                    "limit": 5,
-                },
-                timeout=30,
-            )
-            search_resp.raise_for_status()
-            pages = search_resp.json().get("results", [])
-            if not pages:
+            parent_id = _find_project_tracking(api_base, auth, space_key)
+            if not parent_id:
                 log.warning(f"[Confluence] No 'Project Tracking' page found in space {space_key}")
-                continue
-
-            parent_id = pages[0]["id"]
+                return None, {}
 
             # Drill down through intermediate folders to the most recent update page
-            target = _most_recent_child(api_base, auth, parent_id, nesting_depth)
+            try:
+                target = _resolve_tracker(api_base, auth, space_key, parent_id, nesting_depth)
+            except requests.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                # Cached parent was moved or deleted — look it up again
+                _set_meta("project_tracking", f"{api_base}|{space_key}", None)
+                parent_id = _find_project_tracking(api_base, auth, space_key)
+                target = _resolve_tracker(api_base, auth, space_key, parent_id, nesting_depth) if parent_id else None
             if not target:
                 log.warning(f"[Confluence] No pages found under 'Project Tracking' in {space_key}")
-                continue
+                return None, {}
 
             page_id = target["id"]
             page_title = target.get("title", "")
-
-            # Fetch full page content
-            detail_resp = requests.get(
-                f"{api_base}/rest/api/content/{page_id}",
-                auth=auth,
-                params={"expand": "body.view,version"},
-                timeout=30,
-            )
-            detail_resp.raise_for_status()
-            details = detail_resp.json()
-
-            body_html = details.get("body", {}).get("view", {}).get("value", "")
-            content = _strip_html(body_html, skip_first_table=skip_first_table)
-            content = content[:max_chars]
-
-            webui = details.get("_links", {}).get("webui", "")
-            results.append({
+            version = target.get("version", {}).get("number")
+
+            stored = store.get(page_id)
+            if not (stored and version is not None and stored.get("version") == version
+                    and stored.get("skip_first_table") == skip_first_table
+                    and stored.get("max_chars") == max_chars):
+                # Fetch full page content
+                detail_resp = session.get(
+                    f"{api_base}/rest/api/content/{page_id}",
+                    auth=auth,
+                    params={"expand": "body.view,version"},
+                    timeout=30,
+                )
+                detail_resp.raise_for_status()
+                details = detail_resp.json()
+
+                body_html = details.get("body", {}).get("view", {}).get("value", "")
+                stored = _store_entry(
+                    stored,
+                    details.get("version", {}).get("number", version),
+                    _strip_html(body_html, skip_first_table, max_chars),
+                    webui=details.get("_links", {}).get("webui", ""),
+                    skip_first_table=skip_first_table,
+                    max_chars=max_chars,
+                )
+            else:
+                stored = {**stored, "seen_at": datetime.now(timezone.utc).isoformat()}
+            return {
                 "space": space_key,
                 "department": department,
                 "page_title": page_title,
-                "content": content,
-                "url": base_url + webui,
-            })
+                "content": stored["text"][:max_chars],
+                "url": base_url + stored.get("webui", ""),
+            }, {page_id: stored}
 
         except Exception as e:
             log.warning(f"[Confluence] Error fetching project updates for {space_key}: {e}")
+            return None, {}
+
+    # One drill-down per space, concurrently; map() keeps config order
+    results, store_updates = [], {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(space_configs))) as executor:
+        for result, entries in executor.map(_fetch_tracker, space_configs):
+            if result:
+                results.append(result)
+            store_updates.update(entries)
 
+    _save_page_store(store_updates)
     return results
 
 
+_SEARCH_LIMIT = 50
+_DETAIL_WORKERS = 8
+
+
+def _search_pages(
+    session, api_base: str, auth, cql: str, expand: str = "body.view,version",
+) -> Iterator[dict]:
+    """Yield CQL search results with `expand` (by default body and version)
+    resolved in the same call.
+
+    Follows `_links.next` when the server provides it, otherwise pages by
+    start/limit until a short page, so cost grows with result pages rather
+    than with the number of documents.
+    """
+    url = f"{api_base}/rest/api/content/search"
+    params = {"cql": cql, "expand": expand, "limit": _SEARCH_LIMIT, "start": 0}
+    while True:
+        resp = session.get(url, auth=auth, params=params, timeout=30)
+        resp.raise_for_status()
+        data = resp.json()
+        results = data.get("results", [])
+        yield from results
+
+        next_link = data.get("_links", {}).get("next")
+        if next_link and results:
+            url, params = api_base + next_link, None
+        elif params is None or len(results) < _SEARCH_LIMIT:
+            # Once paging by link, a page without one is the last
+            break
+        else:
+            params["start"] += _SEARCH_LIMIT
+
+
+def _has_body(page: dict) -> bool:
+    return "value" in page.get("body", {}).get("view", {})
+
+
+def _fetch_details(session, api_base: str, auth, page_ids: list[str]) -> dict[str, dict]:
+    """Fetch expanded page details concurrently — fallback for search results
+    that came back without a body. Returns {page_id: details}."""
+    def _get(page_id):
+        resp = session.get(
+            f"{api_base}/rest/api/content/{page_id}",
+            auth=auth,
+            params={"expand": "body.view,version"},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    with ThreadPoolExecutor(max_workers=_DETAIL_WORKERS) as executor:
+        return dict(zip(page_ids, executor.map(_get, page_ids)))
+
+
+def _is_stored(store: dict, page: dict, max_chars: int | None) -> bool:
+    """True when the store already holds this exact page version, extracted
+    with the same budget and without the first table dropped."""
+    version = page.get("version", {}).get("number")
+    entry = store.get(page.get("id"), {})
+    return (
+        version is not None
+        and entry.get("version") == version
+        and entry.get("max_chars") == max_chars
+        and not entry.get("skip_first_table")
+    )
+
+
+def _fetch_bodies(session, api_base: str, auth, page_ids: list[str]) -> dict[str, dict]:
+    """Fetch bodies for the given pages with `id in (...)` CQL searches, one
+    call per _SEARCH_LIMIT pages, falling back to per-page detail requests for
+    anything the search returns without a body. Returns {page_id: page}."""
+    pages = {}
+    for i in range(0, len(page_ids), _SEARCH_LIMIT):
+        chunk = page_ids[i:i + _SEARCH_LIMIT]
+        cql = f"id in ({','.join(chunk)})"
+        for page in _search_pages(session, api_base, auth, cql):
+            pages[page.get("id")] = page
+
+    missing = [pid for pid in page_ids if not _has_body(pages.get(pid, {}))]
+    if missing:
+        pages.update(_fetch_details(session, api_base, auth, missing))
+    return pages
+
+
 def fetch_updates(config: dict, since: datetime) -> list[dict]:
     email = os.environ["ATLASSIAN_EMAIL"]
     base_url = os.environ["ATLASSIAN_BASE_URL"].rstrip("/")
+    session = get_session()
 
     cloud_id = _get_cloud_id(base_url)
     api_base = f"https://api.atlassian.com/ex/confluence/{cloud_id}/wiki"
@@ -170,71 +635,70 @@ def fetch_updates(config: dict, since: datetime) -> list[dict]:
 
     spaces = config.get("confluence", {}).get("spaces", [])
     body_chars = get_limit(config, "confluence_body_chars")
+    deltas_only = config.get("confluence", {}).get("deltas_only", False)
+    # Deltas diff a longer (still bounded) prefix; otherwise stop at the budget
+    text_chars = get_limit(config, "confluence_delta_chars") if deltas_only else body_chars
+    max_workers = max(1, config.get("confluence", {}).get("max_workers", 4))
+    store = _load_page_store()
     # Ensure since is timezone-aware for comparison
     if since.tzinfo is None:
         since = since.replace(tzinfo=timezone.utc)
-    updates = []
+    since_str = since.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M")
 
-    for space_key in spaces:
+    def _fetch_space(space_key: str) -> tuple[list[dict], dict]:
+        """Updates and new store entries for one space; errors stay in the space."""
+        updates, entries = [], {}
         try:
-            since_str = since.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M")
             cql = (
                 f'space = "{space_key}" AND type = page '
                 f'AND lastmodified >= "{since_str}" '
                 f'ORDER BY lastmodified DESC'
             )
-            start = 0
-            limit = 50
-            while True:
-                resp = requests.get(
-                    f"{api_base}/rest/api/content/search",
-                    auth=auth,
-                    params={
-                        "cql": cql,
-                        "expand": "version",
-                        "limit": limit,
-                        "start": start,
-                    },
-                    timeout=30,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                results = data.get("results", [])
-                if not results:
-                    break
-
-                for page in results:
-                    updated_at = page.get("version", {}).get("when", "")
-                    page_id = page.get("id")
-                    detail_resp = requests.get(
-                        f"{api_base}/rest/api/content/{page_id}",
-                        auth=auth,
-                        params={"expand": "body.view,version"},
-                        timeout=30,
+            # Versions first; bodies only for (page, version) pairs not in the store
+            pages = list(_search_pages(session, api_base, auth, cql, expand="version"))
+            changed = [p.get("id") for p in pages if not _is_stored(store, p, text_chars)]
+            bodies = _fetch_bodies(session, api_base, auth, changed) if changed else {}
+
+            for page in pages:
+                page_id = page.get("id")
+                updated_at = page.get("version", {}).get("when", "")
+                number = page.get("version", {}).get("number")
+                if page_id in bodies:
+                    page = bodies[page_id]
+                    body_html = page.get("body", {}).get("view", {}).get("value", "")
+                    entry = _store_entry(
+                        store.get(page_id), number, _strip_html(body_html, max_chars=text_chars),
+                        max_chars=text_chars,
                     )
-                    detail_resp.raise_for_status()
-                    details = detail_resp.json()
-
-                    body_html = details.get("body", {}).get("view", {}).get("value", "")
-                    clean_body = re.sub(r"<[^>]+>", " ", body_html)
-                    clean_body = " ".join(clean_body.split())[:body_chars]
-
-                    webui = details.get("_links", {}).get("webui", "")
-                    updates.append({
-                        "source": "confluence",
-                        "space": space_key,
-                        "title": details.get("title", ""),
-                        "author": details.get("version", {}).get("by", {}).get("displayName", ""),
-                        "updated_at": updated_at,
-                        "url": base_url + webui,
-                        "content": clean_body,
-                    })
-
-                if len(results) < limit:
-                    break
-                start += limit
+                else:
+                    entry = {**store[page_id], "seen_at": datetime.now(timezone.utc).isoformat()}
+                entries[page_id] = entry
+
+                update = {
+                    "source": "confluence",
+                    "space": space_key,
+                    "title": page.get("title", ""),
+                    "author": page.get("version", {}).get("by", {}).get("displayName", ""),
+                    "updated_at": updated_at,
+                    "url": base_url + page.get("_links", {}).get("webui", ""),
+                    "content": entry["text"][:body_chars],
+                }
+                if deltas_only and entry.get("delta"):
+                    update["content"] = entry["delta"][:body_chars]
+                    update["changed_since_version"] = entry["previous_version"]
+                updates.append(update)
 
         except Exception as e:
             log.warning(f"[Confluence] Error fetching space {space_key}: {e}")
+            return [], {}
+        return updates, entries
+
+    # Spaces run concurrently; map() keeps results in config order
+    updates, store_updates = [], {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(spaces) or 1)) as executor:
+        for space_updates, entries in executor.map(_fetch_space, spaces):
+            updates.extend(space_updates)
+            store_updates.update(entries)
 
+    _save_page_store(store_updates)
     return updates
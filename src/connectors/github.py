@@ -1,14 +1,151 @@
 """GitHub connector — fetches open PRs awaiting your review and your own open PRs."""
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
-import requests
-
 from src.config import get_limit
+from src.http_client import conditional_get, get_session, pop_validator_stats
 
 log = logging.getLogger("intel_brief")
 
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_SEARCH_URL = "https://api.github.com/search/issues"
+_PAGE_SIZE = 25           # PRs per search
+_REVIEW_COUNT = 3         # most recent reviews kept per PR
+
+# Both searches in one GraphQL round trip, each PR with its body and last reviews
+_PR_FIELDS = """
+      ... on PullRequest {
+        title url number createdAt updatedAt
+        author { login }
+        repository { name }
+        %(extra)s
+      }"""
+_REVIEW_FIELDS = "body reviews(last: %d) { nodes { author { login } body } }" % _REVIEW_COUNT
+_QUERY = """
+query($reviewRequested: String!, $yourPr: String!, $first: Int!) {
+  review_requested: search(type: ISSUE, query: $reviewRequested, first: $first) {
+    nodes {%(fields)s
+    }
+  }
+  your_pr: search(type: ISSUE, query: $yourPr, first: $first) {
+    nodes {%(fields)s
+    }
+  }
+}"""
+
+
+def _graphql_query(include_body: bool) -> str:
+    fields = _PR_FIELDS % {"extra": _REVIEW_FIELDS if include_body else ""}
+    return _QUERY % {"fields": fields}
+
+
+def _search_graphql(headers: dict, queries: dict[str, str], include_body: bool, body_chars: int) -> list[dict]:
+    """Run both searches in one GraphQL request. Raises on HTTP or GraphQL errors."""
+    resp = get_session().post(
+        _GRAPHQL_URL,
+        headers=headers,
+        json={
+            "query": _graphql_query(include_body),
+            "variables": {
+                # GraphQL search takes no sort argument; ask for it in the query string
+                "reviewRequested": f"{queries['review_requested']} sort:updated-desc",
+                "yourPr": f"{queries['your_pr']} sort:updated-desc",
+                "first": _PAGE_SIZE,
+            },
+        },
+        timeout=10,
+    )
+    resp.raise_for_status()
+    payload = resp.json()
+    if payload.get("errors"):
+        raise RuntimeError(payload["errors"][0].get("message", "GraphQL error"))
+
+    results = []
+    for pr_type in queries:
+        for node in payload["data"][pr_type]["nodes"]:
+            if not node:
+                continue
+            entry = {
+                "type": pr_type,
+                "title": node["title"],
+                "url": node["url"],
+                "repo": node["repository"]["name"],
+                "author": (node.get("author") or {}).get("login", "unknown"),
+                "created_at": node["createdAt"],
+                "updated_at": node["updatedAt"],
+                "number": node["number"],
+            }
+            if include_body:
+                entry["body"] = (node.get("body") or "")[:body_chars]
+                entry["recent_reviews"] = [
+                    {
+                        "reviewer": (r.get("author") or {}).get("login", "unknown"),
+                        "body": (r.get("body") or "")[:300],
+                    }
+                    for r in (node.get("reviews") or {}).get("nodes", [])
+                ]
+            results.append(entry)
+    return results
+
+
+def _parse_search(content: bytes) -> list[dict]:
+    return [
+        {
+            "title": item["title"],
+            "url": item["html_url"],
+            "repository_url": item.get("repository_url", ""),
+            "author": item["user"]["login"],
+            "created_at": item["created_at"],
+            "updated_at": item["updated_at"],
+            "number": item["number"],
+            "body": item.get("body") or "",
+        }
+        for item in json.loads(content).get("items", [])
+    ]
+
+
+def _search_rest(headers: dict, query: str, pr_type: str, include_body: bool, body_chars: int) -> list[dict]:
+    """One REST issue search. Returns entries without reviews; [] on failure."""
+    results = []
+    try:
+        items = conditional_get(
+            "github",
+            _SEARCH_URL,
+            _parse_search,
+            params={"q": query, "per_page": _PAGE_SIZE, "sort": "updated"},
+            headers=headers,
+        )
+        for item in items:
+            entry = {
+                "type": pr_type,
+                "title": item["title"],
+                "url": item["url"],
+                "repo": item["repository_url"].rsplit("/", 1)[-1],
+                "author": item["author"],
+                "created_at": item["created_at"],
+                "updated_at": item["updated_at"],
+                "number": item["number"],
+                "_repository_url": item["repository_url"],
+            }
+            if include_body:
+                entry["body"] = item["body"][:body_chars]
+            results.append(entry)
+    except Exception as e:
+        log.warning(f"[GitHub] Search failed ({pr_type}): {e}")
+    return results
+
+
+def _attach_reviews(headers: dict, entry: dict) -> None:
+    # repository_url looks like https://api.github.com/repos/Owner/Repo
+    parts = entry.pop("_repository_url").rstrip("/").split("/")
+    if len(parts) >= 2:
+        entry["recent_reviews"] = _fetch_reviews(headers, parts[-2], parts[-1], entry["number"])
+    else:
+        entry["recent_reviews"] = []
+
 
 def fetch_updates(config: dict, since: datetime) -> list[dict]:
     token = os.environ.get("GITHUB_TOKEN")
@@ -23,77 +160,59 @@ def fetch_updates(config: dict, since: datetime) -> list[dict]:
 
     # Filter to PRs updated since last run
     since_str = since.strftime("%Y-%m-%dT%H:%M:%S")
-    results = []
+    github_cfg = config.get("github", {})
     body_chars = get_limit(config, "github_pr_body_chars")
-    include_body = config.get("github", {}).get("include_pr_body", True)
+    include_body = github_cfg.get("include_pr_body", True)
+
+    repos = github_cfg.get("repos", [])
+    repo_filter = " ".join(f"repo:{r}" for r in repos) if repos else ""
+    queries = {
+        "review_requested": f"is:pr is:open review-requested:@me updated:>={since_str} {repo_filter}".strip(),
+        "your_pr": f"is:pr is:open author:@me updated:>={since_str} {repo_filter}".strip(),
+    }
 
-    def _search(query: str, pr_type: str):
+    if github_cfg.get("use_graphql", True):
         try:
-            resp = requests.get(
-                "https://api.github.com/search/issues",
-                headers=headers,
-                params={"q": query, "per_page": 25, "sort": "updated"},
-                timeout=10,
-            )
-            resp.raise_for_status()
-            for item in resp.json().get("items", []):
-                repository_url = item.get("repository_url", "")
-                repo = repository_url.rsplit("/", 1)[-1]
-                entry = {
-                    "type": pr_type,
-                    "title": item["title"],
-                    "url": item["html_url"],
-                    "repo": repo,
-                    "author": item["user"]["login"],
-                    "created_at": item["created_at"],
-                    "updated_at": item["updated_at"],
-                    "number": item["number"],
-                }
-
-                if include_body:
-                    entry["body"] = (item.get("body") or "")[:body_chars]
-
-                    # Fetch review comments
-                    # repository_url looks like https://api.github.com/repos/Owner/Repo
-                    parts = repository_url.rstrip("/").split("/")
-                    if len(parts) >= 2:
-                        owner, repo_name = parts[-2], parts[-1]
-                        entry["recent_reviews"] = _fetch_reviews(
-                            headers, owner, repo_name, item["number"]
-                        )
-                    else:
-                        entry["recent_reviews"] = []
-
-                results.append(entry)
+            return _search_graphql(headers, queries, include_body, body_chars)
         except Exception as e:
-            log.warning(f"[GitHub] Search failed ({pr_type}): {e}")
-
-    repos = config.get("github", {}).get("repos", [])
-    repo_filter = " ".join(f"repo:{r}" for r in repos) if repos else ""
+            log.warning(f"[GitHub] GraphQL search failed, falling back to REST: {e}")
+
+    # REST fallback: both searches, then every PR's reviews, run concurrently
+    max_workers = max(1, github_cfg.get("max_workers", 8))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        searches = executor.map(
+            lambda item: _search_rest(headers, item[1], item[0], include_body, body_chars),
+            queries.items(),
+        )
+        results = [entry for entries in searches for entry in entries]
+        if include_body:
+            list(executor.map(lambda entry: _attach_reviews(headers, entry), results))
+    for entry in results:
+        entry.pop("_repository_url", None)
+    stats = pop_validator_stats("github")
+    log.info(f"[GitHub] REST: {stats['hits']} unchanged (304), {stats['misses']} downloaded")
+    return results
 
-    _search(f"is:pr is:open review-requested:@me updated:>={since_str} {repo_filter}".strip(), "review_requested")
-    _search(f"is:pr is:open author:@me updated:>={since_str} {repo_filter}".strip(), "your_pr")
 
-    return results
+def _parse_reviews(content: bytes) -> list[dict]:
+    return [
+        {
+            "reviewer": r.get("user", {}).get("login", "unknown"),
+            "body": (r.get("body") or "")[:300],
+        }
+        for r in json.loads(content)[-_REVIEW_COUNT:]
+    ]
 
 
 def _fetch_reviews(headers: dict, owner: str, repo: str, pr_number: int) -> list[dict]:
     """Fetch the last 3 reviews for a PR. Returns [] on failure."""
     try:
-        resp = requests.get(
+        return conditional_get(
+            "github",
             f"https://api.github.com/repos/{owner}/{repo}/pulls/{pr_number}/reviews",
+            _parse_reviews,
             headers=headers,
-            timeout=10,
         )
-        resp.raise_for_status()
-        reviews = resp.json()[-3:]
-        return [
-            {
-                "reviewer": r.get("user", {}).get("login", "unknown"),
-                "body": (r.get("body") or "")[:300],
-            }
-            for r in reviews
-        ]
     except Exception as e:
         log.warning(f"[GitHub] Failed to fetch reviews for {owner}/{repo}#{pr_number}: {e}")
         return []
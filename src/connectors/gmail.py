@@ -1,18 +1,162 @@
+import json
 import logging
 from datetime import datetime
-from auth.google_auth import get_google_credentials
-from googleapiclient.discovery import build
+from email.utils import getaddresses
+from googleapiclient.errors import HttpError
 
 from src.config import get_limit
+from src.google_client import get_service
+from src.state import get_cursors, stage_cursors
 
 log = logging.getLogger("intel_brief")
 
+_LIST_PAGE_SIZE = 500     # messages.list / history.list maxResults (API max 500)
+_BATCH_SIZE = 100         # Gmail batch requests allow at most 100 calls
+# Labels the list query filters out (-category:promotions -category:social);
+# history.list has no query, so new messages are filtered on these instead.
+_SKIP_LABELS = {"CATEGORY_PROMOTIONS", "CATEGORY_SOCIAL", "SPAM", "TRASH", "DRAFT"}
 
-def fetch_updates(config: dict, since: datetime) -> list[dict]:
-    creds = get_google_credentials()
-    service = build("gmail", "v1", credentials=creds)
 
-    max_results = config.get("gmail", {}).get("max_results", 50)
+def _list_message_ids(service, query: str, max_messages: int) -> list[str]:
+    """All message IDs matching `query` (newest first), following nextPageToken."""
+    ids, page_token = [], None
+    while True:
+        result = (
+            service.users()
+            .messages()
+            .list(userId="me", q=query, maxResults=_LIST_PAGE_SIZE, pageToken=page_token)
+            .execute()
+        )
+        ids.extend(m["id"] for m in result.get("messages", []))
+        page_token = result.get("nextPageToken")
+        if not page_token or len(ids) >= max_messages:
+            break
+    if len(ids) > max_messages or page_token:
+        log.warning(f"[Gmail] Stopped at {max_messages} messages (gmail.max_results)")
+    return ids[:max_messages]
+
+
+def _history_message_ids(service, start_history_id: str, max_messages: int) -> tuple[list[str], str]:
+    """Message IDs added since start_history_id (newest first) and the latest
+    historyId. Raises HttpError 404 when start_history_id has expired."""
+    ids, seen, page_token = [], set(), None
+    history_id = start_history_id
+    while True:
+        result = (
+            service.users()
+            .history()
+            .list(
+                userId="me",
+                startHistoryId=start_history_id,
+                historyTypes=["messageAdded"],
+                maxResults=_LIST_PAGE_SIZE,
+                pageToken=page_token,
+            )
+            .execute()
+        )
+        history_id = result.get("historyId", history_id)
+        for record in result.get("history", []):
+            for added in record.get("messagesAdded", []):
+                message = added.get("message", {})
+                if message.get("id") in seen or _SKIP_LABELS & set(message.get("labelIds", [])):
+                    continue
+                seen.add(message["id"])
+                ids.append(message["id"])
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            break
+    ids.reverse()
+    if len(ids) > max_messages:
+        log.warning(f"[Gmail] Stopped at {max_messages} messages (gmail.max_results)")
+    return ids[:max_messages], history_id
+
+
+def _get_messages(service, message_ids: list[str]) -> dict[str, dict]:
+    """Resolve message metadata in batch requests of at most _BATCH_SIZE."""
+    messages = {}
+
+    def handle_message(request_id, response, exception):
+        if exception or not response:
+            return
+        messages[request_id] = response
+
+    for i in range(0, len(message_ids), _BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=handle_message)
+        for message_id in message_ids[i:i + _BATCH_SIZE]:
+            batch.add(
+                service.users().messages().get(
+                    userId="me",
+                    id=message_id,
+                    format="metadata",
+                    metadataHeaders=["Subject", "From", "Date", "To"],
+                ),
+                request_id=message_id,
+            )
+        batch.execute()
+    return messages
+
+
+def _participants(records: list[dict]) -> list[str]:
+    """Distinct senders and recipients across records, by display name when given."""
+    seen = {}
+    for record in records:
+        for name, addr in getaddresses([record.get("from", ""), record.get("to", "")]):
+            if addr and addr.lower() not in seen:
+                seen[addr.lower()] = name or addr
+    return list(seen.values())
+
+
+def _group_threads(messages: list[tuple[dict, dict]], keep_snippets: int) -> list[dict]:
+    """Fold messages that share a threadId into one record per thread.
+
+    `messages` is [(api response, record)] newest first. A thread with more
+    than one message becomes {subject, participants, message_count,
+    first_date, last_date, snippets} with only the newest `keep_snippets`
+    snippets; single messages pass through. Threads keep the position of
+    their newest message.
+    """
+    threads: dict[str, list[tuple[dict, dict]]] = {}
+    for response, record in messages:
+        threads.setdefault(response.get("threadId") or response.get("id"), []).append((response, record))
+
+    grouped = []
+    for members in threads.values():
+        if len(members) == 1:
+            grouped.append(members[0][1])
+            continue
+        members.sort(key=lambda m: int(m[0].get("internalDate", 0)), reverse=True)
+        records = [record for _, record in members]
+        grouped.append({
+            "source": "gmail",
+            "subject": records[-1]["subject"],
+            "participants": _participants(records),
+            "message_count": len(records),
+            "first_date": records[-1]["date"],
+            "last_date": records[0]["date"],
+            "snippets": [
+                {"from": r["from"], "date": r["date"], "snippet": r["snippet"]}
+                for r in records[:keep_snippets]
+            ],
+        })
+    return grouped
+
+
+def _raw_bytes(records: list[dict]) -> int:
+    return len(json.dumps(records, indent=2, default=str))
+
+
+def fetch_updates(config: dict, since: datetime, incremental: bool = False) -> list[dict]:
+    """Fetch mail received since `since`.
+
+    With incremental=True (the daily run) and a stored historyId, only the
+    messages added since that history point are listed; an expired historyId
+    falls back to the full paginated query. The new historyId is staged for
+    commit_cursors().
+    """
+    service = get_service("gmail", "v1")
+
+    gmail_cfg = config.get("gmail", {})
+    max_messages = gmail_cfg.get("max_results", 500)
     snippet_chars = get_limit(config, "gmail_snippet_chars")
     since_epoch = int(since.timestamp())
     # Exclude newsletters, social, and promotions
@@ -20,40 +164,56 @@ def fetch_updates(config: dict, since: datetime) -> list[dict]:
     updates = []
 
     try:
-        result = (
-            service.users()
-            .messages()
-            .list(userId="me", q=query, maxResults=max_results)
-            .execute()
-        )
+        message_ids, history_id = None, None
+        start_history_id = get_cursors("gmail").get("history_id") if incremental else None
+        if start_history_id:
+            try:
+                message_ids, history_id = _history_message_ids(service, start_history_id, max_messages)
+            except HttpError as e:
+                if e.resp.status != 404:
+                    raise
+                log.warning("[Gmail] historyId expired — falling back to a full listing")
+
+        if message_ids is None:
+            if incremental:
+                # Take the history point before listing so nothing slips between
+                history_id = service.users().getProfile(userId="me").execute().get("historyId")
+            message_ids = _list_message_ids(service, query, max_messages)
 
-        def handle_message(request_id, response, exception):
-            if exception or not response:
-                return
+        messages = _get_messages(service, message_ids)
+        resolved = []
+        for message_id in message_ids:
+            response = messages.get(message_id)
+            if not response:
+                continue
             headers = {
                 h["name"]: h["value"]
                 for h in response.get("payload", {}).get("headers", [])
             }
-            updates.append({
+            resolved.append((response, {
                 "source": "gmail",
                 "subject": headers.get("Subject", "(No subject)"),
                 "from": headers.get("From", ""),
                 "to": headers.get("To", ""),
                 "date": headers.get("Date", ""),
                 "snippet": response.get("snippet", "")[:snippet_chars],
-            })
+            }))
 
-        batch = service.new_batch_http_request(callback=handle_message)
-        for msg_ref in result.get("messages", []):
-            batch.add(
-                service.users().messages().get(
-                    userId="me",
-                    id=msg_ref["id"],
-                    format="metadata",
-                    metadataHeaders=["Subject", "From", "Date", "To"],
+        updates = [record for _, record in resolved]
+        if gmail_cfg.get("group_threads", False):
+            grouped = _group_threads(resolved, gmail_cfg.get("thread_snippets", 2))
+            if len(grouped) < len(updates):
+                before, after = _raw_bytes(updates), _raw_bytes(grouped)
+                budget = get_limit(config, "raw_data_max_bytes")
+                log.info(
+                    f"[Gmail] Grouped {len(updates)} messages into {len(grouped)} threads "
+                    f"({before:,} → {after:,} bytes; saved {(before - after) / budget:.0%} "
+                    f"of raw_data_max_bytes)"
                 )
-            )
-        batch.execute()
+            updates = grouped
+
+        if incremental and history_id:
+            stage_cursors("gmail", {"history_id": str(history_id)})
 
     except Exception as e:
         log.warning(f"[Gmail] Error: {e}")
@@ -1,15 +1,160 @@
+import json
 import logging
 from datetime import datetime, timezone, timedelta
-from auth.google_auth import get_google_credentials
-from googleapiclient.discovery import build
+from pathlib import Path
+
+from googleapiclient.errors import HttpError
+
+from src.google_client import get_service
 
 log = logging.getLogger("intel_brief")
 
+# Local mirror of the primary calendar, kept current with Calendar sync tokens:
+# one full sync over a fixed window (a week back to _SYNC_AHEAD_DAYS ahead),
+# then incremental diffs until Friday runs past the window's end. Events outside
+# the window are pruned. --prep, the brief and the HTML report's "next meeting"
+# all read from it.
+_STORE_PATH = Path.home() / ".config" / "intel-brief" / "calendar_events.json"
+_PAGE_SIZE = 250          # events.list maxResults (API max 2500)
+_SYNC_BACK_DAYS = 7       # the store keeps this much history (or back to `since`, if earlier)
+_SYNC_AHEAD_DAYS = 60     # a full sync reaches this far ahead (recurring series are expanded)
+_FRESH_SECONDS = 300      # a store synced this recently is served without an API call
 
-def fetch_updates(config: dict, since: datetime) -> list[dict]:
-    creds = get_google_credentials()
-    service = build("calendar", "v3", credentials=creds)
 
+def _to_record(event: dict) -> dict:
+    start = event.get("start", {})
+    end = event.get("end", {})
+    attendees = [
+        a.get("displayName") or a.get("email", "")
+        for a in event.get("attendees", [])
+        if not a.get("self")
+    ]
+    return {
+        "source": "google_cal",
+        "title": event.get("summary", "(No title)"),
+        "start": start.get("dateTime") or start.get("date", ""),
+        "end": end.get("dateTime") or end.get("date", ""),
+        "attendees": attendees,
+        "location": event.get("location", ""),
+        "description": (event.get("description") or "")[:500],
+        "organizer": (
+            event.get("organizer", {}).get("displayName")
+            or event.get("organizer", {}).get("email", "")
+        ),
+    }
+
+
+def _parse_time(value: str) -> datetime | None:
+    """Parse an event start/end: RFC 3339 dateTime or an all-day YYYY-MM-DD."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _covers(store: dict, start: datetime, end: datetime) -> bool:
+    """Whether the store's synced window spans [start, end]."""
+    try:
+        return (
+            datetime.fromisoformat(store["window_start"]) <= start
+            and datetime.fromisoformat(store["window_end"]) >= end
+        )
+    except (KeyError, ValueError):
+        return False
+
+
+def _load_store() -> dict:
+    try:
+        return json.loads(_STORE_PATH.read_text()) if _STORE_PATH.exists() else {}
+    except Exception:
+        return {}
+
+
+def _save_store(store: dict) -> None:
+    _STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    _STORE_PATH.write_text(json.dumps(store, indent=2))
+
+
+def _list_events(service, **params) -> tuple[list[dict], str | None]:
+    """All pages of events.list; returns (items, nextSyncToken)."""
+    items, page_token = [], None
+    while True:
+        result = (
+            service.events()
+            .list(calendarId="primary", singleEvents=True, maxResults=_PAGE_SIZE,
+                  pageToken=page_token, **params)
+            .execute()
+        )
+        items.extend(result.get("items", []))
+        page_token = result.get("nextPageToken")
+        if not page_token:
+            return items, result.get("nextSyncToken")
+
+
+def _sync(service, store: dict, window_start: datetime, until: datetime) -> dict:
+    """Bring the store up to date: an incremental diff when its sync token is
+    valid and its window spans [window_start, until], else a full sync from
+    window_start to _SYNC_AHEAD_DAYS ahead (or `until`, if later). Cancelled
+    events are dropped, and so are events outside the window."""
+    covered = bool(store.get("sync_token")) and _covers(store, window_start, until)
+    if covered:
+        try:
+            items, token = _list_events(service, syncToken=store["sync_token"])
+            events = dict(store.get("events", {}))
+            window_end = datetime.fromisoformat(store["window_end"])
+        except HttpError as e:
+            if e.resp.status != 410:
+                raise
+            log.info("[Calendar] Sync token expired — running a full sync")
+            covered = False
+    if not covered:
+        window_end = max(until, datetime.now(timezone.utc) + timedelta(days=_SYNC_AHEAD_DAYS))
+        items, token = _list_events(
+            service, timeMin=window_start.isoformat(), timeMax=window_end.isoformat(),
+        )
+        events = {}
+
+    for item in items:
+        if item.get("status") == "cancelled":
+            events.pop(item.get("id"), None)
+        else:
+            events[item["id"]] = _to_record(item)
+
+    def _in_window(record: dict) -> bool:
+        start = _parse_time(record.get("start", ""))
+        end = _parse_time(record.get("end", "")) or start
+        return not start or (end >= window_start and start < window_end)
+
+    return {
+        "window_start": window_start.isoformat(),
+        "window_end": window_end.isoformat(),
+        "sync_token": token,
+        "events": {k: v for k, v in events.items() if _in_window(v)},
+        "synced_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def cached_events(time_min: datetime | None = None, time_max: datetime | None = None) -> list[dict]:
+    """Events from the local store overlapping [time_min, time_max], sorted by
+    start. Never calls the API."""
+    selected = []
+    for record in _load_store().get("events", {}).values():
+        start, end = _parse_time(record["start"]), _parse_time(record["end"])
+        if not start:
+            continue
+        if time_max and start >= time_max:
+            continue
+        if time_min and (end or start) <= time_min:
+            continue
+        selected.append((start, record))
+    selected.sort(key=lambda pair: pair[0])
+    return [record for _, record in selected]
+
+
+def fetch_updates(config: dict, since: datetime) -> list[dict]:
+    """Meetings from the start of today (or `since`, if earlier) through
+    Friday, served from the synced local store."""
     now = datetime.now(timezone.utc)
     weekday = now.weekday()  # Mon=0 … Fri=4, Sat=5, Sun=6
     days_to_friday = (4 - weekday) if weekday <= 4 else (4 + 7 - weekday)
@@ -19,48 +164,22 @@ def fetch_updates(config: dict, since: datetime) -> list[dict]:
 
     # Look back to start of today (or since, whichever is earlier) for past meeting context
     start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    time_min = min(since, start_of_today).isoformat()
-    time_max = friday_eod.isoformat()
-    max_results = config.get("google_cal", {}).get("max_results", 20)
-    updates = []
+    time_min = min(since, start_of_today)
 
     try:
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
+        store = _load_store()
+        synced_at = store.get("synced_at")
+        fresh = (
+            synced_at
+            and (now - datetime.fromisoformat(synced_at)).total_seconds() < _FRESH_SECONDS
+            and _covers(store, time_min, friday_eod)
         )
-
-        for event in events_result.get("items", []):
-            start = event.get("start", {})
-            end = event.get("end", {})
-            attendees = [
-                a.get("displayName") or a.get("email", "")
-                for a in event.get("attendees", [])
-                if not a.get("self")
-            ]
-            updates.append({
-                "source": "google_cal",
-                "title": event.get("summary", "(No title)"),
-                "start": start.get("dateTime") or start.get("date", ""),
-                "end": end.get("dateTime") or end.get("date", ""),
-                "attendees": attendees,
-                "location": event.get("location", ""),
-                "description": (event.get("description") or "")[:500],
-                "organizer": (
-                    event.get("organizer", {}).get("displayName")
-                    or event.get("organizer", {}).get("email", "")
-                ),
-            })
-
+        if not fresh:
+            service = get_service("calendar", "v3")
+            window_start = min(time_min, start_of_today - timedelta(days=_SYNC_BACK_DAYS))
+            _save_store(_sync(service, store, window_start, friday_eod))
     except Exception as e:
         log.warning(f"[Calendar] Error: {e}")
+        return []
 
-    return updates
+    return cached_events(time_min, friday_eod)
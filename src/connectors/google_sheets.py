@@ -1,6 +1,114 @@
-from googleapiclient.discovery import build
+import hashlib
+import json
+import logging
+from pathlib import Path
 
-from auth.google_auth import get_google_credentials
+from googleapiclient.errors import HttpError
+
+from src.google_client import get_service
+
+log = logging.getLogger("intel_brief")
+
+# Per (sheet, gid): the tab name, the column positions of department/project/
+# status, and the last rows read with their content hash. A warm cache turns a
+# run into one values read over just those columns, and is only rewritten when
+# those rows or the layout changed; the rows are reused if that read fails.
+_CACHE_PATH = Path.home() / ".config" / "intel-brief" / "sheets_tracker_cache.json"
+_KEYWORDS = ("department", "project", "status")
+
+
+def _load_cache() -> dict:
+    try:
+        return json.loads(_CACHE_PATH.read_text()) if _CACHE_PATH.exists() else {}
+    except Exception:
+        return {}
+
+
+def _save_cache(cache: dict) -> None:
+    _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    _CACHE_PATH.write_text(json.dumps(cache, indent=2))
+
+
+def _col_letter(index: int) -> str:
+    """0 → A, 25 → Z, 26 → AA."""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def _quoted(tab_name: str) -> str:
+    return "'" + tab_name.replace("'", "''") + "'"
+
+
+def _resolve_tab(sheets_api, sheet_id: str, gid: int) -> str:
+    metadata = sheets_api.get(
+        spreadsheetId=sheet_id, fields="sheets.properties(sheetId,title)"
+    ).execute()
+    for sheet in metadata["sheets"]:
+        if sheet["properties"]["sheetId"] == gid:
+            return sheet["properties"]["title"]
+    raise ValueError(f"No sheet found with gid={gid} in spreadsheet {sheet_id}")
+
+
+def _find_columns(header: list[str]) -> list[int]:
+    """Index of the first header cell containing each of _KEYWORDS (case-insensitive)."""
+    lowered = [h.strip().lower() for h in header]
+    columns = []
+    for keyword in _KEYWORDS:
+        columns.append(next((i for i, h in enumerate(lowered) if keyword in h), -1))
+    if -1 in columns:
+        raise ValueError(
+            f"Could not find required columns in sheet header: {header}\n"
+            "Expected columns containing: 'department', 'project', 'status'"
+        )
+    return columns
+
+
+def _read_rows(sheets_api, sheet_id: str, tab_name: str, columns: list[int]) -> list[list[str]]:
+    """Rows (header included) of the span covering `columns`, e.g. 'Tab'!B:F."""
+    first, last = _col_letter(min(columns)), _col_letter(max(columns))
+    result = sheets_api.values().get(
+        spreadsheetId=sheet_id, range=f"{_quoted(tab_name)}!{first}:{last}"
+    ).execute()
+    return result.get("values", [])
+
+
+def _tracker_rows(sheets_api, sheet_id: str, gid: int, entry: dict) -> tuple[list[list[str]], list[int]]:
+    """Rows of the tracker and the department/project/status positions within
+    them, using (and refreshing) the cached tab name and column layout."""
+    for attempt in range(2):
+        fresh = attempt > 0
+        if fresh or "tab" not in entry:
+            entry.clear()
+            entry["tab"] = _resolve_tab(sheets_api, sheet_id, gid)
+        if "columns" not in entry:
+            header = sheets_api.values().get(
+                spreadsheetId=sheet_id, range=f"{_quoted(entry['tab'])}!1:1"
+            ).execute().get("values", [[]])
+            entry["columns"] = _find_columns(header[0] if header else [])
+
+        try:
+            rows = _read_rows(sheets_api, sheet_id, entry["tab"], entry["columns"])
+        except HttpError as e:
+            # 400 "Unable to parse range": the tab was renamed
+            if e.resp.status != 400 or fresh:
+                raise
+            continue
+        offset = min(entry["columns"])
+        positions = [c - offset for c in entry["columns"]]
+        if not rows:
+            return rows, positions
+        header = [h.strip().lower() for h in rows[0]]
+        if all(p < len(header) and k in header[p] for p, k in zip(positions, _KEYWORDS)):
+            return rows, positions
+        # Columns moved since they were cached: look the layout up again
+        if fresh:
+            _find_columns(rows[0])   # raises with the header it saw
+        entry.pop("columns")
+    raise ValueError(f"Could not read the project tracker in spreadsheet {sheet_id}")
 
 
 def fetch_projects(config: dict) -> list[dict]:
@@ -15,44 +123,33 @@ def fetch_projects(config: dict) -> list[dict]:
     departments = {d.lower() for d in tracker.get("departments", [])}
     exclude_statuses = {s.lower() for s in tracker.get("exclude_statuses", [])}
 
-    creds = get_google_credentials()
-    service = build("sheets", "v4", credentials=creds)
+    service = get_service("sheets", "v4")
     sheets_api = service.spreadsheets()
 
-    # Resolve tab name from GID
-    metadata = sheets_api.get(spreadsheetId=sheet_id).execute()
-    tab_name = None
-    for sheet in metadata["sheets"]:
-        if sheet["properties"]["sheetId"] == gid:
-            tab_name = sheet["properties"]["title"]
-            break
-    if tab_name is None:
-        raise ValueError(f"No sheet found with gid={gid} in spreadsheet {sheet_id}")
+    cache = _load_cache()
+    key = f"{sheet_id}:{gid}"
+    entry = {k: v for k, v in cache.get(key, {}).items() if k in ("tab", "columns")}
+    snapshot = cache.get(key, {})
+    try:
+        rows, positions = _tracker_rows(sheets_api, sheet_id, gid, entry)
+    except HttpError as e:
+        if "rows" not in snapshot:
+            raise
+        log.warning(f"[Sheets] Tracker read failed ({e}) — using the snapshot from the last run")
+        rows, positions = snapshot["rows"], snapshot["positions"]
+    else:
+        content_hash = hashlib.sha256(json.dumps(rows).encode()).hexdigest()
+        layout = {k: snapshot.get(k) for k in ("tab", "columns")}
+        if content_hash == snapshot.get("hash") and layout == entry:
+            log.info("[Sheets] Project tracker unchanged since the last read")
+        else:
+            cache[key] = {**entry, "rows": rows, "positions": positions, "hash": content_hash}
+            _save_cache(cache)
 
-    result = sheets_api.values().get(spreadsheetId=sheet_id, range=tab_name).execute()
-    rows = result.get("values", [])
     if not rows:
         return []
 
-    # Find column indices (case-insensitive substring match)
-    header = [h.strip().lower() for h in rows[0]]
-
-    def find_col(keyword: str) -> int:
-        for i, h in enumerate(header):
-            if keyword in h:
-                return i
-        return -1
-
-    dept_col = find_col("department")
-    project_col = find_col("project")
-    status_col = find_col("status")
-
-    if any(c == -1 for c in (dept_col, project_col, status_col)):
-        raise ValueError(
-            f"Could not find required columns in sheet header: {rows[0]}\n"
-            "Expected columns containing: 'department', 'project', 'status'"
-        )
-
+    dept_col, project_col, status_col = positions
     projects = []
     for row in rows[1:]:
         dept = row[dept_col].strip() if dept_col < len(row) else ""
@@ -1,14 +1,347 @@
+import json
 import logging
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator
+
+import requests
 from atlassian import Jira
 
 from src.config import get_limit
+from src.state import load_store, stage_store
 
 log = logging.getLogger("intel_brief")
 
+_PAGE_SIZE = 100          # issues per JQL page (Jira Cloud caps maxResults at 100)
+_PAGE_WORKERS = 4         # concurrent startAt pages on the offset fallback
+_COMMENT_WORKERS = 8
+# `comment` rides along in the search response; only issues whose embedded
+# comment list was truncated cost a separate comment request.
+_FIELDS = ["summary", "status", "assignee", "reporter", "priority", "updated", "labels", "comment"]
+
+
+def _search_issues(
+    jira: Jira, jql: str, max_issues: int, expand: str | None = None,
+) -> Iterator[dict]:
+    """Yield every issue matching `jql`, up to max_issues, with only _FIELDS.
+
+    Uses the token-paginated /search/jql endpoint; falls back to startAt
+    paging when the site does not offer it.
+    """
+    try:
+        page = jira.enhanced_jql(jql, fields=_FIELDS, limit=_PAGE_SIZE, expand=expand)
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code not in (404, 410):
+            raise
+        yield from _search_issues_offset(jira, jql, max_issues, expand)
+        return
+
+    seen = 0
+    while True:
+        for issue in page.get("issues", []):
+            if seen >= max_issues:
+                log.warning(f"[Jira] Stopped at {max_issues} issues (limits.jira_max_issues)")
+                return
+            seen += 1
+            yield issue
+        token = page.get("nextPageToken")
+        if not token or page.get("isLast"):
+            return
+        page = jira.enhanced_jql(
+            jql, fields=_FIELDS, nextPageToken=token, limit=_PAGE_SIZE, expand=expand,
+        )
+
+
+def _search_issues_offset(
+    jira: Jira, jql: str, max_issues: int, expand: str | None = None,
+) -> Iterator[dict]:
+    """startAt paging: the first page reports `total`, the remaining pages
+    are fetched concurrently and yielded in order."""
+    first = jira.jql(jql, fields=_FIELDS, start=0, limit=_PAGE_SIZE, expand=expand)
+    total = min(first.get("total", 0), max_issues)
+    yield from first.get("issues", [])[:total]
+
+    starts = range(_PAGE_SIZE, total, _PAGE_SIZE)
+    with ThreadPoolExecutor(max_workers=_PAGE_WORKERS) as executor:
+        pages = executor.map(
+            lambda start: jira.jql(jql, fields=_FIELDS, start=start, limit=_PAGE_SIZE, expand=expand),
+            starts,
+        )
+        for start, page in zip(starts, pages):
+            yield from page.get("issues", [])[:total - start]
+    if first.get("total", 0) > max_issues:
+        log.warning(f"[Jira] Stopped at {max_issues} issues (limits.jira_max_issues)")
+
+
+_ADF_BLOCKS = {"paragraph", "heading", "blockquote", "codeBlock", "listItem", "tableRow", "rule"}
+
+
+def _adf_text(node) -> str:
+    """Plain text of a comment body: REST v2 sends a string, v3 (the
+    /search/jql endpoint) an Atlassian Document Format tree."""
+    if isinstance(node, str):
+        return node
+    if isinstance(node, list):
+        return "".join(_adf_text(n) for n in node)
+    if not isinstance(node, dict):
+        return ""
+    kind = node.get("type")
+    if kind == "text":
+        return node.get("text", "")
+    if kind == "hardBreak":
+        return "\n"
+    if kind in ("mention", "emoji", "date", "status", "inlineCard"):
+        attrs = node.get("attrs", {})
+        return str(attrs.get("text") or attrs.get("shortName") or attrs.get("url") or "")
+    text = _adf_text(node.get("content", []))
+    return text + "\n" if kind in _ADF_BLOCKS else text
+
+
+def _comment_record(c: dict) -> dict:
+    return {
+        "id": c.get("id", ""),
+        "author": c.get("author", {}).get("displayName", ""),
+        "body": _adf_text(c.get("body", "")).strip()[:500],
+        "updated": c.get("updated", c.get("created", "")),
+    }
+
+
+def _fetch_recent_comments(jira: Jira, key: str, depth: int) -> tuple[int, list[dict]]:
+    """Return (total comment count, last `depth` comments oldest-first)."""
+    data = jira.get(
+        f"{jira.resource_url('issue')}/{key}/comment",
+        params={"orderBy": "-created", "maxResults": depth},
+    ) or {}
+    comments = [_comment_record(c) for c in reversed(data.get("comments", []))]
+    return data.get("total", len(comments)), comments
+
+
+def _load_comments(jira: Jira, issues: list[dict], depth: int) -> dict[str, tuple[int, list[dict]]]:
+    """(comment total, last `depth` comments) per issue key, read from the
+    search response. Jira embeds comments oldest-first and may cut the list
+    short; only those issues get a request for their newest comments."""
+    result, truncated = {}, []
+    for issue in issues:
+        key = issue.get("key")
+        field = issue.get("fields", {}).get("comment") or {}
+        comments = field.get("comments", [])
+        total = field.get("total", len(comments))
+        if total > len(comments):
+            truncated.append(key)
+        else:
+            result[key] = total, [_comment_record(c) for c in comments[-depth:]] if depth else []
+
+    def _get(key):
+        try:
+            return key, _fetch_recent_comments(jira, key, depth)
+        except Exception as e:
+            log.warning(f"[Jira] Could not load comments for {key}: {e}")
+            return key, None
+
+    if truncated:
+        with ThreadPoolExecutor(max_workers=_COMMENT_WORKERS) as executor:
+            result.update((k, v) for k, v in executor.map(_get, truncated) if v is not None)
+    return result
+
+
+# Last-reported snapshot of each issue, staged with the cursors and committed
+# once the brief is written; issues not seen for _SNAPSHOT_DAYS are dropped.
+_SNAPSHOT_PATH = Path.home() / ".config" / "intel-brief" / "jira_snapshots.json"
+_SNAPSHOT_DAYS = 30
+
+
+def _snapshot(fields: dict, assignee: str, comment_total: int | None, comments: list[dict]) -> dict:
+    """The fields diffed between runs for one issue."""
+    return {
+        "status": (fields.get("status") or {}).get("name", ""),
+        "assignee": assignee,
+        "priority": (fields.get("priority") or {}).get("name", ""),
+        "labels": sorted(fields.get("labels", [])),
+        "comment_total": comment_total,
+        "comment_ids": [c.get("id", "") for c in comments],
+    }
+
+
+def _diff_snapshot(prev: dict, snap: dict, new_comments: list[dict]) -> list[str]:
+    """Field-level changes, e.g. "status: In Progress → Blocked", "+2 comments by Ann"."""
+    changes = [
+        f"{field}: {prev.get(field) or 'None'} → {snap[field] or 'None'}"
+        for field in ("status", "assignee", "priority")
+        if prev.get(field) != snap[field]
+    ]
+    added = sorted(set(snap["labels"]) - set(prev.get("labels", [])))
+    removed = sorted(set(prev.get("labels", [])) - set(snap["labels"]))
+    if added:
+        changes.append("labels: +" + ", +".join(added))
+    if removed:
+        changes.append("labels: -" + ", -".join(removed))
+
+    if snap["comment_total"] is not None and prev.get("comment_total") is not None:
+        count = snap["comment_total"] - prev["comment_total"]
+    else:
+        count = len(new_comments)
+    if count > 0:
+        authors = sorted({c["author"] for c in new_comments if c["author"]})
+        by = f" by {', '.join(authors)}" if authors else ""
+        changes.append(f"+{count} comment{'s' if count != 1 else ''}{by}")
+    return changes
+
+
+# Event log built from changelogs on the daily run: transitions, reassignments,
+# priority/label changes and new comments, plus each issue's latest fields.
+# `covered_since` marks the start of the unbroken stretch the log covers.
+_EVENT_LOG_PATH = Path.home() / ".config" / "intel-brief" / "jira_events.json"
+_EVENT_LOG_DAYS = 14
+_TRACKED_FIELDS = {
+    "status": "transition",
+    "assignee": "reassigned",
+    "priority": "priority",
+    "labels": "labels",
+}
 
-def fetch_updates(config: dict, since: datetime) -> list[dict]:
+
+def _parse_ts(value: str) -> datetime | None:
+    """Parse a Jira timestamp (2026-04-29T10:00:00.000+0000)."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+    except (TypeError, ValueError):
+        return None
+
+
+def _issue_events(issue: dict, comments: list[dict], since: datetime) -> list[dict]:
+    """Changelog items and comments on one issue at or after `since`."""
+    key = issue.get("key")
+    events = []
+    for history in issue.get("changelog", {}).get("histories", []):
+        at = _parse_ts(history.get("created", ""))
+        if not at or at < since:
+            continue
+        author = (history.get("author") or {}).get("displayName", "")
+        for item in history.get("items", []):
+            kind = _TRACKED_FIELDS.get(item.get("field"))
+            if kind:
+                events.append({
+                    "id": f"h{history.get('id')}:{item.get('field')}",
+                    "key": key,
+                    "at": history["created"],
+                    "kind": kind,
+                    "author": author,
+                    "from": item.get("fromString") or "",
+                    "to": item.get("toString") or "",
+                })
+    for c in comments:
+        at = _parse_ts(c.get("updated", ""))
+        if c.get("id") and at and at >= since:
+            events.append({
+                "id": f"c{c['id']}",
+                "key": key,
+                "at": c["updated"],
+                "kind": "comment",
+                "author": c.get("author", ""),
+                "text": c.get("body", ""),
+            })
+    return events
+
+
+def _load_event_log() -> dict:
+    try:
+        return json.loads(_EVENT_LOG_PATH.read_text()) if _EVENT_LOG_PATH.exists() else {}
+    except Exception:
+        return {}
+
+
+def _append_events(
+    issues: dict[str, dict], events: list[dict], since: datetime, synced_at: datetime,
+    max_age_days: int = _EVENT_LOG_DAYS,
+) -> None:
+    """Merge one sync into the event log. Events are deduped by ID, so
+    re-syncing an overlapping window is harmless; a window that starts after
+    the previous sync leaves a gap, and coverage restarts at `since`."""
+    data = _load_event_log()
+    synced_until = datetime.fromisoformat(data["synced_until"]) if data.get("synced_until") else None
+    if synced_until is None or since > synced_until:
+        data["covered_since"] = since.isoformat()
+
+    cutoff = synced_at - timedelta(days=max_age_days)
+    by_id = {e["id"]: e for e in data.get("events", [])}
+    by_id.update((e["id"], e) for e in events)
+    data["events"] = sorted(
+        (e for e in by_id.values() if (_parse_ts(e["at"]) or synced_at) >= cutoff),
+        key=lambda e: e["at"],
+    )
+    data["issues"] = {
+        k: v for k, v in {**data.get("issues", {}), **issues}.items()
+        if (_parse_ts(v.get("updated", "")) or synced_at) >= cutoff
+    }
+    data["synced_until"] = synced_at.isoformat()
+    covered = datetime.fromisoformat(data["covered_since"])
+    data["covered_since"] = max(covered, cutoff).isoformat()
+
+    _EVENT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+    _EVENT_LOG_PATH.write_text(json.dumps(data, indent=2))
+
+
+def _describe_event(event: dict) -> str:
+    day = event["at"][:10]
+    by = f" ({event['author']})" if event.get("author") else ""
+    if event["kind"] == "comment":
+        return f"{day} comment{by}"
+    field = "status" if event["kind"] == "transition" else (
+        "assignee" if event["kind"] == "reassigned" else event["kind"]
+    )
+    return f"{day} {field}: {event['from'] or 'None'} → {event['to'] or 'None'}{by}"
+
+
+def updates_from_log(since: datetime) -> list[dict] | None:
+    """Rebuild a `fetch_updates(config, since)`-style list from the local
+    event log, or None when the log does not cover `since` (caller should
+    query Jira instead). Each issue carries its `events` in the window and
+    the comments made in it."""
+    data = _load_event_log()
+    if not data.get("covered_since"):
+        return None
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if datetime.fromisoformat(data["covered_since"]) > since:
+        return None
+
+    events_by_key: dict[str, list[dict]] = {}
+    for event in data.get("events", []):
+        at = _parse_ts(event["at"])
+        if at and at >= since:
+            events_by_key.setdefault(event["key"], []).append(event)
+
+    updates = []
+    for key, issue in data.get("issues", {}).items():
+        events = events_by_key.get(key, [])
+        updated = _parse_ts(issue.get("updated", ""))
+        if not events and not (updated and updated >= since):
+            continue
+        updates.append({
+            **issue,
+            "source": "jira",
+            "key": key,
+            "events": [_describe_event(e) for e in events],
+            "recent_comments": [
+                {"author": e["author"], "body": e["text"], "updated": e["at"]}
+                for e in events if e["kind"] == "comment"
+            ],
+        })
+    updates.sort(key=lambda u: u.get("updated", ""), reverse=True)
+    return updates
+
+
+def fetch_updates(config: dict, since: datetime, incremental: bool = False) -> list[dict]:
+    """Fetch issues updated since `since`.
+
+    With incremental=True (the daily run), each issue is diffed against the
+    snapshot committed by the previous run. Issues seen before then carry
+    `changes` and only their new comments, and the new snapshots are staged
+    for commit_cursors(). The changelog entries in the window are also
+    appended to the event log that updates_from_log() reads.
+    """
     jira = Jira(
         url=os.environ["ATLASSIAN_BASE_URL"],
         username=os.environ["ATLASSIAN_EMAIL"],
@@ -16,50 +349,76 @@ def fetch_updates(config: dict, since: datetime) -> list[dict]:
         cloud=True,
     )
 
+    aware_since = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+    if incremental:
+        # Start where the previous sync stopped: `since` is stamped at the end
+        # of the last run, after this connector's sync, and the gap between
+        # the two would restart the event log's coverage every day.
+        synced_until = _load_event_log().get("synced_until")
+        if synced_until:
+            aware_since = min(aware_since, datetime.fromisoformat(synced_until))
+
     projects = config.get("jira", {}).get("projects", [])
-    since_str = since.strftime("%Y-%m-%d %H:%M")
+    since_str = aware_since.strftime("%Y-%m-%d %H:%M")
     project_list = ", ".join(f'"{p}"' for p in projects)
     jql = f'project in ({project_list}) AND updated >= "{since_str}" ORDER BY updated DESC'
     comment_depth = get_limit(config, "jira_comment_depth")
+    max_issues = get_limit(config, "jira_max_issues")
+    snapshots = load_store(_SNAPSHOT_PATH) if incremental else {}
+    staged = {}
+    logged_issues, events = {}, []
     updates = []
 
     try:
-        results = jira.jql(
-            jql,
-            limit=100,
-            fields="summary,status,assignee,reporter,comment,priority,updated,labels",
-        )
+        synced_at = datetime.now(timezone.utc)
+        expand = "changelog" if incremental else None
+        issues = list(_search_issues(jira, jql, max_issues, expand))
+        comments = _load_comments(jira, issues, comment_depth)
 
-        for issue in results.get("issues", []):
+        for issue in issues:
+            key = issue.get("key")
             fields = issue.get("fields", {})
             assignee = fields.get("assignee")
             assignee_name = assignee.get("displayName", "Unassigned") if assignee else "Unassigned"
+            comment_total, recent = comments.get(key, (None, []))
+            snap = _snapshot(fields, assignee_name, comment_total, recent)
 
-            comments = fields.get("comment", {}).get("comments", [])
-            recent_comments = [
-                {
-                    "author": c.get("author", {}).get("displayName", ""),
-                    "body": c.get("body", "")[:500],
-                    "updated": c.get("updated", c.get("created", "")),
-                }
-                for c in comments[-comment_depth:]
-            ]
-
-            updates.append({
+            record = {
                 "source": "jira",
-                "key": issue.get("key"),
+                "key": key,
                 "summary": fields.get("summary", ""),
-                "status": fields.get("status", {}).get("name", ""),
-                "priority": fields.get("priority", {}).get("name", ""),
+                "status": snap["status"],
+                "priority": snap["priority"],
                 "assignee": assignee_name,
-                "reporter": fields.get("reporter", {}).get("displayName", ""),
+                "reporter": (fields.get("reporter") or {}).get("displayName", ""),
                 "updated": fields.get("updated", ""),
                 "labels": fields.get("labels", []),
-                "url": f"{os.environ['ATLASSIAN_BASE_URL'].rstrip('/')}/browse/{issue.get('key')}",
-                "recent_comments": recent_comments,
-            })
+                "url": f"{os.environ['ATLASSIAN_BASE_URL'].rstrip('/')}/browse/{key}",
+                # recent_comments holds only new ones for issues seen before
+                "comment_total": comment_total,
+            }
+            if incremental:
+                logged_issues[key] = dict(record)
+                events.extend(_issue_events(issue, recent, aware_since))
+            prev = snapshots.get(key)
+            if prev:
+                seen_ids = set(prev.get("comment_ids", []))
+                recent = [c for c in recent if c.get("id") not in seen_ids]
+                record.pop("reporter")
+                record["changes"] = _diff_snapshot(prev, snap, recent)
+                if prev.get("status") != snap["status"]:
+                    record["previous_status"] = prev.get("status", "")
+            record["recent_comments"] = [
+                {k: v for k, v in c.items() if k != "id"} for c in recent
+            ]
+            updates.append(record)
+            if comment_total is not None:
+                staged[key] = {**snap, "seen_at": synced_at.isoformat()}
 
     except Exception as e:
         raise RuntimeError(f"Jira fetch failed: {e}") from e
 
+    if incremental:
+        stage_store(_SNAPSHOT_PATH, staged, _SNAPSHOT_DAYS)
+        _append_events(logged_issues, events, aware_since, synced_at)
     return updates
@@ -1,11 +1,19 @@
 """News connector — RSS regulatory feeds, NewsAPI, and SEC EDGAR 8-K filings."""
 import logging
 import os
-from datetime import datetime, timezone
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
+from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import urlsplit
 
 import feedparser
-import requests
+
+from src.http_client import Fetched, conditional_fetch, get_session, pop_validator_stats
+from src.state import load_store, stage_store
 
 log = logging.getLogger("intel_brief")
 
@@ -40,49 +48,52 @@ def _parse_date(entry) -> datetime | None:
     return None
 
 
-def _fetch_rss(name: str, url: str, since: datetime) -> list[dict]:
-    try:
-        feed = feedparser.parse(url)
-        items = []
-        for entry in feed.entries:
-            pub = _parse_date(entry)
-            if pub and pub < since:
-                continue
-            items.append({
-                "source": name,
-                "title": entry.get("title", "").strip(),
-                "summary": entry.get("summary", entry.get("description", "")).strip()[:400],
-                "url": entry.get("link", ""),
-                "published_at": pub.isoformat() if pub else None,
-                "type": "regulatory",
-            })
-        return items
-    except Exception as e:
-        log.warning(f"[News] RSS fetch failed for {name}: {e}")
-        return []
+_FEED_TIMEOUT = 10            # connect / per-read timeout for one feed
+_FEED_TOTAL_TIMEOUT = 20      # whole download of one feed (news.feed_timeout)
+_FEED_MAX_BYTES = 2_000_000   # body cap per feed (news.feed_max_bytes)
+_FEED_WORKERS = 16
+_DEADLINE_HEADROOM = 5        # seconds over feed_timeout for retries and queueing
 
+# URL and title keys of stories already in a brief, staged with the cursors and
+# committed once the brief is written; keys not seen for news.seen_ttl_days are dropped.
+_SEEN_PATH = Path.home() / ".config" / "intel-brief" / "news_seen.json"
+_SEEN_DAYS = 7
+_NEAR_DUPLICATE = 0.8         # Jaccard of title words at or above this is the same story
+_STOPWORDS = frozenset("a an and as at by for from in is its of on the to with".split())
 
-def _fetch_edgar(ticker: str, since: datetime) -> list[dict]:
-    try:
-        url = _EDGAR_URL.format(ticker=ticker)
-        feed = feedparser.parse(url)
-        items = []
-        for entry in feed.entries:
-            pub = _parse_date(entry)
-            if pub and pub < since:
-                continue
-            items.append({
-                "source": f"SEC EDGAR ({ticker})",
-                "title": entry.get("title", "").strip(),
-                "summary": entry.get("summary", "").strip()[:400],
-                "url": entry.get("link", ""),
-                "published_at": pub.isoformat() if pub else None,
-                "type": "sec_filing",
-            })
-        return items
-    except Exception as e:
-        log.warning(f"[News] EDGAR fetch failed for {ticker}: {e}")
-        return []
+
+def _parse_feed(content: bytes) -> list[dict]:
+    """feedparser entries reduced to what the brief uses (JSON-serialisable,
+    so an unchanged feed is served from the validator cache)."""
+    entries = []
+    for entry in feedparser.parse(content).entries:
+        pub = _parse_date(entry)
+        entries.append({
+            "title": entry.get("title", "").strip(),
+            "summary": entry.get("summary", entry.get("description", "")).strip()[:400],
+            "url": entry.get("link", ""),
+            "published_at": pub.isoformat() if pub else None,
+        })
+    return entries
+
+
+def _feed_items(label: str, fetched: Fetched, source: str, kind: str, since: datetime) -> list[dict]:
+    """Parse a downloaded feed (or reuse the cached parse on a 304) and keep
+    entries published since `since`. A truncated body is not cached, so the
+    next run downloads the feed again rather than revalidating a partial one."""
+    if fetched.not_modified:
+        entries = fetched.result
+    else:
+        entries = _parse_feed(fetched.content)
+        if fetched.truncated:
+            log.warning(f"[News] {label} feed exceeded {len(fetched.content):,} bytes — parsed the first part only")
+        else:
+            fetched.store(entries)
+    return [
+        {"source": source, **entry, "type": kind}
+        for entry in entries
+        if not entry["published_at"] or datetime.fromisoformat(entry["published_at"]) >= since
+    ]
 
 
 def _fetch_newsapi(keywords: list[str], since: datetime) -> list[dict]:
@@ -91,7 +102,7 @@ def _fetch_newsapi(keywords: list[str], since: datetime) -> list[dict]:
         return []
     try:
         query = " OR ".join(f'"{k}"' if " " in k else k for k in keywords)
-        resp = requests.get(
+        resp = get_session().get(
             _NEWSAPI_URL,
             params={
                 "q": query,
@@ -120,30 +131,171 @@ def _fetch_newsapi(keywords: list[str], since: datetime) -> list[dict]:
         return []
 
 
-def fetch_updates(config: dict, since: datetime) -> list[dict]:
+def _url_key(url: str) -> str:
+    """Host + path, ignoring scheme, www., query string and trailing slash."""
+    parts = urlsplit(url)
+    host = parts.netloc.lower().removeprefix("www.")
+    return f"{host}{parts.path.rstrip('/')}" if host else ""
+
+
+def _title_key(title: str) -> str:
+    return " ".join(re.findall(r"[a-z0-9]+", title.lower()))
+
+
+def _title_words(title: str) -> set[str]:
+    """Words of a title, without stopwords and with runs of single letters
+    joined, so "U.S." and "US" match."""
+    words, letters = [], ""
+    for word in re.findall(r"[a-z0-9]+", title.lower()):
+        if len(word) == 1 and word.isalpha():
+            letters += word
+            continue
+        if letters:
+            words.append(letters)
+            letters = ""
+        words.append(word)
+    if letters:
+        words.append(letters)
+    return {w for w in words if w not in _STOPWORDS}
+
+
+def _is_near_duplicate(a: set[str], b: set[str]) -> bool:
+    return bool(a and b) and len(a & b) / len(a | b) >= _NEAR_DUPLICATE
+
+
+def _clusters(items: list[dict]) -> list[dict]:
+    """Merge items that share a URL or a near-identical title into one record
+    (the first seen) carrying source_count and, when merged, the other sources.
+
+    Only news articles are matched on title. Regulatory releases and SEC
+    filings are matched on URL only: their titles are formulaic ("Agencies
+    announce enforcement action against ...", "8-K - AFFIRM HOLDINGS") and
+    differ only in the name that matters.
+    """
+    clusters: list[tuple[dict, set[str], set[str]]] = []   # (record, url keys, title words)
+    for item in items:
+        url_key = _url_key(item.get("url", ""))
+        words = _title_words(item["title"]) if item["type"] == "news" else set()
+        for record, urls, cluster_words in clusters:
+            if (url_key and url_key in urls) or _is_near_duplicate(words, cluster_words):
+                record["source_count"] += 1
+                sources = record.setdefault("sources", [record["source"]])
+                if item["source"] not in sources:
+                    sources.append(item["source"])
+                urls.add(url_key)
+                break
+        else:
+            clusters.append(({**item, "source_count": 1}, {url_key} - {""}, words))
+    return [record for record, _, _ in clusters]
+
+
+def _drop_seen(records: list[dict], seen: set[str]) -> list[dict]:
+    """Records whose URL or (near-)title isn't in the cross-run seen index."""
+    seen_titles = [_title_words(key[2:]) for key in seen if key.startswith("t:")]
+    fresh = []
+    for record in records:
+        if f"u:{_url_key(record.get('url', ''))}" in seen:
+            continue
+        if record["type"] == "news":
+            words = _title_words(record["title"])
+            if any(_is_near_duplicate(words, w) for w in seen_titles):
+                continue
+        fresh.append(record)
+    return fresh
+
+
+def _seen_keys(record: dict) -> list[str]:
+    keys = [f"u:{_url_key(record.get('url', ''))}"]
+    if record["type"] == "news":
+        keys.append(f"t:{_title_key(record['title'])}")
+    return [k for k in keys if len(k) > 2]
+
+
+def fetch_updates(config: dict, since: datetime, incremental: bool = False) -> list[dict]:
+    """Fetch every feed and NewsAPI concurrently.
+
+    Each feed download is bounded by news.feed_timeout and news.feed_max_bytes;
+    parsing happens on this thread as downloads complete, so the fetch threads
+    only do I/O. A feed that fails or is still running at the deadline is
+    logged and skipped, and never holds up the run.
+
+    The same story from several outlets is returned once with a source_count.
+    With incremental=True (the daily run), stories already reported within
+    news.seen_ttl_days are dropped and the seen keys are staged for
+    commit_cursors().
+    """
     news_cfg = config.get("news", {})
     if not news_cfg.get("enabled", True):
         return []
 
-    results = []
-
-    # Regulatory RSS feeds
-    for name, url in _REGULATORY_FEEDS:
-        results.extend(_fetch_rss(name, url, since))
+    feed_timeout = news_cfg.get("feed_timeout", _FEED_TOTAL_TIMEOUT)
+    max_bytes = news_cfg.get("feed_max_bytes", _FEED_MAX_BYTES)
 
-    # Custom RSS feeds from config
-    for feed in news_cfg.get("rss_feeds", []):
-        results.extend(_fetch_rss(feed["name"], feed["url"], since))
+    # (label, url, source, type) — regulatory feeds, custom feeds, SEC EDGAR 8-K filings
+    feeds = [(name, url, name, "regulatory") for name, url in _REGULATORY_FEEDS]
+    feeds += [(f["name"], f["url"], f["name"], "regulatory") for f in news_cfg.get("rss_feeds", [])]
+    feeds += [
+        (f"EDGAR {ticker}", _EDGAR_URL.format(ticker=ticker), f"SEC EDGAR ({ticker})", "sec_filing")
+        for ticker in news_cfg.get("edgar_tickers", ["AFRM", "SQ", "PYPL"])
+    ]
 
-    # SEC EDGAR 8-K filings
-    for ticker in news_cfg.get("edgar_tickers", ["AFRM", "SQ", "PYPL"]):
-        results.extend(_fetch_edgar(ticker, since))
-
-    # NewsAPI
     keywords = news_cfg.get("keywords", [
         "Affirm", "Afterpay", "Klarna", "BNPL",
         "buy now pay later", "consumer credit", "fintech regulation",
     ])
-    results.extend(_fetch_newsapi(keywords, since))
 
-    return results
+    executor = ThreadPoolExecutor(max_workers=min(_FEED_WORKERS, len(feeds) + 1))
+    futures = {
+        executor.submit(
+            conditional_fetch, "news", url,
+            timeout=_FEED_TIMEOUT, max_bytes=max_bytes, total_timeout=feed_timeout,
+        ): i
+        for i, (_, url, _, _) in enumerate(feeds)
+    }
+    newsapi = executor.submit(_fetch_newsapi, keywords, since)
+    deadline = time.monotonic() + feed_timeout + _DEADLINE_HEADROOM
+
+    by_feed: dict[int, list[dict]] = {}
+    try:
+        for future in as_completed(futures, timeout=deadline - time.monotonic()):
+            i = futures[future]
+            label, _, source, kind = feeds[i]
+            try:
+                by_feed[i] = _feed_items(label, future.result(), source, kind, since)
+            except Exception as e:
+                log.warning(f"[News] {label} fetch failed: {e}")
+    except FuturesTimeout:
+        for future, i in futures.items():
+            if not future.done():
+                log.warning(f"[News] {feeds[i][0]} still loading after {feed_timeout}s — skipped")
+
+    results = [item for i in range(len(feeds)) for item in by_feed.get(i, [])]
+    try:
+        results.extend(newsapi.result(timeout=max(0, deadline - time.monotonic())))
+    except FuturesTimeout:
+        log.warning(f"[News] NewsAPI still loading after {feed_timeout}s — skipped")
+    finally:
+        # Don't wait on stragglers; their own timeouts end them in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    stats = pop_validator_stats("news")
+    log.info(f"[News] Feeds: {stats['hits']} unchanged (304), {stats['misses']} downloaded")
+
+    records = _clusters(results)
+    if len(records) < len(results):
+        log.info(f"[News] Merged {len(results)} items into {len(records)} stories")
+    if incremental:
+        now = datetime.now(timezone.utc)
+        ttl_days = news_cfg.get("seen_ttl_days", _SEEN_DAYS)
+        cutoff = (now - timedelta(days=ttl_days)).isoformat()
+        seen = {k for k, v in load_store(_SEEN_PATH).items() if v.get("seen_at", "") >= cutoff}
+        fresh = _drop_seen(records, seen)
+        if len(fresh) < len(records):
+            log.info(f"[News] Skipped {len(records) - len(fresh)} stories reported on an earlier run")
+        stage_store(
+            _SEEN_PATH,
+            {key: {"seen_at": now.isoformat()} for record in fresh for key in _seen_keys(record)},
+            ttl_days,
+        )
+        records = fresh
+    return records
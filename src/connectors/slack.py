@@ -1,17 +1,187 @@
 import json
 import logging
 import os
-from datetime import datetime
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterator
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
 
+from src.connectors.base import SlackUpdate
+from src.state import get_cursors, stage_cursors
+
 log = logging.getLogger("intel_brief")
 
 # Cache persisted between runs to avoid re-fetching channel list and user ID
 _CACHE_PATH = Path.home() / ".config" / "intel-brief" / "slack_channel_cache.json"
+# Workspace user directory (ID → display name), rebuilt from users.list once per TTL
+_USER_DIRECTORY_PATH = _CACHE_PATH.parent / "slack_user_directory.json"
+# Thread replies keyed by "<channel>:<thread_ts>", valid while latest_reply is unchanged
+_THREAD_CACHE_PATH = _CACHE_PATH.parent / "slack_thread_cache.json"
+_THREAD_CACHE_DAYS = 14
+
+_PAGE_SIZE = 200          # conversations.history page size (Slack max is 999; 200 is recommended)
+_SEARCH_PAGE_SIZE = 100   # search.messages page size
+_STREAM_BUFFER = 500      # records buffered per in-flight conversation before its worker blocks
+_DONE = object()          # end-of-conversation marker on a worker's queue
+
+
+# Slack Web API rate-limit tiers, in requests per minute, for the methods we call.
+# https://api.slack.com/docs/rate-limits — Tier 2 ≈ 20/min, Tier 3 ≈ 50/min, Tier 4 ≈ 100/min.
+_METHOD_RATE_LIMITS = {
+    "conversations_list": 20,
+    "search_messages": 20,
+    "users_list": 20,
+    "conversations_history": 50,
+    "conversations_replies": 50,
+    "users_info": 100,
+}
+
+
+class _RateLimiter:
+    """Per-method token bucket shared by all worker threads.
+
+    Each bucket holds one minute's worth of tokens, so short bursts go through
+    immediately and sustained load is paced to the method's tier instead of
+    leaning on RateLimitErrorRetryHandler to absorb 429s.
+    """
+
+    def __init__(self, limits: dict[str, int]):
+        self._limits = limits
+        self._tokens = {m: float(n) for m, n in limits.items()}
+        self._updated = {m: time.monotonic() for m in limits}
+        self._lock = threading.Lock()
+
+    def acquire(self, method: str) -> None:
+        per_minute = self._limits.get(method)
+        if not per_minute:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated[method]
+                self._updated[method] = now
+                self._tokens[method] = min(
+                    per_minute, self._tokens[method] + elapsed * per_minute / 60,
+                )
+                if self._tokens[method] >= 1:
+                    self._tokens[method] -= 1
+                    return
+                wait = (1 - self._tokens[method]) * 60 / per_minute
+            time.sleep(wait)
+
+
+class _ThrottledClient:
+    """Wraps a WebClient so every rate-limited method waits for a token first."""
+
+    def __init__(self, client: WebClient, limiter: _RateLimiter):
+        self._client = client
+        self._limiter = limiter
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if name not in _METHOD_RATE_LIMITS or not callable(attr):
+            return attr
+
+        def _call(*args, **kwargs):
+            self._limiter.acquire(name)
+            return attr(*args, **kwargs)
+        return _call
+
+
+def _display_name(user: dict, fallback: str) -> str:
+    return (
+        user.get("profile", {}).get("display_name")
+        or user.get("real_name")
+        or fallback
+    )
+
+
+class _UserDirectory:
+    """Thread-safe user ID → display name map, persisted between runs.
+
+    The whole workspace is loaded from paginated users.list at most once per
+    TTL; IDs that appear in between (new hires, external guests) are resolved
+    one at a time with users.info and folded into the saved directory, so name
+    resolution on the hot path is a plain dict lookup.
+    """
+
+    def __init__(self, names: dict[str, str] | None = None, fetched_at: str = ""):
+        self._names: dict[str, str] = dict(names or {})
+        self.fetched_at = fetched_at
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> str | None:
+        with self._lock:
+            return self._names.get(user_id)
+
+    def __setitem__(self, user_id: str, name: str) -> None:
+        with self._lock:
+            if self._names.get(user_id) != name:
+                self._names[user_id] = name
+                self._dirty = True
+
+    def is_stale(self, ttl_hours: float) -> bool:
+        try:
+            fetched = datetime.fromisoformat(self.fetched_at)
+        except ValueError:
+            return True
+        return datetime.now(timezone.utc) - fetched > timedelta(hours=ttl_hours)
+
+    def refresh(self, client: WebClient) -> None:
+        """Replace the directory with a full paginated users.list listing."""
+        names = {}
+        cursor = None
+        while True:
+            resp = client.users_list(limit=200, cursor=cursor)
+            for user in resp.get("members", []):
+                uid = user.get("id", "")
+                if uid:
+                    names[uid] = _display_name(user, uid)
+            cursor = resp.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+        with self._lock:
+            self._names = names
+            self.fetched_at = datetime.now(timezone.utc).isoformat()
+            self._dirty = True
+
+    @classmethod
+    def load(cls) -> "_UserDirectory":
+        try:
+            data = json.loads(_USER_DIRECTORY_PATH.read_text()) if _USER_DIRECTORY_PATH.exists() else {}
+        except Exception:
+            data = {}
+        return cls(data.get("users", {}), data.get("fetched_at", ""))
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"fetched_at": self.fetched_at, "users": dict(self._names)}
+            self._dirty = False
+        _USER_DIRECTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _USER_DIRECTORY_PATH.write_text(json.dumps(payload, indent=2))
+
+
+def _load_user_directory(client: WebClient, ttl_hours: float) -> _UserDirectory:
+    """Load the saved directory, rebuilding it from users.list once past its TTL."""
+    directory = _UserDirectory.load()
+    if directory.is_stale(ttl_hours):
+        try:
+            directory.refresh(client)
+        except SlackApiError as e:
+            # Keep the stale copy; misses still fall back to users.info
+            log.warning(f"[Slack] Could not refresh user directory: {e}")
+    return directory
 
 
 def _load_cache() -> dict:
@@ -54,18 +224,18 @@ def _find_channel_ids(client: WebClient, target_names: set) -> dict:
     return found
 
 
-def _get_username(client: WebClient, user_id: str, cache: dict) -> str:
-    """Look up a single user by ID, cached so each user is only fetched once."""
-    if user_id in cache:
-        return cache[user_id]
+def _get_username(client: WebClient, user_id: str, cache: _UserDirectory) -> str:
+    """Resolve a user ID from the directory, calling users.info only on a miss.
+
+    Two workers may race on the same unseen ID; both resolve the same name,
+    so the duplicate lookup is harmless and cheaper than serializing lookups.
+    """
+    name = cache.get(user_id)
+    if name is not None:
+        return name
     try:
         resp = client.users_info(user=user_id)
-        user = resp.get("user", {})
-        name = (
-            user.get("profile", {}).get("display_name")
-            or user.get("real_name")
-            or user_id
-        )
+        name = _display_name(resp.get("user", {}), user_id)
     except SlackApiError:
         name = user_id
     cache[user_id] = name
@@ -86,167 +256,479 @@ def _get_own_user_id(client: WebClient) -> str:
 
 def _fetch_thread_replies(
     client: WebClient, channel_id: str, msg_ts: str,
-    users_cache: dict, max_replies: int = 5,
+    users_cache: _UserDirectory, max_replies: int = 5,
 ) -> list[dict]:
-    """Fetch replies for a single thread, returning up to max_replies."""
-    try:
-        resp = client.conversations_replies(
-            channel=channel_id, ts=msg_ts, limit=max_replies + 1,
-        )
-        replies = []
-        for msg in resp.get("messages", [])[1:]:  # skip parent
-            if len(replies) >= max_replies:
-                break
-            user_id = msg.get("user", "")
-            replies.append({
-                "author": _get_username(client, user_id, users_cache) if user_id else "unknown",
-                "text": msg.get("text", "")[:500],
-            })
-        return replies
-    except SlackApiError as e:
-        log.warning(f"[Slack] Error fetching thread replies: {e}")
-        return []
+    """Fetch replies for a single thread, returning up to max_replies.
 
-
-def _fetch_mentions(
-    client: WebClient, user_id: str, since: datetime,
-    users_cache: dict, seen_ts: set, thread_reply_min: int = 3,
-) -> list[dict]:
-    """Fetch messages mentioning the authenticated user."""
-    since_ts = str(since.timestamp())
-    updates = []
-    try:
-        resp = client.search_messages(
-            query=f"<@{user_id}>",
-            sort="timestamp",
-            sort_dir="desc",
-            count=20,
+    Raises SlackApiError; _ThreadHydrator handles logging and fallback.
+    """
+    resp = client.conversations_replies(
+        channel=channel_id, ts=msg_ts, limit=max_replies + 1,
+    )
+    replies = []
+    for msg in resp.get("messages", [])[1:]:  # skip parent
+        if len(replies) >= max_replies:
+            break
+        user_id = msg.get("user", "")
+        replies.append({
+            "author": _get_username(client, user_id, users_cache) if user_id else "unknown",
+            "text": msg.get("text", "")[:500],
+        })
+    return replies
+
+
+class _ThreadHydrator:
+    """Fetches thread replies once per (channel, thread_ts) on its own pool.
+
+    Streams hand over thread anchors as soon as they see them and keep going;
+    the replies are resolved when the record is yielded. A thread that shows
+    up in a channel and again in the mention search shares one request, and a
+    thread whose latest_reply matches the on-disk cache is not fetched at all.
+    """
+
+    def __init__(self, client: WebClient, users_cache: _UserDirectory, executor: ThreadPoolExecutor):
+        self._client = client
+        self._users_cache = users_cache
+        self._executor = executor
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._cache = self._load()
+        self._dirty = False
+        self.hits = 0
+        self.fetches = 0
+
+    @staticmethod
+    def _load() -> dict:
+        try:
+            return json.loads(_THREAD_CACHE_PATH.read_text()) if _THREAD_CACHE_PATH.exists() else {}
+        except Exception:
+            return {}
+
+    def submit(self, channel_id: str, thread_ts: str, latest_reply: str = "") -> Future:
+        key = f"{channel_id}:{thread_ts}"
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            cached = self._cache.get(key)
+            future = Future()
+            if cached and latest_reply and cached.get("latest_reply") == latest_reply:
+                cached["seen_at"] = datetime.now(timezone.utc).isoformat()
+                self._dirty = True
+                self.hits += 1
+                future.set_result(cached["replies"])
+            else:
+                self.fetches += 1
+                self._executor.submit(self._fetch, key, channel_id, thread_ts, latest_reply, future)
+            self._inflight[key] = future
+            return future
+
+    def _fetch(self, key: str, channel_id: str, thread_ts: str, latest_reply: str, future: Future) -> None:
+        try:
+            replies = _fetch_thread_replies(self._client, channel_id, thread_ts, self._users_cache)
+        except SlackApiError as e:
+            log.warning(f"[Slack] Error fetching thread replies: {e}")
+            future.set_result([])
+            return
+        except Exception as e:
+            future.set_exception(e)
+            return
+        if latest_reply:
+            with self._lock:
+                self._cache[key] = {
+                    "latest_reply": latest_reply,
+                    "replies": replies,
+                    "seen_at": datetime.now(timezone.utc).isoformat(),
+                }
+                self._dirty = True
+        future.set_result(replies)
+
+    def save(self, max_age_days: int = _THREAD_CACHE_DAYS) -> None:
+        """Persist the cache, dropping threads not seen for max_age_days."""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).isoformat()
+        with self._lock:
+            kept = {k: v for k, v in self._cache.items() if v.get("seen_at", "") >= cutoff}
+            if not self._dirty and len(kept) == len(self._cache):
+                return
+            self._dirty = False
+        _THREAD_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _THREAD_CACHE_PATH.write_text(json.dumps(kept, indent=2))
+
+
+def _latest_ts(*timestamps: str) -> str:
+    """Return the newest of several Slack ts strings (empty strings ignored)."""
+    valid = [ts for ts in timestamps if ts]
+    return max(valid, key=float) if valid else ""
+
+
+def _to_update(
+    client: WebClient, msg: dict, label: str,
+    users_cache: _UserDirectory, thread_replies: list[dict],
+) -> SlackUpdate:
+    """Normalize a raw Slack message into the record shape the brief consumes."""
+    ts = msg.get("ts", "")
+    user_id = msg.get("user", "")
+    return {
+        "source": "slack",
+        "channel": label,
+        "author": _get_username(client, user_id, users_cache) if user_id else "unknown",
+        "text": msg.get("text", ""),
+        "timestamp": datetime.fromtimestamp(float(ts)).isoformat() if ts else "",
+        "thread_reply_count": msg.get("reply_count", 0),
+        "thread_replies": thread_replies,
+    }
+
+
+def _iter_history(client: WebClient, channel_id: str, oldest: str) -> Iterator[dict]:
+    """Yield every message newer than `oldest`, following next_cursor to the end.
+
+    Only one page (_PAGE_SIZE messages) is held at a time.
+    """
+    cursor = None
+    while True:
+        resp = client.conversations_history(
+            channel=channel_id, oldest=oldest, limit=_PAGE_SIZE, cursor=cursor,
         )
-        for match in resp.get("messages", {}).get("matches", []):
-            ts = match.get("ts", "")
-            # Skip messages already captured from monitored channels
-            if ts in seen_ts:
-                continue
-            # Skip messages older than since
-            try:
-                if float(ts) < float(since_ts):
-                    continue
-            except (ValueError, TypeError):
-                continue
+        yield from resp.get("messages", [])
+        cursor = resp.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
 
-            channel_info = match.get("channel", {})
-            channel_id = channel_info.get("id", "") if isinstance(channel_info, dict) else ""
-            channel_name = channel_info.get("name", "unknown") if isinstance(channel_info, dict) else "unknown"
-            author_id = match.get("user", match.get("username", ""))
-            reply_count = match.get("reply_count", 0)
-
-            # If the @mention itself sits inside a thread, fetch the thread context.
-            # Use thread_ts when present (mention is a reply); else ts (mention is the parent).
-            thread_replies = []
-            thread_anchor = match.get("thread_ts") or ts
-            if channel_id and (reply_count >= thread_reply_min or match.get("thread_ts")):
-                thread_replies = _fetch_thread_replies(
-                    client, channel_id, thread_anchor, users_cache,
-                )
 
-            updates.append({
-                "source": "slack",
-                "channel": f"@mention (#{channel_name})",
-                "author": _get_username(client, author_id, users_cache) if author_id else "unknown",
-                "text": match.get("text", ""),
-                "timestamp": datetime.fromtimestamp(float(ts)).isoformat() if ts else "",
-                "thread_reply_count": reply_count,
-                "thread_replies": thread_replies,
-            })
-    except SlackApiError as e:
-        log.warning(f"[Slack] Error fetching mentions: {e}")
-    return updates
+def _put(sink: queue.Queue, item, stop: threading.Event) -> bool:
+    """Block until `item` is queued, giving up once the consumer has gone away."""
+    while not stop.is_set():
+        try:
+            sink.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
 
 
-def _fetch_dms(
-    client: WebClient, since: datetime,
-    users_cache: dict, seen_ts: set, max_conversations: int = 20,
-    thread_reply_min: int = 3,
-) -> list[dict]:
-    """Fetch recent DM messages."""
-    since_ts = str(since.timestamp())
-    updates = []
-    try:
-        # List recent DM conversations
-        resp = client.conversations_list(
-            types="im,mpim",
-            limit=max_conversations,
-            exclude_archived=True,
-        )
-        for conv in resp.get("channels", []):
-            conv_id = conv.get("id", "")
-            # For IMs, resolve the other user's name
-            dm_user = conv.get("user", "")
-            try:
-                history = client.conversations_history(
-                    channel=conv_id, oldest=since_ts, limit=20,
-                )
-            except SlackApiError:
-                continue
+def _stream_conversation(
+    client: WebClient, conv_id: str, label: str, oldest: str,
+    users_cache: _UserDirectory, hydrator: _ThreadHydrator, thread_reply_min: int,
+    sink: queue.Queue, stop: threading.Event,
+) -> tuple[bool, str]:
+    """Worker: push (ts, update, replies_future) for one conversation into `sink`.
 
-            messages = history.get("messages", [])
-            if not messages:
+    Returns (ok, latest_ts). Slack API errors are logged here and reported as
+    ok=False so the caller leaves that conversation's cursor alone; anything
+    else propagates through the future and fails the connector as before.
+    """
+    latest = ""
+    try:
+        for msg in _iter_history(client, conv_id, oldest):
+            ts = msg.get("ts", "")
+            latest = _latest_ts(latest, ts)
+            if msg.get("type") != "message" or msg.get("subtype"):
                 continue
 
-            dm_label = f"DM: {_get_username(client, dm_user, users_cache)}" if dm_user else "DM: group"
+            # Queue thread replies for active threads; resolved by the consumer
+            replies = None
+            if msg.get("reply_count", 0) >= thread_reply_min:
+                replies = hydrator.submit(conv_id, ts, msg.get("latest_reply", ""))
 
-            for msg in messages:
-                if msg.get("type") != "message" or msg.get("subtype"):
+            update = _to_update(client, msg, label, users_cache, [])
+            if not _put(sink, (ts, update, replies), stop):
+                return False, latest
+        return True, latest
+    except SlackApiError as e:
+        log.warning(f"[Slack] Error fetching {label}: {e}")
+        return False, latest
+    finally:
+        _put(sink, _DONE, stop)
+
+
+def _stream_conversations(
+    client: WebClient, jobs: list[tuple[str, str, str, str]],
+    users_cache: _UserDirectory, hydrator: _ThreadHydrator,
+    thread_reply_min: int, max_workers: int, completed: dict,
+) -> Iterator[tuple[str, SlackUpdate]]:
+    """Fetch conversations on a bounded pool, yielding (ts, update) in job order.
+
+    jobs is a list of (cursor_key, conversation_id, label, oldest). Each worker
+    streams into its own bounded queue and the consumer drains them in job
+    order, so output is deterministic while memory stays at roughly
+    max_workers × _STREAM_BUFFER records however long the window is.
+    completed[cursor_key] is set to the newest ts seen for every conversation
+    that finished cleanly.
+    """
+    stop = threading.Event()
+    sinks = [queue.Queue(maxsize=_STREAM_BUFFER) for _ in jobs]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            futures = [
+                executor.submit(
+                    _stream_conversation, client, conv_id, label, oldest,
+                    users_cache, hydrator, thread_reply_min, sink, stop,
+                )
+                for (_key, conv_id, label, oldest), sink in zip(jobs, sinks)
+            ]
+            for (key, *_), sink, future in zip(jobs, sinks, futures):
+                while (item := sink.get()) is not _DONE:
+                    ts, update, replies = item
+                    if replies is not None:
+                        update["thread_replies"] = replies.result()
+                    yield ts, update
+                ok, latest = future.result()
+                if ok:
+                    completed[key] = latest
+        finally:
+            stop.set()
+
+
+def _iter_mentions(
+    client: WebClient, user_id: str, since_ts: str,
+    users_cache: _UserDirectory, hydrator: _ThreadHydrator, seen_ts: set,
+    thread_reply_min: int, completed: dict,
+) -> Iterator[tuple[str, SlackUpdate]]:
+    """Yield (ts, update) for messages mentioning the authenticated user.
+
+    Search results come newest first, so paging stops at the first page that
+    reaches back past since_ts. Thread anchors for a whole page are handed to
+    the hydrator before any record is yielded, so they are fetched together.
+    completed["mentions"] is set to the newest match ts only when the search
+    ran to the end without an API error.
+    """
+    latest = ""
+    page = 1
+    try:
+        while True:
+            resp = client.search_messages(
+                query=f"<@{user_id}>",
+                sort="timestamp",
+                sort_dir="desc",
+                count=_SEARCH_PAGE_SIZE,
+                page=page,
+            )
+            messages = resp.get("messages", {})
+            reached_since = False
+            batch = []
+            for match in messages.get("matches", []):
+                ts = match.get("ts", "")
+                # Skip messages older than since (or already past the cursor)
+                try:
+                    if float(ts) <= float(since_ts):
+                        reached_since = True
+                        continue
+                except (ValueError, TypeError):
                     continue
-                ts = msg.get("ts", "")
+                latest = _latest_ts(latest, ts)
+                # Skip messages already captured from monitored channels
                 if ts in seen_ts:
                     continue
-                user_id = msg.get("user", "")
-                reply_count = msg.get("reply_count", 0)
 
-                thread_replies = []
-                if reply_count >= thread_reply_min:
-                    thread_replies = _fetch_thread_replies(
-                        client, conv_id, ts, users_cache,
-                    )
+                channel_info = match.get("channel", {})
+                channel_id = channel_info.get("id", "") if isinstance(channel_info, dict) else ""
+                channel_name = channel_info.get("name", "unknown") if isinstance(channel_info, dict) else "unknown"
+                reply_count = match.get("reply_count", 0)
 
-                updates.append({
+                # If the @mention itself sits inside a thread, fetch the thread context.
+                # Use thread_ts when present (mention is a reply); else ts (mention is the parent).
+                replies = None
+                thread_anchor = match.get("thread_ts") or ts
+                if channel_id and (reply_count >= thread_reply_min or match.get("thread_ts")):
+                    replies = hydrator.submit(channel_id, thread_anchor, match.get("latest_reply", ""))
+
+                author_id = match.get("user", match.get("username", ""))
+                batch.append((ts, {
                     "source": "slack",
-                    "channel": dm_label,
-                    "author": _get_username(client, user_id, users_cache) if user_id else "unknown",
-                    "text": msg.get("text", ""),
+                    "channel": f"@mention (#{channel_name})",
+                    "author": _get_username(client, author_id, users_cache) if author_id else "unknown",
+                    "text": match.get("text", ""),
                     "timestamp": datetime.fromtimestamp(float(ts)).isoformat() if ts else "",
                     "thread_reply_count": reply_count,
-                    "thread_replies": thread_replies,
-                })
+                    "thread_replies": [],
+                }, replies))
+
+            for ts, update, replies in batch:
+                if replies is not None:
+                    update["thread_replies"] = replies.result()
+                yield ts, update
+
+            pages = messages.get("paging", {}).get("pages", 1)
+            if reached_since or page >= pages:
+                break
+            page += 1
     except SlackApiError as e:
-        log.warning(f"[Slack] Error fetching DMs: {e}")
-    return updates
+        log.warning(f"[Slack] Error fetching mentions: {e}")
+        return
+    completed["mentions"] = latest
 
 
-def fetch_updates(config: dict, since: datetime) -> list[dict]:
-    client = WebClient(
-        token=os.environ["SLACK_USER_TOKEN"],
-        retry_handlers=[RateLimitErrorRetryHandler(max_retry_count=5)],
-    )
+def _list_dm_conversations(client: WebClient, max_conversations: int | None) -> list[dict]:
+    """Return IM/MPIM conversations, paginated, most recently updated first."""
+    conversations = []
+    cursor = None
+    while True:
+        resp = client.conversations_list(
+            types="im,mpim",
+            limit=200,
+            exclude_archived=True,
+            cursor=cursor,
+        )
+        conversations.extend(resp.get("channels", []))
+        cursor = resp.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            break
+    conversations.sort(key=lambda c: c.get("updated", 0), reverse=True)
+    return conversations[:max_conversations] if max_conversations else conversations
+
+
+# Volatile tokens stripped from alert text before clustering: Slack link markup,
+# ISO/epoch timestamps, UUIDs and hex IDs, then any remaining digit runs.
+_ALERT_NOISE_RES = [
+    re.compile(r"<[^>|]+\|([^>]+)>"),                       # <url|label> → label
+    re.compile(r"<https?://[^>]+>|https?://\S+"),
+    re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?([+-]\d{2}:?\d{2}|Z)?"),
+    re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.IGNORECASE),
+    re.compile(r"\b[0-9a-f]{12,}\b", re.IGNORECASE),
+    re.compile(r"\d+"),
+]
+_ALERT_SIGNATURE_CHARS = 160
+
+
+def _alert_signature(text: str) -> str:
+    """Reduce an alert message to its template: DAG/task names survive, with
+    digits, timestamps, IDs and links stripped so repeats collapse together."""
+    sig = _ALERT_NOISE_RES[0].sub(r"\1", text)
+    for pattern in _ALERT_NOISE_RES[1:]:
+        sig = pattern.sub("#", sig)
+    return " ".join(sig.lower().split())[:_ALERT_SIGNATURE_CHARS]
+
+
+def _collapse_alerts(records: Iterator[SlackUpdate], labels: set[str]) -> Iterator[SlackUpdate]:
+    """Fold repetitive messages in alert channels into one record per template.
+
+    Records from channels in `labels` are aggregated per (channel, signature)
+    into {alert_count, first_seen, last_seen} plus one sample; everything else,
+    including alert messages that started a thread with replies, passes through.
+    Only one aggregate per template is held, so memory stays bounded.
+    """
+    clusters: dict[str, dict] = {}
+    current = None
+    collapsed = 0
+    bytes_before = bytes_after = 0
+
+    def _flush():
+        nonlocal bytes_after
+        for cluster in clusters.values():
+            record = cluster["record"]
+            if cluster["count"] > 1:
+                record = {
+                    **record,
+                    "timestamp": cluster["last_seen"],
+                    "alert_count": cluster["count"],
+                    "first_seen": cluster["first_seen"],
+                    "last_seen": cluster["last_seen"],
+                }
+            bytes_after += len(json.dumps(record, indent=2, default=str))
+            yield record
+        clusters.clear()
+
+    for record in records:
+        label = record["channel"]
+        if label != current:
+            yield from _flush()
+            current = label
+        if label not in labels or record.get("thread_replies"):
+            yield record
+            continue
+
+        bytes_before += len(json.dumps(record, indent=2, default=str))
+        sig = _alert_signature(record.get("text", ""))
+        cluster = clusters.get(sig)
+        if cluster is None:
+            clusters[sig] = {
+                "record": record, "count": 1,
+                "first_seen": record["timestamp"], "last_seen": record["timestamp"],
+            }
+            continue
+        collapsed += 1
+        cluster["count"] += 1
+        cluster["first_seen"] = min(cluster["first_seen"], record["timestamp"])
+        cluster["last_seen"] = max(cluster["last_seen"], record["timestamp"])
+    yield from _flush()
+
+    if collapsed:
+        log.info(
+            f"[Slack] Collapsed {collapsed} repeat alert messages "
+            f"({bytes_before:,} → {bytes_after:,} bytes of raw data)"
+        )
+
+
+def iter_updates(config: dict, since: datetime, incremental: bool = False) -> Iterator[SlackUpdate]:
+    """Stream channel messages, @mentions and DMs since `since` as SlackUpdate records.
+
+    Every history is paginated to the end of the window and records are
+    yielded as soon as their conversation is reached, in a stable order
+    (channels in config order, then mentions, then DMs). Channels listed in
+    slack.alert_channels are collapsed to one record per alert template.
+
+    With incremental=True, each stream (channel, DM conversation, mention
+    search) starts from its own high-water mark when that is newer than
+    `since`, and the new marks for streams that completed are staged via
+    src.state.stage_cursors once the generator is exhausted. A failing
+    channel therefore never forces the others to be refetched on the next run.
+    """
     slack_cfg = config.get("slack", {})
+    client = _ThrottledClient(
+        WebClient(
+            token=os.environ["SLACK_USER_TOKEN"],
+            retry_handlers=[RateLimitErrorRetryHandler(max_retry_count=5)],
+        ),
+        _RateLimiter(_METHOD_RATE_LIMITS),
+    )
     channels = slack_cfg.get("channels", [])
-    thread_reply_min = slack_cfg.get("thread_reply_min", 3)
-    include_mentions = slack_cfg.get("include_mentions", False)
-    include_dms = slack_cfg.get("include_dms", False)
+    max_workers = max(1, slack_cfg.get("max_workers", 8))
     since_ts = str(since.timestamp())
-    updates = []
 
     try:
         channel_map = _find_channel_ids(client, set(channels))
     except SlackApiError as e:
         log.warning(f"[Slack] Could not fetch channel list: {e}")
-        return updates
+        return
 
-    users_cache = {}
+    users_cache = _load_user_directory(
+        client, slack_cfg.get("user_directory_ttl_hours", 24),
+    )
     seen_ts = set()  # Track message timestamps for deduplication
+    cursors = get_cursors("slack") if incremental else {}
+    completed = {}
+
+    # Thread replies get their own pool so conversation workers never wait on them
+    with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+        hydrator = _ThreadHydrator(client, users_cache, thread_pool)
+        yield from _collapse_alerts(
+            _iter_streams(
+                client, slack_cfg, channels, channel_map, since_ts, cursors,
+                users_cache, hydrator, seen_ts, completed,
+            ),
+            {f"#{name}" for name in slack_cfg.get("alert_channels", [])},
+        )
+        log.debug(f"[Slack] Threads: {hydrator.fetches} fetched, {hydrator.hits} from cache")
+        hydrator.save()
+
+    users_cache.save()
+    if incremental:
+        stage_cursors("slack", {key: ts for key, ts in completed.items() if ts})
+
+
+def _iter_streams(
+    client: WebClient, slack_cfg: dict, channels: list[str], channel_map: dict,
+    since_ts: str, cursors: dict, users_cache: _UserDirectory,
+    hydrator: _ThreadHydrator, seen_ts: set, completed: dict,
+) -> Iterator[SlackUpdate]:
+    """Yield channel, mention and DM records in that order (see iter_updates)."""
+    thread_reply_min = slack_cfg.get("thread_reply_min", 3)
+    include_mentions = slack_cfg.get("include_mentions", False)
+    include_dms = slack_cfg.get("include_dms", False)
+    max_workers = max(1, slack_cfg.get("max_workers", 8))
 
     # ── Channel messages ─────────────────────────────────────────────────
+    jobs = []
     for channel_name in channels:
         channel_id = channel_map.get(channel_name)
         if not channel_id:
@@ -255,60 +737,51 @@ def fetch_updates(config: dict, since: datetime) -> list[dict]:
             cache.pop(channel_name, None)
             _save_cache(cache)
             continue
+        key = f"channel:{channel_id}"
+        jobs.append((key, channel_id, f"#{channel_name}", _latest_ts(since_ts, cursors.get(key, ""))))
 
-        try:
-            response = client.conversations_history(
-                channel=channel_id, oldest=since_ts, limit=200,
-            )
-            for msg in response.get("messages", []):
-                if msg.get("type") != "message" or msg.get("subtype"):
-                    continue
-                ts = msg.get("ts", "")
-                seen_ts.add(ts)
-                user_id = msg.get("user", "")
-                reply_count = msg.get("reply_count", 0)
-
-                # Fetch thread replies for active threads
-                thread_replies = []
-                if reply_count >= thread_reply_min:
-                    thread_replies = _fetch_thread_replies(
-                        client, channel_id, ts, users_cache,
-                    )
-
-                updates.append({
-                    "source": "slack",
-                    "channel": f"#{channel_name}",
-                    "author": _get_username(client, user_id, users_cache) if user_id else "unknown",
-                    "text": msg.get("text", ""),
-                    "timestamp": datetime.fromtimestamp(float(ts)).isoformat() if ts else "",
-                    "thread_reply_count": reply_count,
-                    "thread_replies": thread_replies,
-                })
-        except SlackApiError as e:
-            log.warning(f"[Slack] Error fetching #{channel_name}: {e}")
+    for ts, update in _stream_conversations(
+        client, jobs, users_cache, hydrator, thread_reply_min, max_workers, completed,
+    ):
+        seen_ts.add(ts)
+        yield update
 
     # ── @Mentions ────────────────────────────────────────────────────────
     if include_mentions:
         try:
             own_id = _get_own_user_id(client)
             if own_id:
-                mention_updates = _fetch_mentions(
-                    client, own_id, since, users_cache, seen_ts,
-                    thread_reply_min=thread_reply_min,
-                )
-                updates.extend(mention_updates)
+                for ts, update in _iter_mentions(
+                    client, own_id, _latest_ts(since_ts, cursors.get("mentions", "")),
+                    users_cache, hydrator, seen_ts, thread_reply_min, completed,
+                ):
+                    seen_ts.add(ts)
+                    yield update
         except Exception as e:
             log.warning(f"[Slack] Error in mentions fetch: {e}")
 
     # ── DMs ──────────────────────────────────────────────────────────────
     if include_dms:
         try:
-            dm_updates = _fetch_dms(
-                client, since, users_cache, seen_ts,
-                thread_reply_min=thread_reply_min,
-            )
-            updates.extend(dm_updates)
+            dm_jobs = []
+            for conv in _list_dm_conversations(client, slack_cfg.get("dm_max_conversations")):
+                conv_id = conv.get("id", "")
+                # For IMs, resolve the other user's name
+                dm_user = conv.get("user", "")
+                label = f"DM: {_get_username(client, dm_user, users_cache)}" if dm_user else "DM: group"
+                key = f"dm:{conv_id}"
+                dm_jobs.append((key, conv_id, label, _latest_ts(since_ts, cursors.get(key, ""))))
+
+            for ts, update in _stream_conversations(
+                client, dm_jobs, users_cache, hydrator, thread_reply_min, max_workers, completed,
+            ):
+                if ts in seen_ts:
+                    continue
+                yield update
         except Exception as e:
             log.warning(f"[Slack] Error in DM fetch: {e}")
 
-    return updates
+
+def fetch_updates(config: dict, since: datetime, incremental: bool = False) -> list[dict]:
+    """Collect iter_updates() into a list; see iter_updates for the semantics."""
+    return list(iter_updates(config, since, incremental=incremental))
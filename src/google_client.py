@@ -0,0 +1,74 @@
+"""
+Process-wide Google API clients for the Gmail, Calendar and Sheets connectors.
+
+Credentials come from auth.google_auth, which keeps them in memory and
+refreshes them single-flight. Each discovery client is built once from the
+discovery documents bundled with google-api-python-client. Requests run on
+one authorized httplib2 connection per thread: httplib2 is not thread-safe
+and the same service object is shared across threads, but within a thread
+the connection (and its TLS session) is kept alive across calls.
+"""
+
+import logging
+import threading
+import time
+
+import google_auth_httplib2
+import httplib2
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest
+
+from auth.google_auth import get_google_credentials
+
+log = logging.getLogger("intel_brief")
+
+_services: dict[tuple[str, str], object] = {}
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _thread_http() -> google_auth_httplib2.AuthorizedHttp:
+    """This thread's authorized connection, rebuilt when the credentials change."""
+    creds = get_google_credentials()
+    authed = getattr(_local, "http", None)
+    if authed is None or authed.credentials is not creds:
+        authed = _local.http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+    return authed
+
+
+def _build_request(http, *args, **kwargs):
+    """requestBuilder: requests go out on the calling thread's connection."""
+    return HttpRequest(_thread_http(), *args, **kwargs)
+
+
+def get_service(name: str, version: str):
+    """Return the shared discovery client for `name`/`version`, building it once."""
+    key = (name, version)
+    service = _services.get(key)
+    if service is not None:
+        return service
+    creds = get_google_credentials()
+    with _lock:
+        if key not in _services:
+            started = time.perf_counter()
+            _services[key] = build(
+                name,
+                version,
+                credentials=creds,
+                requestBuilder=_build_request,
+                static_discovery=True,
+                cache_discovery=False,
+            )
+            log.debug(
+                f"[Google] Built {name} {version} client in "
+                f"{(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+        return _services[key]
+
+
+def reset_clients() -> None:
+    """Drop the cached clients and connections (used by tests and after re-auth)."""
+    global _local
+    with _lock:
+        _services.clear()
+        _local = threading.local()
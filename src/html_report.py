@@ -7,6 +7,7 @@ from datetime import datetime, timezone
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
+from src.connectors.google_cal import cached_events
 from src.dismissed import add_dismissed
 
 
@@ -315,8 +316,9 @@ def _make_handler(html_bytes: bytes, md_path: Path | None):
 
 
 def _extract_next_meeting(all_updates: dict, now: datetime) -> dict | None:
-    events = all_updates.get("google_cal", [])
     now_aware = now if now.tzinfo else now.replace(tzinfo=timezone.utc)
+    # --render-html has no fresh calendar fetch; fall back to the synced event store
+    events = all_updates.get("google_cal") or cached_events(now_aware)
     for event in events:
         start_str = event.get("start", "")
         if not start_str or "T" not in start_str:
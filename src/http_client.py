@@ -0,0 +1,231 @@
+"""
+Shared HTTP session for the requests-based connectors (Confluence, GitHub, News).
+
+One process-wide requests.Session with keep-alive connection pools per host,
+so a run performs a handful of TCP/TLS handshakes instead of one per request.
+Transient failures (429 and 5xx) are retried with exponential backoff, honouring
+Retry-After. Pool sizes and retry policy are tunable under `http:` in config.yaml.
+
+conditional_get() adds an on-disk HTTP validator cache (ETag / Last-Modified):
+unchanged resources come back as a bodyless 304 and the result parsed on the
+last 200 is reused, with hit/miss counts kept per connector.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import load_config
+
+log = logging.getLogger("intel_brief")
+
+HTTP_DEFAULTS = {
+    "pool_connections": 10,   # distinct hosts kept alive
+    "pool_maxsize": 16,       # concurrent connections per host
+    "retries": 3,
+    "backoff_factor": 0.5,    # 0.5s, 1s, 2s ...
+}
+
+USER_AGENT = "intel-brief/1.0 (+https://github.com/skibum227/intel-brief)"
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+_VALIDATOR_CACHE_PATH = Path.home() / ".config" / "intel-brief" / "http_validators.json"
+_VALIDATOR_CACHE_DAYS = 14    # entries not revalidated for this long are dropped
+_validator_lock = threading.Lock()
+_validator_stats: dict[str, dict[str, int]] = {}
+_READ_CHUNK = 64 * 1024
+
+
+def _build_session(settings: dict) -> requests.Session:
+    retry = Retry(
+        total=settings["retries"],
+        backoff_factor=settings["backoff_factor"],
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings["pool_connections"],
+        pool_maxsize=settings["pool_maxsize"],
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use.
+
+    Callers pass auth and headers per request, never on the session, so
+    connectors cannot leak credentials to each other.
+    """
+    global _session
+    if _session is not None:
+        return _session
+    with _session_lock:
+        if _session is None:
+            settings = {**HTTP_DEFAULTS, **(load_config().get("http") or {})}
+            _session = _build_session(settings)
+    return _session
+
+
+def reset_session() -> None:
+    """Close and drop the shared session (used by tests and long-lived processes)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def _load_validators() -> dict:
+    try:
+        if _VALIDATOR_CACHE_PATH.exists():
+            return json.loads(_VALIDATOR_CACHE_PATH.read_text())
+    except Exception:
+        pass
+    return {}
+
+
+def _save_validator(key: str, entry: dict) -> None:
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=_VALIDATOR_CACHE_DAYS)).isoformat()
+    with _validator_lock:
+        cache = _load_validators()
+        cache[key] = entry
+        kept = {k: v for k, v in cache.items() if v.get("seen_at", "") >= cutoff}
+        _VALIDATOR_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _VALIDATOR_CACHE_PATH.write_text(json.dumps(kept, indent=2))
+
+
+def _count(connector: str, outcome: str) -> None:
+    with _validator_lock:
+        stats = _validator_stats.setdefault(connector, {"hits": 0, "misses": 0})
+        stats[outcome] += 1
+
+
+class Fetched:
+    """Result of conditional_fetch(): either `not_modified` with the stored
+    `result`, or a fresh `content` body whose parsed result is handed back
+    with store() so the next request can revalidate."""
+
+    def __init__(self, key: str, not_modified: bool, result: Any = None,
+                 content: bytes = b"", headers: dict | None = None, truncated: bool = False):
+        self.key = key
+        self.not_modified = not_modified
+        self.result = result
+        self.content = content
+        self.headers = headers or {}
+        self.truncated = truncated
+
+    def store(self, result: Any) -> None:
+        """Cache `result` (JSON-serialisable) under this response's validators."""
+        etag, last_modified = self.headers.get("ETag"), self.headers.get("Last-Modified")
+        if etag or last_modified:
+            _save_validator(self.key, {
+                "etag": etag,
+                "last_modified": last_modified,
+                "result": result,
+                "seen_at": datetime.now(timezone.utc).isoformat(),
+            })
+
+
+def _read_body(resp: requests.Response, max_bytes: int | None, deadline: float | None) -> tuple[bytes, bool]:
+    """Read a streamed body, stopping at max_bytes (→ truncated=True) and
+    raising requests.Timeout once time.monotonic() passes `deadline`."""
+    chunks, size = [], 0
+    try:
+        for chunk in resp.iter_content(_READ_CHUNK):
+            chunks.append(chunk)
+            size += len(chunk)
+            if max_bytes and size >= max_bytes:
+                return b"".join(chunks)[:max_bytes], True
+            if deadline and time.monotonic() > deadline:
+                raise requests.Timeout(f"body not complete after {size:,} bytes")
+    finally:
+        resp.close()
+    return b"".join(chunks), False
+
+
+def conditional_fetch(
+    connector: str,
+    url: str,
+    params: dict | None = None,
+    headers: dict | None = None,
+    timeout: float = 10,
+    max_bytes: int | None = None,
+    total_timeout: float | None = None,
+) -> Fetched:
+    """GET `url`, revalidating against the validator cache; the body is not
+    parsed here, so callers can parse off the fetching thread.
+
+    `timeout` bounds connect and each read; `total_timeout` bounds the whole
+    download and `max_bytes` its size. HTTP errors raise as with
+    raise_for_status().
+    """
+    deadline = time.monotonic() + total_timeout if total_timeout else None
+    key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    with _validator_lock:
+        cached = _load_validators().get(key)
+    request_headers = dict(headers or {})
+    if cached:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    resp = get_session().get(url, params=params, headers=request_headers, timeout=timeout, stream=True)
+    if resp.status_code == 304 and cached:
+        resp.close()
+        _count(connector, "hits")
+        _save_validator(key, {**cached, "seen_at": datetime.now(timezone.utc).isoformat()})
+        return Fetched(key, True, result=cached["result"])
+
+    if not resp.ok:
+        resp.close()
+        resp.raise_for_status()
+    _count(connector, "misses")
+    content, truncated = _read_body(resp, max_bytes, deadline)
+    return Fetched(key, False, content=content, headers=dict(resp.headers), truncated=truncated)
+
+
+def conditional_get(
+    connector: str,
+    url: str,
+    parse: Callable[[bytes], Any],
+    params: dict | None = None,
+    headers: dict | None = None,
+    timeout: float = 10,
+) -> Any:
+    """GET `url`, revalidating against the validator cache.
+
+    On 200 the body goes through `parse` and the (JSON-serialisable) result
+    is stored with the response's ETag / Last-Modified. On 304 the stored
+    result is returned without a body download or `parse` call.
+    """
+    fetched = conditional_fetch(connector, url, params=params, headers=headers, timeout=timeout)
+    if fetched.not_modified:
+        return fetched.result
+    result = parse(fetched.content)
+    fetched.store(result)
+    return result
+
+
+def pop_validator_stats(connector: str) -> dict[str, int]:
+    """Return and reset `connector`'s {hits, misses} since the last call."""
+    with _validator_lock:
+        return _validator_stats.pop(connector, {"hits": 0, "misses": 0})
@@ -166,13 +166,18 @@ def load_recurring_unchecked_items(config: dict, days: int = 5, min_appearances:
 
 def extract_critical_team_signals(all_updates: dict) -> str:
     """Return ONLY critical team health signals: explicitly blocked tickets and
-    people with 3+ high-priority tickets that have received zero comments."""
+    people with 3+ high-priority tickets that have received zero comments.
+
+    A Jira record's comment_total counts all of its comments; recent_comments
+    may hold only those added since the last run.
+    """
     from collections import defaultdict
 
     signals = []
 
     # --- Explicitly blocked Jira tickets ---
     blocked = []
+    newly_blocked = []
     stale_by_person: dict[str, list] = defaultdict(list)
 
     for ticket in all_updates.get("jira", []):
@@ -182,14 +187,23 @@ def extract_critical_team_signals(all_updates: dict) -> str:
         labels = [l.lower() for l in ticket.get("labels", [])]
 
         if "blocked" in status or any("block" in l or "impediment" in l for l in labels):
-            blocked.append(
-                f"  - **{ticket.get('key','')}** ({assignee}): {ticket.get('summary','')[:70]}"
-            )
+            line = f"  - **{ticket.get('key','')}** ({assignee}): {ticket.get('summary','')[:70]}"
+            # previous_status is set by the Jira snapshot diff when the status moved
+            previous = ticket.get("previous_status")
+            if previous is not None and "blocked" not in previous.lower():
+                newly_blocked.append(f"{line} (was {previous or 'unset'})")
+            else:
+                blocked.append(line)
 
         if priority in ("highest", "high", "critical") and assignee not in ("Unassigned", ""):
-            if not ticket.get("recent_comments"):
+            total = ticket.get("comment_total")
+            if not (ticket.get("recent_comments") if total is None else total):
                 stale_by_person[assignee].append(ticket.get("key", ""))
 
+    if newly_blocked:
+        signals.append(
+            f"NEWLY BLOCKED SINCE LAST RUN ({len(newly_blocked)}):\n" + "\n".join(newly_blocked[:6])
+        )
     if blocked:
         signals.append(f"BLOCKED TICKETS ({len(blocked)}):\n" + "\n".join(blocked[:6]))
 
@@ -1,18 +1,34 @@
 """
 Tracks the last-run timestamp so each run only fetches new data.
 State is stored at ~/.config/intel-brief/state.json (outside the repo).
+
+Connectors that can resume per stream (e.g. one Slack channel) also keep
+high-water-mark cursors in ~/.config/intel-brief/cursors.json. Cursors are
+staged during the fetch and committed once the brief is written, so a stream
+that succeeded advances even when another connector failed.
+
+Larger per-item state that should advance on the same terms (Jira's
+last-reported issue snapshots) goes in its own keyed store file instead:
+stage_store() queues entries stamped with `seen_at`, and commit_cursors()
+merges them in and drops entries not seen for the store's max age.
 """
 
 import json
 import logging
 import os
 import tempfile
+import threading
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
 log = logging.getLogger("intel_brief")
 
 STATE_PATH = Path.home() / ".config" / "intel-brief" / "state.json"
+CURSORS_PATH = Path.home() / ".config" / "intel-brief" / "cursors.json"
+
+_pending_cursors: dict[str, dict[str, str]] = {}
+_pending_stores: dict[Path, tuple[dict[str, dict], int]] = {}
+_pending_lock = threading.Lock()
 
 
 def get_last_run(fallback_hours: int = 24) -> datetime:
@@ -46,8 +62,96 @@ def save_last_run():
         raise
 
 
+def _read_cursors() -> dict:
+    if CURSORS_PATH.exists():
+        try:
+            data = json.loads(CURSORS_PATH.read_text())
+            if isinstance(data, dict):
+                return data
+        except (ValueError, OSError):
+            pass
+    return {}
+
+
+def get_cursors(namespace: str) -> dict[str, str]:
+    """Return the committed {stream: cursor} map for a connector namespace."""
+    return dict(_read_cursors().get(namespace, {}))
+
+
+def stage_cursors(namespace: str, cursors: dict[str, str]) -> None:
+    """Queue cursor updates for commit_cursors(). Safe to call from worker threads."""
+    if not cursors:
+        return
+    with _pending_lock:
+        _pending_cursors.setdefault(namespace, {}).update(cursors)
+
+
+def load_store(path: Path) -> dict[str, dict]:
+    """Return the committed entries of a keyed store ({} if missing or corrupt)."""
+    if path.exists():
+        try:
+            data = json.loads(path.read_text())
+            if isinstance(data, dict):
+                return data
+        except (ValueError, OSError):
+            pass
+    return {}
+
+
+def stage_store(path: Path, entries: dict[str, dict], max_age_days: int) -> None:
+    """Queue store entries (each with an ISO `seen_at`) for commit_cursors(),
+    which drops entries not seen for max_age_days. Safe from worker threads."""
+    if not entries:
+        return
+    with _pending_lock:
+        pending, _ = _pending_stores.get(path, ({}, max_age_days))
+        pending.update(entries)
+        _pending_stores[path] = (pending, max_age_days)
+
+
+def _write_atomic(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        os.write(fd, json.dumps(data, indent=2).encode())
+        os.close(fd)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def commit_cursors() -> None:
+    """Merge staged cursors into cursors.json and staged store entries into
+    their files (atomic writes), then clear the queues."""
+    with _pending_lock:
+        pending = {ns: dict(c) for ns, c in _pending_cursors.items()}
+        stores = dict(_pending_stores)
+        _pending_cursors.clear()
+        _pending_stores.clear()
+
+    if pending:
+        data = _read_cursors()
+        for namespace, cursors in pending.items():
+            data.setdefault(namespace, {}).update(cursors)
+        _write_atomic(CURSORS_PATH, data)
+
+    for path, (entries, max_age_days) in stores.items():
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).isoformat()
+        merged = {**load_store(path), **entries}
+        _write_atomic(path, {k: v for k, v in merged.items() if v.get("seen_at", "") >= cutoff})
+
+
 def clear_last_run():
     """Delete the saved state, causing the next run to use the fallback lookback window."""
     if STATE_PATH.exists():
         STATE_PATH.unlink()
         print(f"  State cleared: {STATE_PATH}")
+    if CURSORS_PATH.exists():
+        CURSORS_PATH.unlink()
+        print(f"  Cursors cleared: {CURSORS_PATH}")
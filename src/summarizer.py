@@ -95,6 +95,14 @@ RAW DATA:
 {raw_data}"""
 
 
+def _source_bytes(all_updates: dict) -> dict[str, int]:
+    """Serialized size of each source's slice of RAW DATA, as sent to the model."""
+    return {
+        key: len(json.dumps(items, indent=2, default=str))
+        for key, items in all_updates.items()
+    }
+
+
 def summarize(
     all_updates: dict,
     lookback_hours: float,
@@ -114,6 +122,10 @@ def summarize(
 
     max_bytes = get_limit(config, "raw_data_max_bytes")
     raw_data = json.dumps(all_updates, indent=2, default=str)
+    log.debug(
+        f"Raw data {len(raw_data):,} / {max_bytes:,} bytes — "
+        + ", ".join(f"{k} {v:,}" for k, v in _source_bytes(all_updates).items())
+    )
     if len(raw_data) > max_bytes:
         log.warning(f"Raw data truncated from {len(raw_data):,} to {max_bytes:,} chars")
         raw_data = raw_data[:max_bytes] + "\n\n[... truncated due to volume ...]"
@@ -6,6 +6,8 @@ Shared test fixtures.
 - Blocks raw socket use during the test session: any test that forgets to
   mock requests will fail loudly instead of silently hitting prod APIs.
 - Resets the cached config between tests so config edits don't leak.
+- Redirects every on-disk state/cache file into tmp_path so tests never read
+  or clobber the developer's ~/.config/intel-brief.
 """
 import os
 import socket
@@ -58,3 +60,32 @@ def _block_socket(*args, **kwargs):
 def _no_network(monkeypatch):
     """Fail loudly if a test forgets to mock and tries a real socket connect."""
     monkeypatch.setattr(socket.socket, "connect", _block_socket)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_state_dir(tmp_path, monkeypatch):
+    """Point all persisted state at a per-test directory."""
+    import src.http_client as http_client
+    import src.state as state
+    import src.dismissed as dismissed
+    from src.connectors import confluence, google_cal, google_sheets, jira, news, slack
+
+    state_dir = tmp_path / "intel-brief"
+    monkeypatch.setattr(state, "STATE_PATH", state_dir / "state.json")
+    monkeypatch.setattr(state, "CURSORS_PATH", state_dir / "cursors.json")
+    monkeypatch.setattr(state, "_pending_cursors", {})
+    monkeypatch.setattr(state, "_pending_stores", {})
+    monkeypatch.setattr(dismissed, "DISMISSED_PATH", state_dir / "dismissed.json")
+    monkeypatch.setattr(slack, "_CACHE_PATH", state_dir / "slack_channel_cache.json")
+    monkeypatch.setattr(slack, "_USER_DIRECTORY_PATH", state_dir / "slack_user_directory.json")
+    monkeypatch.setattr(slack, "_THREAD_CACHE_PATH", state_dir / "slack_thread_cache.json")
+    monkeypatch.setattr(confluence, "_META_CACHE_PATH", state_dir / "confluence_cache.json")
+    monkeypatch.setattr(confluence, "_PAGE_STORE_PATH", state_dir / "confluence_pages.json")
+    monkeypatch.setattr(jira, "_EVENT_LOG_PATH", state_dir / "jira_events.json")
+    monkeypatch.setattr(jira, "_SNAPSHOT_PATH", state_dir / "jira_snapshots.json")
+    monkeypatch.setattr(news, "_SEEN_PATH", state_dir / "news_seen.json")
+    monkeypatch.setattr(google_cal, "_STORE_PATH", state_dir / "calendar_events.json")
+    monkeypatch.setattr(google_sheets, "_CACHE_PATH", state_dir / "sheets_tracker_cache.json")
+    monkeypatch.setattr(http_client, "_VALIDATOR_CACHE_PATH", state_dir / "http_validators.json")
+    monkeypatch.setattr(http_client, "_validator_stats", {})
+    return state_dir
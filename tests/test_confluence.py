@@ -5,7 +5,9 @@ Covers the recent CQL-search refactor + the existing project-tracker drilldown.
 All HTTP is mocked with `responses`; conftest blocks raw sockets so any
 unmocked call fails the test.
 """
+import json
 from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 import responses
@@ -45,6 +47,51 @@ def test_strip_html_collapses_whitespace():
     assert confluence._strip_html(html) == "line1 line2"
 
 
+def test_strip_html_decodes_entities():
+    assert confluence._strip_html("<p>R&amp;D &lt;3 caf&eacute;</p>") == "R&D <3 café"
+
+
+def test_strip_html_drops_script_style_and_macro_chrome():
+    html = (
+        "<style>.x{color:red}</style><script>alert(1)</script>"
+        '<div class="toc-macro"><ul><li>Intro</li></ul></div>'
+        "<ac:structured-macro><ac:parameter>x</ac:parameter></ac:structured-macro>"
+        "<p>Real text</p>"
+    )
+    assert confluence._strip_html(html) == "Real text"
+
+
+def test_strip_html_tolerates_markup_like_text():
+    html = (
+        "<SCRIPT>if (a<b) x()</SCRIPT><!-- <p>hidden</p> -->"
+        '<p>a < b<img src="x>y"/>c</p><P CLASS=\'toc-macro\'>no</P>end'
+    )
+    assert confluence._strip_html(html) == "a < b c end"
+
+
+def test_strip_html_keeps_table_rows_delimited():
+    html = (
+        "<p>Status</p><table><tr><th>Project</th><th>State</th></tr>"
+        "<tr><td>Ledger</td><td><b>On</b> track</td></tr></table><p>End</p>"
+    )
+    assert confluence._strip_html(html) == "Status Project | State; Ledger | On track; End"
+
+
+def test_strip_html_skip_first_table_only():
+    html = (
+        "<table><tr><td>meta<table><tr><td>inner</td></tr></table></td></tr></table>"
+        "<p>Body</p><table><tr><td>kept</td></tr></table>"
+    )
+    assert confluence._strip_html(html, skip_first_table=True) == "Body kept;"
+
+
+def test_strip_html_stops_at_budget():
+    html = "<p>" + "word " * 100_000 + "</p>"
+    out = confluence._strip_html(html, max_chars=50)
+    assert len(out) == 50
+    assert out.startswith("word word")
+
+
 # ── fetch_updates: CQL endpoint ──────────────────────────────────────────────
 
 @responses.activate
@@ -190,8 +237,9 @@ def test_fetch_updates_pagination_stops_when_short_page():
     since = datetime(2026, 4, 28, tzinfo=timezone.utc)
     out = confluence.fetch_updates(config, since)
     assert len(out) == 51
-    # Two paginated search calls, no third
-    search_calls = [c for c in responses.calls if "/content/search" in c.request.url]
+    # Two paginated space searches, no third
+    search_calls = [c for c in responses.calls
+                    if "/content/search" in c.request.url and "space" in c.request.url]
     assert len(search_calls) == 2
 
 
@@ -371,3 +419,377 @@ def test_project_updates_missing_parent_logs_and_skips(caplog):
     assert out == []
     assert any("No 'Project Tracking' page found in space MISSING" in r.getMessage()
                for r in caplog.records)
+
+
+# ── fetch_updates: expanded search (no N+1) ──────────────────────────────────
+
+def _expanded_page(pid, body="<p>x</p>"):
+    return {
+        "id": pid,
+        "title": f"P{pid}",
+        "version": {"when": "2026-04-29T12:00:00.000Z", "by": {"displayName": "X"}},
+        "body": {"view": {"value": body}},
+        "_links": {"webui": f"/p/{pid}"},
+    }
+
+
+def _listed(pid, number=1):
+    return {"id": pid, "version": {"when": "2026-04-29T12:00:00.000Z", "number": number}}
+
+
+def _register_search(*listings, bodies=None):
+    """Serve `listings` in order for the space query and `id in (...)`
+    body lookups from `bodies` ({page_id: page})."""
+    listings = list(listings)
+
+    def callback(request):
+        cql = parse_qs(urlparse(request.url).query).get("cql", [""])[0]
+        if cql.startswith("id in"):
+            ids = cql[cql.index("(") + 1:cql.index(")")].split(",")
+            results = [(bodies or {})[i] for i in ids if i in (bodies or {})]
+            return 200, {}, json.dumps({"results": results})
+        return 200, {}, json.dumps(listings.pop(0))
+
+    responses.add_callback(
+        responses.GET, f"{API_BASE}/rest/api/content/search", callback=callback,
+    )
+
+
+@responses.activate
+def test_fetch_updates_batches_body_lookup_without_detail_calls():
+    _register_cloud_id()
+    _register_search(
+        {"results": [_listed("1"), _listed("2")]},
+        bodies={"1": _expanded_page("1", "<p>one</p>"), "2": _expanded_page("2", "<p>two</p>")},
+    )
+    config = {"confluence": {"spaces": ["DE"]}}
+    out = confluence.fetch_updates(config, datetime(2026, 4, 28, tzinfo=timezone.utc))
+
+    assert [r["content"] for r in out] == ["one", "two"]
+    assert [r["author"] for r in out] == ["X", "X"]
+    assert len(responses.calls) == 3  # tenant_info + version listing + one body search
+    assert "expand=version" in responses.calls[1].request.url
+    assert "body.view" in responses.calls[2].request.url
+
+
+@responses.activate
+def test_fetch_updates_follows_next_link():
+    _register_cloud_id()
+    _register_search(
+        {"results": [_listed("1")], "_links": {"next": "/rest/api/content/search?cursor=abc"}},
+        {"results": [_listed("2")], "_links": {}},
+        bodies={"1": _expanded_page("1"), "2": _expanded_page("2")},
+    )
+    config = {"confluence": {"spaces": ["DE"]}}
+    out = confluence.fetch_updates(config, datetime(2026, 4, 28, tzinfo=timezone.utc))
+
+    assert [r["title"] for r in out] == ["P1", "P2"]
+    search_calls = [c for c in responses.calls if "/content/search" in c.request.url]
+    assert "cursor=abc" in search_calls[1].request.url
+
+
+def test_search_pages_stops_at_full_page_without_next_link_after_link_paging():
+    class _Resp:
+        def __init__(self, data):
+            self.data = data
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return self.data
+
+    full = [{"id": str(i)} for i in range(confluence._SEARCH_LIMIT)]
+    pages = iter([
+        {"results": full, "_links": {"next": "/rest/api/content/search?cursor=abc"}},
+        {"results": full, "_links": {}},
+    ])
+
+    class _Session:
+        calls = 0
+
+        def get(self, url, auth, params, timeout):
+            self.calls += 1
+            return _Resp(next(pages))
+
+    session = _Session()
+    out = list(confluence._search_pages(session, API_BASE, None, "type=page"))
+
+    assert len(out) == 2 * confluence._SEARCH_LIMIT
+    assert session.calls == 2
+
+
+@responses.activate
+def test_fetch_updates_detail_fallback_only_for_missing_bodies():
+    _register_cloud_id()
+    responses.add(
+        responses.GET,
+        f"{API_BASE}/rest/api/content/search",
+        json={"results": [
+            _expanded_page("1", "<p>inline</p>"),
+            {"id": "2", "version": {"when": "2026-04-29T12:00:00.000Z"}},
+        ]},
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        f"{API_BASE}/rest/api/content/2",
+        json=_expanded_page("2", "<p>fetched</p>"),
+        status=200,
+    )
+    config = {"confluence": {"spaces": ["DE"]}}
+    out = confluence.fetch_updates(config, datetime(2026, 4, 28, tzinfo=timezone.utc))
+
+    assert [r["content"] for r in out] == ["inline", "fetched"]
+    detail_calls = [c for c in responses.calls if "/content/search" not in c.request.url
+                    and "tenant_info" not in c.request.url]
+    assert len(detail_calls) == 1
+
+
+# ── Metadata cache: cloudId, Project Tracking IDs, child listings ────────────
+
+_DS_DEPTH0 = {
+    "google_sheets": {
+        "project_tracker": {
+            "confluence_spaces": [{"space": "DS", "nesting_depth": 0}]
+        }
+    }
+}
+
+
+def _register_project_tree(children_etag=None, children_status=200):
+    responses.add(
+        responses.GET,
+        f"{API_BASE}/rest/api/content",
+        json={"results": [{"id": "PARENT"}]},
+        status=200,
+    )
+    responses.add(
+        responses.GET,
+        f"{API_BASE}/rest/api/content/PARENT/child/page",
+        json={"results": [
+            {"id": "P", "title": "Page", "version": {"when": "2026-04-29T00:00:00Z", "number": 3}}
+        ]} if children_status == 200 else None,
+        status=children_status,
+        headers={"ETag": children_etag} if children_etag else None,
+    )
+    responses.add(
+        responses.GET,
+        f"{API_BASE}/rest/api/content/P",
+        json={
+            "id": "P", "title": "Page",
+            "version": {"when": "2026-04-29T00:00:00Z"},
+            "body": {"view": {"value": "<p>body</p>"}},
+            "_links": {"webui": "/p"},
+        },
+        status=200,
+    )
+
+
+@responses.activate
+def test_cloud_id_cached_across_calls():
+    _register_cloud_id()
+    responses.add(responses.GET, f"{API_BASE}/rest/api/content/search", json={"results": []})
+    config = {"confluence": {"spaces": ["DE"]}}
+    since = datetime(2026, 4, 28, tzinfo=timezone.utc)
+
+    confluence.fetch_updates(config, since)
+    confluence.fetch_updates(config, since)
+
+    tenant_calls = [c for c in responses.calls if "tenant_info" in c.request.url]
+    assert len(tenant_calls) == 1
+
+
+def _register_tree_check(modified):
+    responses.add(
+        responses.GET,
+        f"{API_BASE}/rest/api/content/search",
+        json={"results": [{"id": "P"}] if modified else []},
+    )
+
+
+@responses.activate
+def test_rerun_reuses_parent_id_and_revalidates_children():
+    _register_cloud_id()
+    _register_project_tree(children_etag='"v1"')
+    first = confluence.fetch_team_project_updates(_DS_DEPTH0)
+    assert first[0]["content"] == "body"
+
+    responses.reset()
+    # Second run: the tree changed, so drill down; children answer 304
+    _register_tree_check(modified=True)
+    _register_project_tree(children_status=304)
+    second = confluence.fetch_team_project_updates(_DS_DEPTH0)
+
+    assert second[0]["page_title"] == "Page"
+    urls = [c.request.url for c in responses.calls]
+    assert not any("tenant_info" in u for u in urls)
+    assert not any(u.startswith(f"{API_BASE}/rest/api/content?") for u in urls)
+    child_call = [c for c in responses.calls if "/child/page" in c.request.url][0]
+    assert child_call.request.headers["If-None-Match"] == '"v1"'
+    assert len(responses.calls) == 2  # tree check + child listing (304); body from the page store
+
+
+@responses.activate
+def test_unchanged_tree_reuses_resolved_page_in_one_call():
+    _register_cloud_id()
+    _register_project_tree()
+    config = {"google_sheets": {"project_tracker": {
+        "confluence_spaces": [{"space": "DS", "nesting_depth": 2}]
+    }}}
+    responses.add(
+        responses.GET, f"{API_BASE}/rest/api/content/P/child/page",
+        json={"results": [{"id": "P", "title": "Page", "version": {"when": "2026-04-29T00:00:00Z", "number": 3}}]},
+    )
+    first = confluence.fetch_team_project_updates(config)
+    assert first[0]["content"] == "body"
+
+    responses.reset()
+    _register_tree_check(modified=False)
+    second = confluence.fetch_team_project_updates(config)
+
+    assert second == first
+    assert len(responses.calls) == 1
+    assert "ancestor+%3D+PARENT" in responses.calls[0].request.url
+
+
+@responses.activate
+def test_stale_parent_id_is_looked_up_again():
+    confluence._set_meta("project_tracking", f"{API_BASE}|DS", "GONE")
+    _register_cloud_id()
+    responses.add(
+        responses.GET, f"{API_BASE}/rest/api/content/GONE/child/page", status=404,
+    )
+    _register_project_tree()
+
+    out = confluence.fetch_team_project_updates(_DS_DEPTH0)
+    assert out[0]["page_title"] == "Page"
+    assert confluence._get_meta("project_tracking", f"{API_BASE}|DS") == "PARENT"
+
+
+# ── Page store: versioned bodies and deltas ──────────────────────────────────
+
+@responses.activate
+def test_unchanged_version_costs_no_body_download():
+    _register_cloud_id()
+    _register_search(
+        {"results": [_listed("1", number=4)]},
+        {"results": [_listed("1", number=4)]},
+        bodies={"1": _expanded_page("1", "<p>stable text</p>")},
+    )
+    config = {"confluence": {"spaces": ["DE"]}}
+    since = datetime(2026, 4, 28, tzinfo=timezone.utc)
+    confluence.fetch_updates(config, since)
+    calls_after_first = len(responses.calls)
+
+    out = confluence.fetch_updates(config, since)
+
+    assert out[0]["content"] == "stable text"
+    assert len(responses.calls) - calls_after_first == 1  # version listing only
+
+
+@responses.activate
+def test_new_version_sends_only_delta_when_configured():
+    _register_cloud_id()
+    v1 = _expanded_page("1", "<p>Status: on track. Owner Alice.</p>")
+    v2 = _expanded_page("1", "<p>Status: blocked on vendor. Owner Alice.</p>")
+    v2["version"]["number"] = 2
+    config = {"confluence": {"spaces": ["DE"], "deltas_only": True}}
+    since = datetime(2026, 4, 28, tzinfo=timezone.utc)
+
+    _register_search({"results": [_listed("1", number=1)]}, bodies={"1": v1})
+    first = confluence.fetch_updates(config, since)
+    assert first[0]["content"] == "Status: on track. Owner Alice."
+
+    responses.reset()
+    _register_cloud_id()
+    _register_search({"results": [_listed("1", number=2)]}, bodies={"1": v2})
+    second = confluence.fetch_updates(config, since)
+
+    assert second[0]["content"] == "Status: blocked on vendor."
+    assert second[0]["changed_since_version"] == 1
+
+
+@responses.activate
+def test_deltas_only_bounds_the_stored_text():
+    _register_cloud_id()
+    page = _expanded_page("1", "<p>" + "word " * 5000 + "</p>")
+    _register_search({"results": [_listed("1", number=1)]}, bodies={"1": page})
+    config = {"confluence": {"spaces": ["DE"], "deltas_only": True},
+              "limits": {"confluence_delta_chars": 3000}}
+
+    confluence.fetch_updates(config, datetime(2026, 4, 28, tzinfo=timezone.utc))
+
+    assert len(confluence._load_page_store()["1"]["text"]) == 3000
+
+
+def test_store_entry_identical_text_has_no_delta():
+    prev = confluence._store_entry(None, 1, "same words")
+    entry = confluence._store_entry(prev, 2, "same words")
+    assert entry["delta"] == ""
+    assert entry["previous_version"] == 1
+
+
+# ── Concurrent spaces ────────────────────────────────────────────────────────
+
+@responses.activate
+def test_fetch_updates_spaces_keep_config_order_and_isolate_errors(caplog):
+    _register_cloud_id()
+    listings = {"A": [_listed("1")], "C": [_listed("3")]}
+    bodies = {"1": _expanded_page("1", "<p>a</p>"), "3": _expanded_page("3", "<p>c</p>")}
+
+    def callback(request):
+        cql = parse_qs(urlparse(request.url).query)["cql"][0]
+        if cql.startswith("id in"):
+            ids = cql[cql.index("(") + 1:cql.index(")")].split(",")
+            return 200, {}, json.dumps({"results": [bodies[i] for i in ids]})
+        space = cql.split('"')[1]
+        if space == "B":
+            return 500, {}, json.dumps({"message": "boom"})
+        return 200, {}, json.dumps({"results": listings[space]})
+
+    responses.add_callback(
+        responses.GET, f"{API_BASE}/rest/api/content/search", callback=callback,
+    )
+    config = {"confluence": {"spaces": ["C", "B", "A"]}}
+    out = confluence.fetch_updates(config, datetime(2026, 4, 28, tzinfo=timezone.utc))
+
+    assert [(r["space"], r["content"]) for r in out] == [("C", "c"), ("A", "a")]
+    assert any("Error fetching space B" in r.getMessage() for r in caplog.records)
+
+
+@responses.activate
+def test_project_updates_spaces_keep_config_order_and_isolate_errors(caplog):
+    _register_cloud_id()
+
+    def parent_callback(request):
+        space = parse_qs(urlparse(request.url).query)["spaceKey"][0]
+        if space == "BAD":
+            return 500, {}, json.dumps({"message": "boom"})
+        return 200, {}, json.dumps({"results": [{"id": f"PT-{space}"}]})
+
+    responses.add_callback(
+        responses.GET, f"{API_BASE}/rest/api/content", callback=parent_callback,
+    )
+    for space in ("DS", "DE"):
+        responses.add(
+            responses.GET,
+            f"{API_BASE}/rest/api/content/PT-{space}/child/page",
+            json={"results": [{"id": f"W-{space}", "title": "Week",
+                               "version": {"when": "2026-04-29T00:00:00Z", "number": 1}}]},
+        )
+        responses.add(
+            responses.GET,
+            f"{API_BASE}/rest/api/content/W-{space}",
+            json={"id": f"W-{space}", "version": {"number": 1},
+                  "body": {"view": {"value": f"<p>{space} body</p>"}},
+                  "_links": {"webui": f"/{space}"}},
+        )
+    config = {"google_sheets": {"project_tracker": {"confluence_spaces": [
+        {"space": "DE"}, {"space": "BAD"}, {"space": "DS"},
+    ]}}}
+
+    out = confluence.fetch_team_project_updates(config)
+
+    assert [r["content"] for r in out] == ["DE body", "DS body"]
+    assert any("Error fetching project updates for BAD" in r.getMessage() for r in caplog.records)
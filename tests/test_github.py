@@ -0,0 +1,120 @@
+"""
+Tests for src.connectors.github.
+
+All HTTP is mocked with `responses`; conftest blocks raw sockets so any
+unmocked call fails the test.
+"""
+import json
+from datetime import datetime, timezone
+
+import responses
+
+from src.connectors import github
+
+SINCE = datetime(2026, 4, 28, tzinfo=timezone.utc)
+CONFIG = {"github": {"include_pr_body": True, "repos": ["acme/api", "acme/web"]}}
+REST_CONFIG = {"github": {**CONFIG["github"], "use_graphql": False}}
+
+
+def _node(number, repo="api", reviews=()):
+    return {
+        "title": f"PR {number}",
+        "url": f"https://github.com/acme/{repo}/pull/{number}",
+        "number": number,
+        "createdAt": "2026-04-27T10:00:00Z",
+        "updatedAt": "2026-04-28T10:00:00Z",
+        "author": {"login": "ann"},
+        "repository": {"name": repo},
+        "body": "x" * 1000,
+        "reviews": {"nodes": [{"author": {"login": r}, "body": f"lgtm from {r}"} for r in reviews]},
+    }
+
+
+def _item(number, repo="api"):
+    return {
+        "title": f"PR {number}",
+        "html_url": f"https://github.com/acme/{repo}/pull/{number}",
+        "repository_url": f"https://api.github.com/repos/acme/{repo}",
+        "user": {"login": "ann"},
+        "created_at": "2026-04-27T10:00:00Z",
+        "updated_at": "2026-04-28T10:00:00Z",
+        "number": number,
+        "body": "body",
+    }
+
+
+@responses.activate
+def test_graphql_fetches_both_searches_in_one_request():
+    responses.add(
+        responses.POST,
+        github._GRAPHQL_URL,
+        json={"data": {
+            "review_requested": {"nodes": [_node(1, reviews=["raj", "li"])]},
+            "your_pr": {"nodes": [_node(2, repo="web"), {}]},
+        }},
+    )
+
+    out = github.fetch_updates(CONFIG, SINCE)
+
+    assert len(responses.calls) == 1
+    variables = json.loads(responses.calls[0].request.body)["variables"]
+    assert "repo:acme/api repo:acme/web" in variables["reviewRequested"]
+    assert "author:@me" in variables["yourPr"]
+    assert [(e["type"], e["number"], e["repo"]) for e in out] == [
+        ("review_requested", 1, "api"), ("your_pr", 2, "web"),
+    ]
+    assert out[0]["recent_reviews"] == [
+        {"reviewer": "raj", "body": "lgtm from raj"},
+        {"reviewer": "li", "body": "lgtm from li"},
+    ]
+    assert len(out[0]["body"]) == 500
+
+
+@responses.activate
+def test_graphql_errors_fall_back_to_rest():
+    responses.add(responses.POST, github._GRAPHQL_URL, json={"errors": [{"message": "rate limited"}]})
+    responses.add(responses.GET, github._SEARCH_URL, json={"items": [_item(7)]})
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/acme/api/pulls/7/reviews",
+        json=[{"user": {"login": "raj"}, "body": "nit"}],
+    )
+
+    out = github.fetch_updates(CONFIG, SINCE)
+
+    assert [e["type"] for e in out] == ["review_requested", "your_pr"]
+    assert out[0]["recent_reviews"] == [{"reviewer": "raj", "body": "nit"}]
+    assert "_repository_url" not in out[0]
+
+
+@responses.activate
+def test_rest_fetches_reviews_for_every_pr_in_search_order():
+    def search(request):
+        if "review-requested" in request.url:
+            return 200, {}, json.dumps({"items": [_item(n) for n in range(1, 6)]})
+        return 200, {}, json.dumps({"items": [_item(9, repo="web")]})
+
+    responses.add_callback(responses.GET, github._SEARCH_URL, callback=search)
+    for repo, number in [("api", n) for n in range(1, 6)] + [("web", 9)]:
+        responses.add(
+            responses.GET,
+            f"https://api.github.com/repos/acme/{repo}/pulls/{number}/reviews",
+            json=[{"user": {"login": f"r{number}"}, "body": ""}],
+        )
+
+    out = github.fetch_updates(REST_CONFIG, SINCE)
+
+    assert [e["number"] for e in out] == [1, 2, 3, 4, 5, 9]
+    assert [e["recent_reviews"][0]["reviewer"] for e in out] == ["r1", "r2", "r3", "r4", "r5", "r9"]
+    assert not any(c.request.method == "POST" for c in responses.calls)
+
+
+@responses.activate
+def test_without_bodies_no_reviews_are_fetched():
+    responses.add(responses.GET, github._SEARCH_URL, json={"items": [_item(1)]})
+    config = {"github": {"include_pr_body": False, "use_graphql": False}}
+
+    out = github.fetch_updates(config, SINCE)
+
+    assert "recent_reviews" not in out[0] and "body" not in out[0]
+    assert len(responses.calls) == 2
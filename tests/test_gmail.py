@@ -0,0 +1,209 @@
+"""
+Tests for src.connectors.gmail.
+
+The Gmail discovery client is replaced with an in-memory fake that mimics
+the users().messages()/history() request chain and batch requests, and
+records every call.
+"""
+from datetime import datetime, timezone
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from src import state
+from src.connectors import gmail
+
+SINCE = datetime(2026, 4, 28, tzinfo=timezone.utc)
+CONFIG = {"gmail": {"max_results": 500}}
+
+
+def _message(mid, labels=("INBOX",), thread=None, at=0, sender="ann@example.com"):
+    return {
+        "id": mid,
+        "threadId": thread or mid,
+        "internalDate": str(at),
+        "labelIds": list(labels),
+        "snippet": f"snippet {mid}",
+        "payload": {"headers": [
+            {"name": "Subject", "value": f"Subject {mid}"},
+            {"name": "From", "value": sender},
+            {"name": "To", "value": "JD <jd@example.com>"},
+            {"name": "Date", "value": f"day {at}"},
+        ]},
+    }
+
+
+class _Request:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self):
+        return self._fn()
+
+
+class _Batch:
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+
+class FakeGmail:
+    """Minimal stand-in for the Gmail v1 discovery client."""
+
+    def __init__(self, messages=None, history=None, history_id="900", page_size=500):
+        self.inbox = messages or []      # newest first, like messages.list
+        self.added = history             # messages reported by history.list; None → 404
+        self.history_id = history_id
+        self.page_size = page_size
+        self.calls = []
+        self.batch_sizes = []
+
+    # users() returns the fake itself; messages()/history() wrap it as resources
+    def users(self):
+        return self
+
+    def messages(self):
+        return _Messages(self)
+
+    def history(self):
+        return _History(self)
+
+    def getProfile(self, userId):
+        self.calls.append(("getProfile", None))
+        return _Request(lambda: {"historyId": self.history_id})
+
+    def new_batch_http_request(self, callback):
+        return _Batch(self, callback)
+
+
+class _Messages:
+    def __init__(self, fake):
+        self.fake = fake
+
+    def list(self, userId, q, maxResults, pageToken=None):
+        self.fake.calls.append(("messages.list", pageToken))
+        start = int(pageToken or 0)
+        size = min(maxResults, self.fake.page_size)
+        page = {"messages": [{"id": m["id"]} for m in self.fake.inbox[start:start + size]]}
+        if start + size < len(self.fake.inbox):
+            page["nextPageToken"] = str(start + size)
+        return _Request(lambda: page)
+
+    def get(self, userId, id, format, metadataHeaders):
+        by_id = {m["id"]: m for m in self.fake.inbox}
+        return _Request(lambda: by_id[id])
+
+
+class _History:
+    def __init__(self, fake):
+        self.fake = fake
+
+    def list(self, userId, startHistoryId, historyTypes, maxResults, pageToken=None):
+        self.fake.calls.append(("history.list", startHistoryId))
+
+        def run():
+            if self.fake.added is None:
+                raise HttpError(httplib2.Response({"status": 404}), b"expired")
+            return {
+                "history": [{"messagesAdded": [{"message": m}]} for m in self.fake.added],
+                "historyId": self.fake.history_id,
+            }
+        return _Request(run)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    service = FakeGmail()
+    monkeypatch.setattr(gmail, "get_service", lambda *a: service)
+    return service
+
+
+def test_full_listing_follows_next_page_token(fake):
+    fake.inbox = [_message(str(i)) for i in range(120)]
+    fake.page_size = 50
+
+    out = gmail.fetch_updates(CONFIG, SINCE)
+
+    assert len(out) == 120
+    assert out[0]["subject"] == "Subject 0"
+    assert [c for c in fake.calls if c[0] == "messages.list"] == [
+        ("messages.list", None), ("messages.list", "50"), ("messages.list", "100"),
+    ]
+
+
+def test_batches_hold_at_most_100_requests(fake):
+    fake.inbox = [_message(str(i)) for i in range(250)]
+
+    gmail.fetch_updates(CONFIG, SINCE)
+
+    assert fake.batch_sizes == [100, 100, 50]
+
+
+def test_first_incremental_run_lists_and_stages_history_id(fake):
+    fake.inbox = [_message("a")]
+
+    out = gmail.fetch_updates(CONFIG, SINCE, incremental=True)
+    state.commit_cursors()
+
+    assert [u["subject"] for u in out] == ["Subject a"]
+    assert state.get_cursors("gmail") == {"history_id": "900"}
+
+
+def test_incremental_run_uses_history_and_skips_promotions(fake):
+    state.stage_cursors("gmail", {"history_id": "500"})
+    state.commit_cursors()
+    fake.inbox = [_message("new"), _message("promo", ["CATEGORY_PROMOTIONS"]), _message("old")]
+    fake.added = [fake.inbox[1], fake.inbox[0]]
+    fake.history_id = "950"
+
+    out = gmail.fetch_updates(CONFIG, SINCE, incremental=True)
+    state.commit_cursors()
+
+    assert [u["subject"] for u in out] == ["Subject new"]
+    assert ("messages.list", None) not in fake.calls
+    assert state.get_cursors("gmail") == {"history_id": "950"}
+
+
+def test_expired_history_id_falls_back_to_full_listing(fake):
+    state.stage_cursors("gmail", {"history_id": "1"})
+    state.commit_cursors()
+    fake.inbox = [_message("a"), _message("b")]
+    fake.added = None
+
+    out = gmail.fetch_updates(CONFIG, SINCE, incremental=True)
+
+    assert [u["subject"] for u in out] == ["Subject a", "Subject b"]
+    assert ("messages.list", None) in fake.calls
+
+
+def test_group_threads_folds_replies_and_keeps_newest_snippets(fake):
+    fake.inbox = [
+        _message("r2", thread="t", at=3, sender="Raj <raj@example.com>"),
+        _message("solo", at=2),
+        _message("r1", thread="t", at=2, sender="Ann <ann@example.com>"),
+        _message("root", thread="t", at=1, sender="Ann <ann@example.com>"),
+    ]
+    config = {"gmail": {"group_threads": True, "thread_snippets": 2}}
+
+    out = gmail.fetch_updates(config, SINCE)
+
+    thread, solo = out
+    assert solo["subject"] == "Subject solo"
+    assert thread["subject"] == "Subject root"
+    assert thread["message_count"] == 3
+    assert thread["participants"] == ["Raj", "JD", "Ann"]
+    assert (thread["first_date"], thread["last_date"]) == ("day 1", "day 3")
+    assert [s["snippet"] for s in thread["snippets"]] == ["snippet r2", "snippet r1"]
+    assert gmail._raw_bytes(out) < gmail._raw_bytes(
+        gmail.fetch_updates({"gmail": {"group_threads": False}}, SINCE)
+    )
@@ -0,0 +1,83 @@
+"""
+Tests for auth.google_auth — in-memory reuse, single-flight refresh and the
+atomic token write. No OAuth endpoint is touched: Credentials.refresh is
+replaced with a slow fake that counts calls.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from auth import google_auth
+
+
+def _token_file(path, expiry):
+    path.write_text(json.dumps({
+        "token": "old",
+        "refresh_token": "refresh",
+        "client_id": "cid",
+        "client_secret": "secret",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "scopes": google_auth.SCOPES,
+        "expiry": expiry.replace(tzinfo=None).isoformat() + "Z",
+    }))
+
+
+@pytest.fixture
+def token_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(google_auth, "CONFIG_DIR", tmp_path)
+    monkeypatch.setattr(google_auth, "TOKEN_PATH", tmp_path / "google_token.json")
+    monkeypatch.setattr(google_auth, "_cached", None)
+    return tmp_path / "google_token.json"
+
+
+@pytest.fixture
+def refreshes(monkeypatch):
+    calls = []
+    lock = threading.Lock()
+
+    def fake_refresh(self, request):
+        with lock:
+            calls.append(1)
+        time.sleep(0.05)  # widen the race window
+        self.token = f"new-{len(calls)}"
+        self.expiry = (datetime.now(timezone.utc) + timedelta(hours=1)).replace(tzinfo=None)
+
+    monkeypatch.setattr(Credentials, "refresh", fake_refresh)
+    return calls
+
+
+def test_concurrent_callers_share_one_refresh(token_path, refreshes):
+    _token_file(token_path, datetime.now(timezone.utc) - timedelta(minutes=1))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda _: google_auth.get_google_credentials().token, range(8)))
+
+    assert len(refreshes) == 1
+    assert set(tokens) == {"new-1"}
+    assert json.loads(token_path.read_text())["token"] == "new-1"
+    assert not list(token_path.parent.glob("*.tmp"))
+
+
+def test_fresh_token_reused_from_memory(token_path, refreshes):
+    _token_file(token_path, datetime.now(timezone.utc) + timedelta(hours=1))
+
+    first = google_auth.get_google_credentials()
+    token_path.unlink()
+    second = google_auth.get_google_credentials()
+
+    assert first is second
+    assert refreshes == []
+
+
+def test_token_near_expiry_is_refreshed_early(token_path, refreshes):
+    _token_file(token_path, datetime.now(timezone.utc) + timedelta(minutes=4))
+
+    creds = google_auth.get_google_credentials()
+
+    assert len(refreshes) == 1
+    assert creds.token == "new-1"
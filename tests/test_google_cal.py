@@ -0,0 +1,197 @@
+"""
+Tests for src.connectors.google_cal.
+
+The Calendar discovery client is replaced with an in-memory fake whose
+events().list() serves pages and sync tokens, and records every call.
+"""
+from datetime import datetime, timedelta, timezone
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.connectors import google_cal
+from src.html_report import _extract_next_meeting
+
+NOW = datetime.now(timezone.utc)
+SINCE = NOW - timedelta(days=1)
+CONFIG = {}
+
+
+def _event(eid, hours_from_now, status="confirmed", title=None):
+    start = NOW + timedelta(hours=hours_from_now)
+    return {
+        "id": eid,
+        "status": status,
+        "summary": title or f"Meeting {eid}",
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(minutes=30)).isoformat()},
+        "attendees": [{"email": "ann@example.com"}, {"email": "me@example.com", "self": True}],
+    }
+
+
+class _Request:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self):
+        return self._fn()
+
+
+class FakeCalendar:
+    """Minimal stand-in for the Calendar v3 discovery client."""
+
+    def __init__(self, page_size=250):
+        self.items = []          # served on a full sync
+        self.changes = []        # served on a sync-token request
+        self.expired = False     # sync-token request → 410
+        self.page_size = page_size
+        self.token = "sync-1"
+        self.calls = []
+
+    def events(self):
+        return self
+
+    def list(self, calendarId, singleEvents, maxResults, pageToken=None, **params):
+        self.calls.append({"pageToken": pageToken, **params})
+
+        def run():
+            if "syncToken" in params and self.expired:
+                raise HttpError(httplib2.Response({"status": 410}), b"gone")
+            items = self.changes if "syncToken" in params else self.items
+            start = int(pageToken or 0)
+            size = min(maxResults, self.page_size)
+            page = {"items": items[start:start + size]}
+            if start + size < len(items):
+                page["nextPageToken"] = str(start + size)
+            else:
+                page["nextSyncToken"] = self.token
+            return page
+        return _Request(run)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    service = FakeCalendar()
+    monkeypatch.setattr(google_cal, "get_service", lambda *a: service)
+    return service
+
+
+def _age_store(seconds):
+    store = google_cal._load_store()
+    synced = datetime.fromisoformat(store["synced_at"]) - timedelta(seconds=seconds)
+    store["synced_at"] = synced.isoformat()
+    google_cal._save_store(store)
+
+
+def test_full_sync_follows_pages_and_sorts_by_start(fake):
+    fake.page_size = 20
+    fake.items = [_event(str(i), 50 - i) for i in range(45)]
+
+    out = google_cal.fetch_updates(CONFIG, SINCE)
+
+    assert len(fake.calls) == 3
+    assert "timeMin" in fake.calls[0] and "syncToken" not in fake.calls[0]
+    starts = [e["start"] for e in out]
+    assert starts == sorted(starts)
+    assert google_cal._load_store()["sync_token"] == "sync-1"
+
+
+def test_incremental_sync_applies_changes_and_cancellations(fake):
+    fake.items = [_event("a", 2), _event("b", 4)]
+    google_cal.fetch_updates(CONFIG, SINCE)
+    _age_store(600)
+    fake.changes = [{"id": "a", "status": "cancelled"}, _event("c", 3, title="Added")]
+    fake.token = "sync-2"
+
+    out = google_cal.fetch_updates(CONFIG, SINCE)
+
+    assert fake.calls[-1] == {"pageToken": None, "syncToken": "sync-1"}
+    assert [e["title"] for e in out] == ["Added", "Meeting b"]
+    assert google_cal._load_store()["sync_token"] == "sync-2"
+
+
+def test_recent_store_served_without_api_call(fake):
+    fake.items = [_event("a", 2)]
+    google_cal.fetch_updates(CONFIG, SINCE)
+
+    out = google_cal.fetch_updates(CONFIG, SINCE)
+
+    assert len(fake.calls) == 1
+    assert [e["title"] for e in out] == ["Meeting a"]
+
+
+def test_expired_sync_token_falls_back_to_full_sync(fake):
+    fake.items = [_event("a", 2)]
+    google_cal.fetch_updates(CONFIG, SINCE)
+    _age_store(600)
+    fake.expired = True
+    fake.items = [_event("b", 2)]
+
+    out = google_cal.fetch_updates(CONFIG, SINCE)
+
+    assert "syncToken" in fake.calls[1] and "timeMin" in fake.calls[2]
+    assert [e["title"] for e in out] == ["Meeting b"]
+
+
+def test_since_before_synced_window_forces_full_sync(fake):
+    fake.items = [_event("a", 2)]
+    google_cal.fetch_updates(CONFIG, SINCE)
+
+    google_cal.fetch_updates(CONFIG, NOW - timedelta(days=30))
+
+    assert "timeMin" in fake.calls[1]
+
+
+def test_daily_runs_stay_incremental_and_prune_past_events(fake, monkeypatch):
+    clock = {"now": NOW}
+
+    class _Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock["now"]
+
+    monkeypatch.setattr(google_cal, "datetime", _Clock)
+    fake.items = [_event("old", -30), _event("later", 24 * 30)]
+    google_cal.fetch_updates(CONFIG, SINCE)
+
+    for day in range(1, 11):
+        clock["now"] = NOW + timedelta(days=day)
+        google_cal.fetch_updates(CONFIG, clock["now"] - timedelta(days=1))
+
+    assert all(call == {"pageToken": None, "syncToken": "sync-1"} for call in fake.calls[1:])
+    assert len(fake.calls) == 11
+    assert set(google_cal._load_store()["events"]) == {"later"}
+
+
+def test_full_sync_is_bounded_and_redone_when_friday_passes_the_horizon(fake, monkeypatch):
+    clock = {"now": NOW}
+
+    class _Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock["now"]
+
+    monkeypatch.setattr(google_cal, "datetime", _Clock)
+    fake.changes = [_event("beyond", 24 * 90)]
+    google_cal.fetch_updates(CONFIG, SINCE)
+    window_end = datetime.fromisoformat(fake.calls[0]["timeMax"])
+
+    clock["now"] = NOW + timedelta(days=1)
+    google_cal.fetch_updates(CONFIG, NOW)
+    clock["now"] = NOW + timedelta(days=google_cal._SYNC_AHEAD_DAYS + 1)
+    google_cal.fetch_updates(CONFIG, clock["now"] - timedelta(days=1))
+
+    assert window_end == NOW + timedelta(days=google_cal._SYNC_AHEAD_DAYS)
+    assert "syncToken" in fake.calls[1] and "beyond" not in google_cal._load_store()["events"]
+    assert "timeMax" in fake.calls[2] and "syncToken" not in fake.calls[2]
+
+
+def test_next_meeting_falls_back_to_event_store(fake):
+    fake.items = [_event("past", -2), _event("soon", 0.5, title="Standup")]
+    google_cal.fetch_updates(CONFIG, SINCE)
+
+    chip = _extract_next_meeting({"slack": []}, NOW)
+
+    assert chip["title"] == "Standup"
+    assert chip["attendees"] == 1
@@ -0,0 +1,55 @@
+"""
+Tests for src.google_client — the shared Google discovery clients.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from src import google_client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clients():
+    google_client.reset_clients()
+    yield
+    google_client.reset_clients()
+
+
+@pytest.fixture
+def creds(monkeypatch):
+    creds = Credentials(token="tok")
+    monkeypatch.setattr(google_client, "get_google_credentials", lambda: creds)
+    return creds
+
+
+def test_service_built_once_and_shared(creds):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        services = list(executor.map(lambda _: google_client.get_service("gmail", "v1"), range(8)))
+
+    assert all(s is services[0] for s in services)
+    assert google_client.get_service("calendar", "v3") is not services[0]
+
+
+def test_requests_reuse_one_connection_per_thread(creds):
+    service = google_client.get_service("gmail", "v1")
+
+    first = service.users().getProfile(userId="me")
+    second = service.users().getProfile(userId="me")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other = executor.submit(lambda: service.users().getProfile(userId="me")).result()
+
+    assert first.http is second.http
+    assert other.http is not first.http
+    assert first.http.credentials.token == "tok"
+
+
+def test_new_credentials_get_a_new_connection(creds, monkeypatch):
+    service = google_client.get_service("gmail", "v1")
+    first = service.users().getProfile(userId="me")
+
+    monkeypatch.setattr(google_client, "get_google_credentials", lambda: Credentials(token="new"))
+    second = service.users().getProfile(userId="me")
+
+    assert second.http is not first.http
+    assert second.http.credentials.token == "new"
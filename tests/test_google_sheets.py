@@ -0,0 +1,151 @@
+"""
+Tests for src.connectors.google_sheets.
+
+The Sheets discovery client is replaced with an in-memory fake that serves
+spreadsheet metadata and A1 ranges over a list-of-rows tab, and records every
+call.
+"""
+import re
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.connectors import google_sheets
+
+CONFIG = {"google_sheets": {"project_tracker": {
+    "sheet_id": "sheet1",
+    "gid": 42,
+    "departments": ["Data Science"],
+    "exclude_statuses": ["Done"],
+}}}
+
+ROWS = [
+    ["Owner", "Department", "Notes", "Project", "Status", "Budget"],
+    ["ann", "Data Science", "x", "Churn model", "On track", "10"],
+    ["raj", "Data Science", "y", "Old thing", "Done", "5"],
+    ["li", "Marketing", "z", "Campaign", "At risk", "7"],
+]
+
+
+class _Request:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self):
+        return self._fn()
+
+
+def _col_index(letters):
+    index = 0
+    for ch in letters:
+        index = index * 26 + ord(ch) - ord("A") + 1
+    return index - 1
+
+
+class FakeSheets:
+    """Minimal stand-in for the Sheets v4 discovery client."""
+
+    def __init__(self):
+        self.tab = "Tracker"
+        self.rows = [list(r) for r in ROWS]
+        self.calls = []
+        self.fail = False
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, spreadsheetId, range=None, fields=None):
+        if range is None:
+            self.calls.append(("metadata", fields))
+            return _Request(lambda: {"sheets": [
+                {"properties": {"sheetId": 7, "title": "Other"}},
+                {"properties": {"sheetId": 42, "title": self.tab}},
+            ]})
+        self.calls.append(("values", range))
+
+        def run():
+            tab, _, cells = range.rpartition("!")
+            if self.fail or tab != f"'{self.tab}'":
+                raise HttpError(httplib2.Response({"status": 400}), b"Unable to parse range")
+            if cells == "1:1":
+                return {"values": self.rows[:1]}
+            first, last = (_col_index(c) for c in re.findall(r"[A-Z]+", cells))
+            return {"values": [row[first:last + 1] for row in self.rows]}
+        return _Request(run)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    service = FakeSheets()
+    monkeypatch.setattr(google_sheets, "get_service", lambda *a: service)
+    return service
+
+
+def test_col_letter():
+    assert [google_sheets._col_letter(i) for i in (0, 25, 26, 701, 702)] == ["A", "Z", "AA", "ZZ", "AAA"]
+
+
+def test_reads_only_the_needed_column_span(fake):
+    out = google_sheets.fetch_projects(CONFIG)
+
+    assert out == [{"department": "Data Science", "project": "Churn model", "last_status": "On track"}]
+    assert fake.calls == [
+        ("metadata", "sheets.properties(sheetId,title)"),
+        ("values", "'Tracker'!1:1"),
+        ("values", "'Tracker'!B:E"),
+    ]
+
+
+def test_warm_cache_is_a_single_range_read(fake):
+    google_sheets.fetch_projects(CONFIG)
+    fake.calls.clear()
+    fake.rows[1][4] = "At risk"
+
+    out = google_sheets.fetch_projects(CONFIG)
+
+    assert fake.calls == [("values", "'Tracker'!B:E")]
+    assert out[0]["last_status"] == "At risk"
+
+
+def test_unchanged_rows_leave_the_cache_file_alone(fake, monkeypatch):
+    google_sheets.fetch_projects(CONFIG)
+    saves = []
+    monkeypatch.setattr(google_sheets, "_save_cache", saves.append)
+
+    google_sheets.fetch_projects(CONFIG)
+    fake.rows[1][4] = "At risk"
+    google_sheets.fetch_projects(CONFIG)
+
+    assert len(saves) == 1
+
+
+def test_renamed_tab_and_moved_columns_are_resolved_again(fake):
+    google_sheets.fetch_projects(CONFIG)
+    fake.tab = "Tracker 2026"
+    for row in fake.rows:
+        row.insert(0, "")
+
+    out = google_sheets.fetch_projects(CONFIG)
+
+    assert out[0]["project"] == "Churn model"
+    assert fake.calls[-1] == ("values", "'Tracker 2026'!C:F")
+
+
+def test_failed_read_falls_back_to_last_snapshot(fake):
+    google_sheets.fetch_projects(CONFIG)
+    fake.fail = True
+
+    out = google_sheets.fetch_projects(CONFIG)
+
+    assert [p["project"] for p in out] == ["Churn model"]
+
+
+def test_missing_columns_raise(fake):
+    fake.rows = [["Name", "Team"], ["a", "b"]]
+
+    with pytest.raises(ValueError, match="Could not find required columns"):
+        google_sheets.fetch_projects(CONFIG)
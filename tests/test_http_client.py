@@ -0,0 +1,95 @@
+"""
+Tests for src.http_client: the shared, pooled requests session.
+"""
+import json
+
+import pytest
+import responses
+
+from src import http_client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_session():
+    http_client.reset_session()
+    yield
+    http_client.reset_session()
+
+
+def test_session_is_shared():
+    assert http_client.get_session() is http_client.get_session()
+
+
+def test_adapter_pool_and_retry_settings():
+    adapter = http_client.get_session().get_adapter("https://api.github.com")
+    assert adapter._pool_maxsize >= 1
+    assert adapter.max_retries.total >= 1
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_no_credentials_on_session():
+    session = http_client.get_session()
+    assert session.auth is None
+    assert "Authorization" not in session.headers
+    assert session.headers["User-Agent"].startswith("intel-brief")
+
+
+@responses.activate
+def test_retries_transient_5xx():
+    url = "https://example.com/feed"
+    responses.add(responses.GET, url, status=503)
+    responses.add(responses.GET, url, body="ok", status=200)
+    resp = http_client.get_session().get(url, timeout=5)
+    assert resp.status_code == 200
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_does_not_retry_client_errors():
+    url = "https://example.com/bad"
+    responses.add(responses.GET, url, status=400)
+    resp = http_client.get_session().get(url, timeout=5)
+    assert resp.status_code == 400
+    assert len(responses.calls) == 1
+
+
+# ── conditional_get ──────────────────────────────────────────────────────────
+
+@responses.activate
+def test_conditional_get_serves_304_from_cache_without_parsing():
+    url = "https://example.com/feed.xml"
+    responses.add(responses.GET, url, body="v1", headers={"ETag": '"abc"'})
+    responses.add(responses.GET, url, status=304)
+    parsed = []
+
+    def parse(content):
+        parsed.append(content.decode())
+        return {"body": content.decode()}
+
+    first = http_client.conditional_get("news", url, parse)
+    second = http_client.conditional_get("news", url, parse)
+
+    assert first == second == {"body": "v1"}
+    assert parsed == ["v1"]
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers["If-None-Match"] == '"abc"'
+    assert http_client.pop_validator_stats("news") == {"hits": 1, "misses": 1}
+    assert http_client.pop_validator_stats("news") == {"hits": 0, "misses": 0}
+
+
+@responses.activate
+def test_conditional_get_keys_on_params_and_sends_last_modified():
+    url = "https://example.com/search"
+    stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+    responses.add(responses.GET, url, json={"n": 1}, headers={"Last-Modified": stamp})
+    responses.add(responses.GET, url, json={"n": 2})
+    responses.add(responses.GET, url, status=304)
+
+    http_client.conditional_get("github", url, json.loads, params={"q": "a"})
+    other = http_client.conditional_get("github", url, json.loads, params={"q": "b"})
+    again = http_client.conditional_get("github", url, json.loads, params={"q": "a"})
+
+    assert other == {"n": 2}
+    assert "If-Modified-Since" not in responses.calls[1].request.headers
+    assert responses.calls[2].request.headers["If-Modified-Since"] == stamp
+    assert again == {"n": 1}
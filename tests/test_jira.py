@@ -0,0 +1,316 @@
+"""
+Tests for src.connectors.jira.
+
+The atlassian Jira client is replaced with an in-memory fake that serves
+token-paginated JQL results (with comments embedded, as Jira does) and
+per-issue comment listings, and records every call.
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from src import state
+from src.connectors import jira
+
+SINCE = datetime(2026, 4, 28, tzinfo=timezone.utc)
+CONFIG = {"jira": {"projects": ["DE", "ERP"]}}
+
+
+def _issue(n, updated="2026-04-29T10:00:00.000+0000", status="In Progress"):
+    return {
+        "key": f"DE-{n}",
+        "fields": {
+            "summary": f"Issue {n}",
+            "status": {"name": status},
+            "priority": {"name": "High"},
+            "assignee": {"displayName": "Alice"},
+            "reporter": {"displayName": "Bob"},
+            "updated": updated,
+            "labels": [],
+        },
+    }
+
+
+class FakeJira:
+    """Minimal stand-in for atlassian.Jira."""
+
+    def __init__(self, issues=None, comments=None, page_size=100, enhanced=True):
+        self.issues = issues or []
+        self.comments = comments or {}    # key -> [comment dicts], oldest first
+        self.embed_limit = 20             # comments embedded per issue in search results
+        self.page_size = page_size
+        self.enhanced = enhanced
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _record(self, method, **kwargs):
+        with self._lock:
+            self.calls.append((method, kwargs))
+
+    def _page(self, issues, fields):
+        if "comment" not in fields:
+            return issues
+        page = []
+        for issue in issues:
+            comments = self.comments.get(issue["key"], [])
+            page.append({**issue, "fields": {**issue["fields"], "comment": {
+                "comments": comments[:self.embed_limit], "total": len(comments),
+            }}})
+        return page
+
+    def enhanced_jql(self, jql, fields="*all", nextPageToken=None, limit=None, expand=None):
+        self._record("enhanced_jql", fields=fields, token=nextPageToken, expand=expand)
+        if not self.enhanced:
+            resp = requests.Response()
+            resp.status_code = 404
+            raise requests.HTTPError("not found", response=resp)
+        start = int(nextPageToken or 0)
+        size = min(limit, self.page_size)
+        page = {"issues": self._page(self.issues[start:start + size], fields)}
+        if start + size < len(self.issues):
+            page["nextPageToken"] = str(start + size)
+        else:
+            page["isLast"] = True
+        return page
+
+    def jql(self, jql, fields="*all", start=0, limit=None, **kwargs):
+        self._record("jql", start=start)
+        size = min(limit, self.page_size)
+        return {"issues": self._page(self.issues[start:start + size], fields), "total": len(self.issues)}
+
+    def resource_url(self, resource):
+        return f"rest/api/2/{resource}"
+
+    def get(self, path, params=None):
+        key = path.split("/")[-2]
+        self._record("comments", key=key)
+        comments = self.comments.get(key, [])
+        depth = params["maxResults"]
+        return {"comments": list(reversed(comments))[:depth], "total": len(comments)}
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    client = FakeJira()
+    monkeypatch.setattr(jira, "Jira", lambda **kwargs: client)
+    return client
+
+
+def _calls(client, method):
+    return [kw for m, kw in client.calls if m == method]
+
+
+def test_fetch_updates_follows_next_page_token_past_100(fake):
+    fake.issues = [_issue(i) for i in range(250)]
+
+    out = jira.fetch_updates(CONFIG, SINCE)
+
+    assert [u["key"] for u in out] == [f"DE-{i}" for i in range(250)]
+    assert [kw["token"] for kw in _calls(fake, "enhanced_jql")] == [None, "100", "200"]
+    assert "comment" in _calls(fake, "enhanced_jql")[0]["fields"]
+
+
+def test_fetch_updates_falls_back_to_start_at_paging(fake):
+    fake.enhanced = False
+    fake.issues = [_issue(i) for i in range(230)]
+
+    out = jira.fetch_updates(CONFIG, SINCE)
+
+    assert [u["key"] for u in out] == [f"DE-{i}" for i in range(230)]
+    assert sorted(kw["start"] for kw in _calls(fake, "jql")) == [0, 100, 200]
+
+
+def test_max_issues_caps_results(fake):
+    fake.issues = [_issue(i) for i in range(150)]
+    config = {**CONFIG, "limits": {"jira_max_issues": 120}}
+
+    out = jira.fetch_updates(config, SINCE)
+
+    assert len(out) == 120
+
+
+def test_comments_come_from_the_search_and_keep_last_depth(fake):
+    fake.issues = [_issue(1), _issue(2)]
+    fake.comments = {"DE-1": [
+        {"author": {"displayName": f"U{i}"}, "body": f"c{i}", "created": f"2026-04-2{i}"}
+        for i in range(5)
+    ]}
+
+    out = jira.fetch_updates(CONFIG, SINCE)
+
+    assert [c["body"] for c in out[0]["recent_comments"]] == ["c2", "c3", "c4"]
+    assert out[1]["recent_comments"] == []
+    assert _calls(fake, "comments") == []
+
+
+def test_truncated_comment_list_fetches_newest_comments(fake):
+    fake.issues = [_issue(1), _issue(2)]
+    fake.embed_limit = 2
+    fake.comments = {
+        "DE-1": [{"author": {"displayName": "A"}, "body": f"c{i}", "created": str(i)} for i in range(5)],
+        "DE-2": [{"author": {"displayName": "B"}, "body": "only", "created": "1"}],
+    }
+
+    out = jira.fetch_updates(CONFIG, SINCE)
+
+    assert _calls(fake, "comments") == [{"key": "DE-1"}]
+    assert [c["body"] for c in out[0]["recent_comments"]] == ["c2", "c3", "c4"]
+    assert [c["body"] for c in out[1]["recent_comments"]] == ["only"]
+
+
+def test_adf_comment_bodies_from_the_v3_search_are_flattened(fake):
+    fake.issues = [_issue(1)]
+    adf = {"type": "doc", "version": 1, "content": [
+        {"type": "paragraph", "content": [
+            {"type": "mention", "attrs": {"text": "@Raj"}},
+            {"type": "text", "text": " vendor is late"},
+        ]},
+        {"type": "paragraph", "content": [{"type": "text", "text": "ETA Friday"}]},
+    ]}
+    fake.comments = {"DE-1": [{"author": {"displayName": "Ann"}, "body": adf, "created": "1"}]}
+
+    out = jira.fetch_updates(CONFIG, SINCE)
+
+    assert out[0]["recent_comments"][0]["body"] == "@Raj vendor is late\nETA Friday"
+
+
+# ── Snapshot deltas (incremental daily run) ──────────────────────────────────
+
+def _comment(cid, author, body):
+    return {"id": cid, "author": {"displayName": author}, "body": body, "created": cid}
+
+
+def test_incremental_first_run_sends_full_record_and_stages_snapshot(fake):
+    fake.issues = [_issue(1)]
+    fake.comments = {"DE-1": [_comment("10", "Ann", "first")]}
+
+    out = jira.fetch_updates(CONFIG, SINCE, incremental=True)
+    assert "changes" not in out[0]
+    assert out[0]["reporter"] == "Bob"
+    assert out[0]["recent_comments"] == [{"author": "Ann", "body": "first", "updated": "10"}]
+
+    state.commit_cursors()
+    assert state.get_cursors("jira") == {}
+    snap = state.load_store(jira._SNAPSHOT_PATH)["DE-1"]
+    assert snap["status"] == "In Progress"
+    assert snap["comment_ids"] == ["10"]
+
+
+def test_incremental_rerun_sends_field_deltas_and_new_comments_only(fake):
+    fake.issues = [_issue(1)]
+    fake.comments = {"DE-1": [_comment("10", "Ann", "first")]}
+    jira.fetch_updates(CONFIG, SINCE, incremental=True)
+    state.commit_cursors()
+
+    fake.issues = [_issue(1, updated="2026-04-30T09:00:00.000+0000", status="Blocked")]
+    fake.comments["DE-1"].append(_comment("11", "Raj", "waiting on vendor"))
+    out = jira.fetch_updates(CONFIG, SINCE, incremental=True)
+
+    assert out[0]["changes"] == ["status: In Progress → Blocked", "+1 comment by Raj"]
+    assert out[0]["previous_status"] == "In Progress"
+    assert [c["body"] for c in out[0]["recent_comments"]] == ["waiting on vendor"]
+    assert "reporter" not in out[0]
+
+
+def test_incremental_record_without_new_comments_is_not_stale(fake):
+    from src import obsidian
+
+    fake.issues = [_issue(n) for n in range(1, 4)]
+    fake.comments = {f"DE-{n}": [_comment(f"{n}0", "Ann", "looking")] for n in range(1, 4)}
+    jira.fetch_updates(CONFIG, SINCE, incremental=True)
+    state.commit_cursors()
+
+    fake.issues = [_issue(n, updated="2026-04-30T09:00:00.000+0000") for n in range(1, 4)]
+    out = jira.fetch_updates(CONFIG, SINCE, incremental=True)
+
+    assert all(o["recent_comments"] == [] and o["comment_total"] == 1 for o in out)
+    assert "STALE" not in obsidian.extract_critical_team_signals({"jira": out})
+
+
+def test_non_incremental_fetch_ignores_snapshots(fake):
+    fake.issues = [_issue(1)]
+    jira.fetch_updates(CONFIG, SINCE, incremental=True)
+    state.commit_cursors()
+
+    out = jira.fetch_updates(CONFIG, SINCE)
+    assert "changes" not in out[0]
+    assert out[0]["reporter"] == "Bob"
+
+
+# ── Changelog event log ──────────────────────────────────────────────────────
+
+def _history(hid, created, field, old, new, author="Ann"):
+    return {
+        "id": hid,
+        "created": created,
+        "author": {"displayName": author},
+        "items": [{"field": field, "fromString": old, "toString": new}],
+    }
+
+
+def _jira_ts(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+# The event log prunes to two weeks, so these tests work relative to now
+NOW = datetime.now(timezone.utc)
+RECENT = NOW - timedelta(days=2)
+
+
+def test_incremental_sync_logs_changelog_events_in_window(fake):
+    issue = _issue(1, updated=_jira_ts(NOW - timedelta(hours=1)), status="Blocked")
+    issue["changelog"] = {"histories": [
+        _history("1", _jira_ts(NOW - timedelta(days=5)), "status", "To Do", "In Progress"),
+        _history("2", _jira_ts(NOW - timedelta(hours=3)), "status", "In Progress", "Blocked"),
+        _history("3", _jira_ts(NOW - timedelta(hours=3)), "description", "", "x"),
+    ]}
+    fake.issues = [issue]
+    fake.comments = {"DE-1": [
+        {"id": "7", "author": {"displayName": "Raj"}, "body": "vendor late",
+         "created": _jira_ts(NOW - timedelta(hours=2))},
+    ]}
+
+    jira.fetch_updates(CONFIG, RECENT, incremental=True)
+
+    assert _calls(fake, "enhanced_jql")[0]["expand"] == "changelog"
+    out = jira.updates_from_log(RECENT)
+    day = (NOW - timedelta(hours=3)).strftime("%Y-%m-%d")
+    assert out[0]["key"] == "DE-1"
+    assert out[0]["events"][0] == f"{day} status: In Progress → Blocked (Ann)"
+    assert out[0]["events"][1].endswith("comment (Raj)")
+    assert out[0]["recent_comments"][0]["body"] == "vendor late"
+
+
+def test_updates_from_log_needs_coverage_of_window(fake):
+    fake.issues = [_issue(1, updated=_jira_ts(NOW))]
+    jira.fetch_updates(CONFIG, RECENT, incremental=True)
+
+    assert [u["key"] for u in jira.updates_from_log(RECENT)] == ["DE-1"]
+    assert jira.updates_from_log(RECENT - timedelta(days=1)) is None
+
+
+def test_resync_after_gap_restarts_coverage():
+    jira._append_events({}, [], RECENT, RECENT + timedelta(hours=1))
+    # Next sync starts after the previous one ended: a gap in the log
+    jira._append_events({}, [], NOW - timedelta(hours=1), NOW)
+
+    assert jira.updates_from_log(RECENT) is None
+    assert jira.updates_from_log(NOW - timedelta(hours=1)) == []
+
+
+def test_daily_runs_keep_log_coverage_unbroken(fake, monkeypatch):
+    # The real sequence: fetch, then save_last_run() at the end of the run,
+    # whose stamp is the next day's `since` — later than the sync itself.
+    fake.issues = [_issue(1, updated=_jira_ts(NOW))]
+    first_since = NOW - timedelta(days=1)
+    jira.fetch_updates(CONFIG, first_since, incremental=True)
+    state.save_last_run()
+    for _ in range(3):
+        jira.fetch_updates(CONFIG, state.get_last_run(), incremental=True)
+        state.save_last_run()
+
+    assert jira.updates_from_log(first_since) is not None
+    jql = [kw for m, kw in fake.calls if m == "enhanced_jql"]
+    assert len(jql) == 4
@@ -0,0 +1,243 @@
+"""
+Tests for src.connectors.news.
+
+All HTTP is mocked with `responses`; conftest blocks raw sockets so any
+unmocked call fails the test.
+"""
+import threading
+from datetime import datetime, timezone
+
+import pytest
+import responses
+
+from src.connectors import news
+
+SINCE = datetime(2026, 4, 28, tzinfo=timezone.utc)
+FEEDS = [("CFPB", "https://example.com/cfpb.xml"), ("OCC", "https://example.com/occ.xml")]
+CONFIG = {"news": {"edgar_tickers": [], "rss_feeds": []}}
+
+
+def _rss(*items):
+    body = "".join(
+        f"<item><title>{title}</title><link>https://example.com/{i}</link>"
+        f"<pubDate>{date}</pubDate><description>About {title}</description></item>"
+        for i, (title, date) in enumerate(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{body}</channel></rss>'
+
+
+@pytest.fixture(autouse=True)
+def _feeds(monkeypatch):
+    monkeypatch.setattr(news, "_REGULATORY_FEEDS", FEEDS)
+    monkeypatch.delenv("NEWS_API_KEY", raising=False)
+
+
+@responses.activate
+def test_unchanged_feed_is_served_from_validator_cache(monkeypatch):
+    for name, url in FEEDS:
+        feed = _rss((f"{name} new rule", "Wed, 29 Apr 2026 10:00:00 GMT"), ("Old rule", "Mon, 27 Apr 2026 10:00:00 GMT"))
+        responses.add(responses.GET, url, body=feed.replace("example.com/", f"example.com/{name}/"), headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, status=304)
+
+    first = news.fetch_updates(CONFIG, SINCE)
+    monkeypatch.setattr(news.feedparser, "parse", lambda *a: (_ for _ in ()).throw(AssertionError))
+    second = news.fetch_updates(CONFIG, SINCE)
+
+    assert first == second
+    assert [(i["source"], i["title"]) for i in first] == [("CFPB", "CFPB new rule"), ("OCC", "OCC new rule")]
+    assert first[0] == {
+        "source": "CFPB",
+        "title": "CFPB new rule",
+        "summary": "About CFPB new rule",
+        "url": "https://example.com/CFPB/0",
+        "published_at": "2026-04-29T10:00:00+00:00",
+        "type": "regulatory",
+        "source_count": 1,
+    }
+    assert responses.calls[-1].request.headers["If-None-Match"] == '"v1"'
+
+
+def test_slow_feed_is_skipped_without_holding_up_the_run(monkeypatch, caplog):
+    release = threading.Event()
+    real_fetch = news.conditional_fetch
+
+    def fetch(connector, url, **kwargs):
+        if "occ" in url:
+            release.wait(5)
+            raise TimeoutError("never answered")
+        return real_fetch(connector, url, **kwargs)
+
+    monkeypatch.setattr(news, "conditional_fetch", fetch)
+    monkeypatch.setattr(news, "_DEADLINE_HEADROOM", 0)
+    config = {"news": {**CONFIG["news"], "feed_timeout": 0.3}}
+
+    with responses.RequestsMock() as rsps:
+        rsps.add(responses.GET, FEEDS[0][1], body=_rss(("Fast", "Wed, 29 Apr 2026 10:00:00 GMT")))
+        with caplog.at_level("WARNING", logger="intel_brief"):
+            out = news.fetch_updates(config, SINCE)
+        release.set()
+
+    assert [i["title"] for i in out] == ["Fast"]
+    assert "OCC still loading" in caplog.text
+
+
+@responses.activate
+def test_failed_and_oversized_feeds_are_reported_individually(monkeypatch, caplog):
+    monkeypatch.setattr(news, "_REGULATORY_FEEDS", FEEDS + [("FDIC", "https://example.com/fdic.xml")])
+    big = _rss(*[(f"Notice {i:03d} " + "abcdefghijklmnopqrstuvwxyz"[i % 26] * 8, "Wed, 29 Apr 2026 10:00:00 GMT") for i in range(200)])
+    responses.add(responses.GET, FEEDS[0][1], body=big)
+    responses.add(responses.GET, FEEDS[1][1], status=404)
+    responses.add(
+        responses.GET, "https://example.com/fdic.xml",
+        body=_rss(("Bank failure", "Wed, 29 Apr 2026 10:00:00 GMT")).replace("example.com/", "fdic.gov/"),
+    )
+    config = {"news": {**CONFIG["news"], "feed_max_bytes": 4000}}
+
+    with caplog.at_level("WARNING", logger="intel_brief"):
+        out = news.fetch_updates(config, SINCE)
+
+    cfpb = [i for i in out if i["source"] == "CFPB"]
+    assert 0 < len(cfpb) < 200
+    assert out[-1]["source"] == "FDIC"
+    assert "OCC fetch failed" in caplog.text
+    assert "CFPB feed exceeded" in caplog.text
+
+
+@responses.activate
+def test_truncated_feed_is_not_cached_for_revalidation():
+    big = _rss(*[(f"Notice {i:03d}", "Wed, 29 Apr 2026 10:00:00 GMT") for i in range(200)])
+    responses.add(responses.GET, FEEDS[0][1], body=big, headers={"ETag": '"v1"'})
+    responses.add(responses.GET, FEEDS[1][1], status=404)
+    config = {"news": {**CONFIG["news"], "feed_max_bytes": 4000}}
+
+    news.fetch_updates(config, SINCE)
+    news.fetch_updates(config, SINCE)
+
+    cfpb_calls = [c for c in responses.calls if c.request.url == FEEDS[0][1]]
+    assert len(cfpb_calls) == 2
+    assert "If-None-Match" not in cfpb_calls[1].request.headers
+
+
+def _item(title, source="Reuters", url=None, kind="news"):
+    return {
+        "source": source,
+        "title": title,
+        "summary": "",
+        "url": url or f"https://{source.lower()}.com/{_slug(title)}",
+        "published_at": "2026-04-29T10:00:00+00:00",
+        "type": kind,
+    }
+
+
+def _slug(title):
+    return news._title_key(title).replace(" ", "-")
+
+
+def test_near_duplicate_titles_and_shared_urls_are_clustered():
+    items = [
+        _item("Klarna files for U.S. IPO", "Reuters"),
+        _item("Klarna Files for US IPO", "Bloomberg"),
+        _item("Klarna files for U.S. IPO", "Yahoo", url="https://www.reuters.com/klarna-files-for-u-s-ipo/?utm=x"),
+        _item("Affirm extends Amazon partnership", "CNBC"),
+        _item("8-K - AFFIRM HOLDINGS", "SEC EDGAR (AFRM)", url="https://sec.gov/a/1", kind="sec_filing"),
+        _item("8-K - AFFIRM HOLDINGS", "SEC EDGAR (AFRM)", url="https://sec.gov/a/2", kind="sec_filing"),
+    ]
+
+    out = news._clusters(items)
+
+    assert [(o["title"], o["source_count"]) for o in out] == [
+        ("Klarna files for U.S. IPO", 3),
+        ("Affirm extends Amazon partnership", 1),
+        ("8-K - AFFIRM HOLDINGS", 1),
+        ("8-K - AFFIRM HOLDINGS", 1),
+    ]
+    assert out[0]["sources"] == ["Reuters", "Bloomberg", "Yahoo"]
+    assert "sources" not in out[1]
+
+
+def test_reworded_headline_is_clustered_but_a_different_story_is_not():
+    items = [
+        _item("Klarna files for U.S. IPO", "Reuters"),
+        _item("Klarna files for IPO in US", "Bloomberg"),
+        _item("Klarna postpones US IPO", "CNBC"),
+        _item("Affirm extends Shopify partnership", "Verge"),
+        _item("Affirm extends Amazon partnership", "TechCrunch"),
+    ]
+
+    out = news._clusters(items)
+
+    assert [(o["title"], o["source_count"]) for o in out] == [
+        ("Klarna files for U.S. IPO", 2),
+        ("Klarna postpones US IPO", 1),
+        ("Affirm extends Shopify partnership", 1),
+        ("Affirm extends Amazon partnership", 1),
+    ]
+
+
+def test_formulaic_regulatory_titles_are_matched_on_url_only():
+    fed = "Federal Reserve Board announces approval of application by {}"
+    action = "Agencies announce enforcement action against {}"
+    items = [
+        _item(fed.format("First Bank"), "Federal Reserve", kind="regulatory"),
+        _item(fed.format("Second Bank"), "Federal Reserve", kind="regulatory"),
+        _item(action.format("Citibank"), "OCC", kind="regulatory"),
+        _item(action.format("Wells Fargo"), "OCC", kind="regulatory"),
+        _item(action.format("Wells Fargo"), "FDIC", kind="regulatory", url="https://occ.com/" + _slug(action.format("Wells Fargo"))),
+    ]
+
+    out = news._clusters(items)
+
+    assert [o["source_count"] for o in out] == [1, 1, 1, 2]
+    assert out[3]["sources"] == ["OCC", "FDIC"]
+
+
+def test_incremental_run_skips_stories_reported_before(monkeypatch):
+    from src import state
+
+    batches = iter([
+        [_item("Klarna files for U.S. IPO"), _item("CFPB issues BNPL rule", "CFPB")],
+        [_item("Klarna files for IPO in US", "Bloomberg"), _item("Afterpay outage", "Verge")],
+    ])
+    monkeypatch.setattr(news, "_REGULATORY_FEEDS", [])
+    monkeypatch.setattr(news, "_fetch_newsapi", lambda *a: next(batches))
+
+    first = news.fetch_updates(CONFIG, SINCE, incremental=True)
+    state.commit_cursors()
+    second = news.fetch_updates(CONFIG, SINCE, incremental=True)
+
+    assert [o["title"] for o in first] == ["Klarna files for U.S. IPO", "CFPB issues BNPL rule"]
+    assert [o["title"] for o in second] == ["Afterpay outage"]
+
+
+def test_incremental_run_does_not_suppress_a_similar_regulatory_release(monkeypatch):
+    from src import state
+
+    action = "Agencies announce enforcement action against {}"
+    batches = iter([
+        [_item(action.format("Citibank"), "OCC", kind="regulatory")],
+        [_item(action.format("Wells Fargo"), "OCC", kind="regulatory")],
+    ])
+    monkeypatch.setattr(news, "_REGULATORY_FEEDS", [])
+    monkeypatch.setattr(news, "_fetch_newsapi", lambda *a: next(batches))
+
+    news.fetch_updates(CONFIG, SINCE, incremental=True)
+    state.commit_cursors()
+    second = news.fetch_updates(CONFIG, SINCE, incremental=True)
+
+    assert [o["title"] for o in second] == [action.format("Wells Fargo")]
+    assert state.get_cursors("news") == {}
+
+
+def test_seen_index_expires_after_ttl(monkeypatch):
+    from src import state
+
+    news._SEEN_PATH.parent.mkdir(parents=True, exist_ok=True)
+    news._SEEN_PATH.write_text('{"t:klarna files for u s ipo": {"seen_at": "2020-01-01T00:00:00+00:00"}}')
+    monkeypatch.setattr(news, "_REGULATORY_FEEDS", [])
+    monkeypatch.setattr(news, "_fetch_newsapi", lambda *a: [_item("Klarna files for U.S. IPO")])
+
+    out = news.fetch_updates(CONFIG, SINCE, incremental=True)
+    state.commit_cursors()
+
+    assert len(out) == 1
+    assert state.load_store(news._SEEN_PATH)["t:klarna files for u s ipo"]["seen_at"] > "2026"
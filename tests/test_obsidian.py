@@ -127,3 +127,32 @@ Body.
     _write_brief(tmp_path, md, when)
     todos = obsidian.load_open_todos(_config(tmp_path))
     assert todos == ["keep me"]
+
+
+# ── extract_critical_team_signals ────────────────────────────────────────────
+
+def test_team_signals_separate_newly_blocked_from_still_blocked():
+    updates = {"jira": [
+        {"key": "DE-1", "summary": "Ingest", "status": "Blocked", "assignee": "Ann",
+         "previous_status": "In Progress"},
+        {"key": "DE-2", "summary": "Export", "status": "Blocked", "assignee": "Raj"},
+    ]}
+    out = obsidian.extract_critical_team_signals(updates)
+
+    newly, still = out.split("\n\n")
+    assert newly.startswith("NEWLY BLOCKED SINCE LAST RUN (1)")
+    assert "**DE-1** (Ann): Ingest (was In Progress)" in newly
+    assert still.startswith("BLOCKED TICKETS (1)")
+    assert "DE-2" in still
+
+
+def test_stale_check_counts_all_comments_not_just_new_ones():
+    def ticket(n, total):
+        return {"key": f"DE-{n}", "status": "In Progress", "priority": "High", "assignee": "Ann",
+                "comment_total": total, "recent_comments": [], "changes": []}
+
+    commented = {"jira": [ticket(n, 4) for n in range(1, 4)]}
+    silent = {"jira": [ticket(n, 0) for n in range(1, 4)]}
+
+    assert "STALE" not in obsidian.extract_critical_team_signals(commented)
+    assert "STALE HIGH-PRIORITY" in obsidian.extract_critical_team_signals(silent)
@@ -0,0 +1,463 @@
+"""
+Tests for src.connectors.slack.
+
+WebClient is replaced with an in-memory fake so no Slack API is touched.
+The fake records every call, which lets us assert on how often each method
+is hit as well as on the normalized output.
+"""
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.connectors import slack
+
+
+class FakeWebClient:
+    """Minimal stand-in for slack_sdk.WebClient backed by dicts."""
+
+    def __init__(self, history=None, replies=None, users=None, delays=None, directory=None,
+                 page_size=None):
+        self.page_size = page_size        # conversations.history page size (None = one page)
+        self.history = history or {}      # channel_id -> [messages]
+        self.replies = replies or {}      # (channel_id, ts) -> [messages]
+        self.users = users or {}          # user_id -> display name (users.info)
+        self.directory = directory or {}  # user_id -> display name (users.list)
+        self.delays = delays or {}        # channel_id -> seconds to sleep
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _record(self, method, **kwargs):
+        with self._lock:
+            self.calls.append((method, kwargs))
+
+    def conversations_history(self, channel, oldest=None, limit=None, cursor=None, **kwargs):
+        self._record("conversations_history", channel=channel, oldest=oldest, cursor=cursor)
+        time.sleep(self.delays.get(channel, 0))
+        messages = self.history.get(channel, [])
+        start = int(cursor or 0)
+        size = self.page_size or max(len(messages), 1)
+        next_cursor = str(start + size) if start + size < len(messages) else ""
+        return {
+            "messages": list(messages[start:start + size]),
+            "response_metadata": {"next_cursor": next_cursor},
+        }
+
+    def conversations_replies(self, channel, ts, limit=None, **kwargs):
+        self._record("conversations_replies", channel=channel, ts=ts)
+        return {"messages": list(self.replies.get((channel, ts), []))}
+
+    def users_list(self, limit=None, cursor=None):
+        self._record("users_list", cursor=cursor)
+        ids = sorted(self.directory)
+        start = int(cursor or 0)
+        page = ids[start:start + 2]
+        next_cursor = str(start + 2) if start + 2 < len(ids) else ""
+        return {
+            "members": [{"id": uid, "profile": {"display_name": self.directory[uid]}} for uid in page],
+            "response_metadata": {"next_cursor": next_cursor},
+        }
+
+    def users_info(self, user):
+        self._record("users_info", user=user)
+        return {"user": {"profile": {"display_name": self.users.get(user, "")}}}
+
+
+def _msg(ts, user="U1", text="hi", **extra):
+    return {"type": "message", "ts": ts, "user": user, "text": text, **extra}
+
+
+@pytest.fixture
+def fake_slack(monkeypatch):
+    """Patch WebClient + channel lookup; return a factory for the fake client."""
+    def _install(fake, channel_map):
+        monkeypatch.setattr(slack, "WebClient", lambda **kw: fake)
+        monkeypatch.setattr(slack, "_find_channel_ids", lambda client, names: dict(channel_map))
+        return fake
+    return _install
+
+
+SINCE = datetime(2026, 4, 28, tzinfo=timezone.utc)
+
+
+# ── Concurrent channel fetch ────────────────────────────────────────────────
+
+def test_channel_order_follows_config_not_completion(fake_slack):
+    fake = fake_slack(
+        FakeWebClient(
+            history={
+                "C1": [_msg("1777400001.000100", text="slow")],
+                "C2": [_msg("1777400002.000100", text="fast")],
+            },
+            users={"U1": "Alice"},
+            delays={"C1": 0.05},
+        ),
+        {"alpha": "C1", "beta": "C2"},
+    )
+    config = {"slack": {"channels": ["alpha", "beta"], "max_workers": 4}}
+
+    out = slack.fetch_updates(config, SINCE)
+
+    assert [u["channel"] for u in out] == ["#alpha", "#beta"]
+    assert [u["text"] for u in out] == ["slow", "fast"]
+    assert out[0]["author"] == "Alice"
+    # Both channels were requested even though one was slow
+    assert len([c for c in fake.calls if c[0] == "conversations_history"]) == 2
+
+
+def test_channel_error_does_not_abort_others(fake_slack):
+    class Failing(FakeWebClient):
+        def conversations_history(self, channel, **kwargs):
+            if channel == "C1":
+                raise slack.SlackApiError("boom", {"error": "channel_not_found"})
+            return super().conversations_history(channel, **kwargs)
+
+    fake_slack(
+        Failing(history={"C2": [_msg("1777400002.000100")]}),
+        {"alpha": "C1", "beta": "C2"},
+    )
+    out = slack.fetch_updates({"slack": {"channels": ["alpha", "beta"]}}, SINCE)
+    assert [u["channel"] for u in out] == ["#beta"]
+
+
+def test_user_lookup_shared_across_workers(fake_slack):
+    history = {f"C{i}": [_msg(f"177740000{i}.000100", user="U1")] for i in range(5)}
+    fake = fake_slack(
+        FakeWebClient(history=history, users={"U1": "Alice"}),
+        {f"ch{i}": f"C{i}" for i in range(5)},
+    )
+    config = {"slack": {"channels": [f"ch{i}" for i in range(5)], "max_workers": 1}}
+    out = slack.fetch_updates(config, SINCE)
+    assert all(u["author"] == "Alice" for u in out)
+    assert len([c for c in fake.calls if c[0] == "users_info"]) == 1
+
+
+# ── User directory ───────────────────────────────────────────────────────────
+
+def test_user_directory_built_from_paginated_users_list(fake_slack):
+    fake = fake_slack(
+        FakeWebClient(
+            history={"C1": [_msg("1777400001.000100", user="U3")]},
+            directory={"U1": "Alice", "U2": "Bob", "U3": "Cara"},
+        ),
+        {"alpha": "C1"},
+    )
+    out = slack.fetch_updates({"slack": {"channels": ["alpha"]}}, SINCE)
+
+    assert out[0]["author"] == "Cara"
+    assert len([c for c in fake.calls if c[0] == "users_list"]) == 2
+    assert not [c for c in fake.calls if c[0] == "users_info"]
+    saved = slack._UserDirectory.load()
+    assert saved.get("U2") == "Bob"
+
+
+def test_user_directory_reused_within_ttl_and_misses_added(fake_slack):
+    slack._USER_DIRECTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    slack._USER_DIRECTORY_PATH.write_text(json.dumps({
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "users": {"U1": "Alice"},
+    }))
+
+    fake = fake_slack(
+        FakeWebClient(
+            history={"C1": [_msg("1777400001.000100", user="U1"),
+                            _msg("1777400002.000100", user="U9")]},
+            users={"U9": "Newbie"},
+            directory={"U1": "Alice"},
+        ),
+        {"alpha": "C1"},
+    )
+    out = slack.fetch_updates({"slack": {"channels": ["alpha"]}}, SINCE)
+
+    assert {u["author"] for u in out} == {"Alice", "Newbie"}
+    assert not [c for c in fake.calls if c[0] == "users_list"]
+    assert [c[1]["user"] for c in fake.calls if c[0] == "users_info"] == ["U9"]
+    assert slack._UserDirectory.load().get("U9") == "Newbie"
+
+
+def test_user_directory_stale_after_ttl():
+    old = (datetime.now(timezone.utc) - timedelta(hours=30)).isoformat()
+    assert slack._UserDirectory({}, old).is_stale(24)
+    assert not slack._UserDirectory({}, old).is_stale(48)
+    assert slack._UserDirectory({}, "").is_stale(24)
+
+
+# ── Rate limiter ─────────────────────────────────────────────────────────────
+
+def test_rate_limiter_allows_burst_then_paces(monkeypatch):
+    clock = {"now": 0.0}
+    sleeps = []
+    monkeypatch.setattr(slack.time, "monotonic", lambda: clock["now"])
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+    monkeypatch.setattr(slack.time, "sleep", _sleep)
+
+    limiter = slack._RateLimiter({"conversations_history": 60})
+    for _ in range(60):
+        limiter.acquire("conversations_history")
+    assert sleeps == []
+
+    limiter.acquire("conversations_history")
+    assert sleeps and sleeps[0] == pytest.approx(1.0)
+
+
+def test_rate_limiter_ignores_unlisted_methods():
+    limiter = slack._RateLimiter({})
+    limiter.acquire("auth_test")  # must not raise or block
+
+
+# ── Incremental cursors ──────────────────────────────────────────────────────
+
+def test_incremental_resumes_each_channel_from_its_cursor(fake_slack):
+    from src import state
+
+    state.stage_cursors("slack", {"channel:C1": "1777400050.000000"})
+    state.commit_cursors()
+
+    fake = fake_slack(
+        FakeWebClient(history={
+            "C1": [_msg("1777400060.000100")],
+            "C2": [_msg("1777400070.000100")],
+        }),
+        {"alpha": "C1", "beta": "C2"},
+    )
+    slack.fetch_updates({"slack": {"channels": ["alpha", "beta"]}}, SINCE, incremental=True)
+
+    oldest = {c[1]["channel"]: c[1]["oldest"] for c in fake.calls if c[0] == "conversations_history"}
+    assert oldest["C1"] == "1777400050.000000"
+    assert oldest["C2"] == str(SINCE.timestamp())
+
+    state.commit_cursors()
+    assert state.get_cursors("slack") == {
+        "channel:C1": "1777400060.000100",
+        "channel:C2": "1777400070.000100",
+    }
+
+
+def test_failed_channel_keeps_old_cursor_others_advance(fake_slack):
+    from src import state
+
+    state.stage_cursors("slack", {"channel:C1": "1777400010.000000"})
+    state.commit_cursors()
+
+    class Failing(FakeWebClient):
+        def conversations_history(self, channel, **kwargs):
+            if channel == "C1":
+                raise slack.SlackApiError("boom", {"error": "ratelimited"})
+            return super().conversations_history(channel, **kwargs)
+
+    fake_slack(
+        Failing(history={"C2": [_msg("1777400070.000100")]}),
+        {"alpha": "C1", "beta": "C2"},
+    )
+    slack.fetch_updates({"slack": {"channels": ["alpha", "beta"]}}, SINCE, incremental=True)
+    state.commit_cursors()
+
+    cursors = state.get_cursors("slack")
+    assert cursors["channel:C1"] == "1777400010.000000"
+    assert cursors["channel:C2"] == "1777400070.000100"
+
+
+def test_non_incremental_ignores_and_does_not_stage_cursors(fake_slack):
+    from src import state
+
+    state.stage_cursors("slack", {"channel:C1": "1777400050.000000"})
+    state.commit_cursors()
+
+    fake = fake_slack(
+        FakeWebClient(history={"C1": [_msg("1777400060.000100")]}),
+        {"alpha": "C1"},
+    )
+    slack.fetch_updates({"slack": {"channels": ["alpha"]}}, SINCE)
+
+    oldest = [c[1]["oldest"] for c in fake.calls if c[0] == "conversations_history"]
+    assert oldest == [str(SINCE.timestamp())]
+    assert state._pending_cursors == {}
+
+
+# ── Pagination + streaming ───────────────────────────────────────────────────
+
+def test_history_follows_next_cursor_past_first_page(fake_slack):
+    messages = [_msg(f"{1777400000 + i}.000100", text=str(i)) for i in range(7)]
+    fake = fake_slack(
+        FakeWebClient(history={"C1": messages}, page_size=3),
+        {"alpha": "C1"},
+    )
+    out = slack.fetch_updates({"slack": {"channels": ["alpha"]}}, SINCE)
+
+    assert [u["text"] for u in out] == [str(i) for i in range(7)]
+    cursors = [c[1]["cursor"] for c in fake.calls if c[0] == "conversations_history"]
+    assert cursors == [None, "3", "6"]
+
+
+def test_iter_updates_can_stop_early_without_hanging(fake_slack, monkeypatch):
+    monkeypatch.setattr(slack, "_STREAM_BUFFER", 2)
+    messages = [_msg(f"{1777400000 + i}.000100") for i in range(50)]
+    fake_slack(
+        FakeWebClient(history={"C1": messages, "C2": messages}, page_size=10),
+        {"alpha": "C1", "beta": "C2"},
+    )
+    stream = slack.iter_updates({"slack": {"channels": ["alpha", "beta"]}}, SINCE)
+    first = next(stream)
+    stream.close()
+    assert first["channel"] == "#alpha"
+
+
+def test_dms_paginate_conversations_and_respect_cap(fake_slack):
+    class WithDMs(FakeWebClient):
+        def conversations_list(self, types=None, limit=None, cursor=None, **kwargs):
+            self._record("conversations_list", cursor=cursor)
+            if cursor is None:
+                return {"channels": [{"id": "D1", "user": "U1", "updated": 1}],
+                        "response_metadata": {"next_cursor": "p2"}}
+            return {"channels": [{"id": "D2", "user": "U2", "updated": 2}],
+                    "response_metadata": {"next_cursor": ""}}
+
+    fake = fake_slack(
+        WithDMs(
+            history={"D1": [_msg("1777400001.000100", user="U1", text="old")],
+                     "D2": [_msg("1777400002.000100", user="U2", text="new")]},
+            directory={"U1": "Alice", "U2": "Bob"},
+        ),
+        {},
+    )
+    config = {"slack": {"channels": [], "include_dms": True, "dm_max_conversations": 1}}
+    out = slack.fetch_updates(config, SINCE)
+
+    assert [(u["channel"], u["text"]) for u in out] == [("DM: Bob", "new")]
+    assert len([c for c in fake.calls if c[0] == "conversations_list"]) == 2
+
+
+# ── Thread hydration ─────────────────────────────────────────────────────────
+
+class WithMentions(FakeWebClient):
+    def __init__(self, matches=None, **kwargs):
+        super().__init__(**kwargs)
+        self.matches = matches or []
+
+    def auth_test(self):
+        return {"user_id": "UME"}
+
+    def search_messages(self, query, page=1, **kwargs):
+        self._record("search_messages", page=page)
+        return {"messages": {"matches": self.matches, "paging": {"pages": 1}}}
+
+
+def _thread_parent(ts, latest_reply):
+    return _msg(ts, reply_count=5, latest_reply=latest_reply)
+
+
+def test_thread_in_channel_and_mention_is_fetched_once(fake_slack):
+    parent = "1777400001.000100"
+    fake = fake_slack(
+        WithMentions(
+            history={"C1": [_thread_parent(parent, "1777400009.000100")]},
+            replies={("C1", parent): [_msg(parent), _msg("1777400009.000100", text="reply")]},
+            matches=[{
+                "ts": "1777400009.000100", "thread_ts": parent, "user": "U1", "text": "<@UME> ping",
+                "channel": {"id": "C1", "name": "alpha"},
+            }],
+            directory={"U1": "Alice"},
+        ),
+        {"alpha": "C1"},
+    )
+    config = {"slack": {"channels": ["alpha"], "include_mentions": True, "thread_reply_min": 3}}
+    out = slack.fetch_updates(config, SINCE)
+
+    assert [u["channel"] for u in out] == ["#alpha", "@mention (#alpha)"]
+    assert out[0]["thread_replies"] == [{"author": "Alice", "text": "reply"}]
+    assert out[1]["thread_replies"] == out[0]["thread_replies"]
+    assert len([c for c in fake.calls if c[0] == "conversations_replies"]) == 1
+
+
+def test_unchanged_thread_served_from_cache_on_next_run(fake_slack):
+    parent = "1777400001.000100"
+    config = {"slack": {"channels": ["alpha"], "thread_reply_min": 3}}
+    replies = {("C1", parent): [_msg(parent), _msg("1777400009.000100", text="reply")]}
+
+    first = fake_slack(
+        FakeWebClient(history={"C1": [_thread_parent(parent, "1777400009.000100")]}, replies=replies),
+        {"alpha": "C1"},
+    )
+    slack.fetch_updates(config, SINCE)
+    assert len([c for c in first.calls if c[0] == "conversations_replies"]) == 1
+
+    second = fake_slack(
+        FakeWebClient(history={"C1": [_thread_parent(parent, "1777400009.000100")]}, replies=replies),
+        {"alpha": "C1"},
+    )
+    out = slack.fetch_updates(config, SINCE)
+    assert out[0]["thread_replies"] == [{"author": "U1", "text": "reply"}]
+    assert not [c for c in second.calls if c[0] == "conversations_replies"]
+
+    # A new reply changes latest_reply and forces a refetch
+    third = fake_slack(
+        FakeWebClient(history={"C1": [_thread_parent(parent, "1777400020.000100")]}, replies=replies),
+        {"alpha": "C1"},
+    )
+    slack.fetch_updates(config, SINCE)
+    assert len([c for c in third.calls if c[0] == "conversations_replies"]) == 1
+
+
+def test_thread_fetch_error_yields_empty_replies_and_is_not_cached(fake_slack):
+    class Failing(FakeWebClient):
+        def conversations_replies(self, channel, ts, **kwargs):
+            self._record("conversations_replies", channel=channel, ts=ts)
+            raise slack.SlackApiError("boom", {"error": "ratelimited"})
+
+    parent = "1777400001.000100"
+    fake_slack(
+        Failing(history={"C1": [_thread_parent(parent, "1777400009.000100")]}),
+        {"alpha": "C1"},
+    )
+    out = slack.fetch_updates({"slack": {"channels": ["alpha"]}}, SINCE)
+    assert out[0]["thread_replies"] == []
+    assert not slack._THREAD_CACHE_PATH.exists()
+
+
+# ── Alert collapsing ─────────────────────────────────────────────────────────
+
+def test_alert_signature_strips_volatile_tokens():
+    a = slack._alert_signature(
+        "DAG `etl_v2` task `load` failed at 2026-04-29T03:12:44Z <https://af/log?id=1|View log>"
+    )
+    b = slack._alert_signature(
+        "DAG `etl_v2` task `load` failed at 2026-04-30T09:00:01Z <https://af/log?id=2|View log>"
+    )
+    c = slack._alert_signature(
+        "DAG `etl_v2` task `publish` failed at 2026-04-30T09:00:01Z <https://af/log?id=2|View log>"
+    )
+    assert a == b
+    assert a != c
+
+
+def test_alert_channel_collapsed_to_clusters(fake_slack):
+    alerts = [
+        _msg(f"{1777400000 + i}.000100", text=f"DAG etl task load failed run {i}")
+        for i in range(10)
+    ] + [_msg("1777400050.000100", text="DAG etl task publish failed run 1")]
+    fake_slack(
+        FakeWebClient(history={
+            "C1": alerts,
+            "C2": [_msg("1777400060.000100", text="human chatter")] * 2,
+        }),
+        {"airflow_prod_alerts": "C1", "general": "C2"},
+    )
+    config = {"slack": {
+        "channels": ["airflow_prod_alerts", "general"],
+        "alert_channels": ["airflow_prod_alerts"],
+    }}
+    out = slack.fetch_updates(config, SINCE)
+
+    alert_rows = [u for u in out if u["channel"] == "#airflow_prod_alerts"]
+    assert len(alert_rows) == 2
+    load = alert_rows[0]
+    assert load["alert_count"] == 10
+    assert load["first_seen"] < load["last_seen"] == load["timestamp"]
+    assert "alert_count" not in alert_rows[1]
+    # Non-alert channels are untouched, even when messages repeat
+    assert len([u for u in out if u["channel"] == "#general"]) == 2
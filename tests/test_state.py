@@ -0,0 +1,65 @@
+"""
+Tests for src.state: last-run timestamp and per-stream cursor persistence.
+
+conftest redirects STATE_PATH / CURSORS_PATH into tmp_path.
+"""
+import json
+
+from src import state
+
+
+def test_cursors_are_not_written_until_commit():
+    state.stage_cursors("slack", {"channel:C1": "1.0"})
+    assert state.get_cursors("slack") == {}
+    state.commit_cursors()
+    assert state.get_cursors("slack") == {"channel:C1": "1.0"}
+
+
+def test_commit_merges_with_existing_cursors():
+    state.stage_cursors("slack", {"channel:C1": "1.0", "mentions": "2.0"})
+    state.commit_cursors()
+    state.stage_cursors("slack", {"channel:C1": "3.0"})
+    state.commit_cursors()
+    assert state.get_cursors("slack") == {"channel:C1": "3.0", "mentions": "2.0"}
+
+
+def test_corrupt_cursor_file_is_ignored():
+    state.CURSORS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    state.CURSORS_PATH.write_text("{not json")
+    assert state.get_cursors("slack") == {}
+
+
+def test_clear_last_run_removes_cursors(capsys):
+    state.save_last_run()
+    state.stage_cursors("slack", {"channel:C1": "1.0"})
+    state.commit_cursors()
+    state.clear_last_run()
+    assert not state.STATE_PATH.exists()
+    assert not state.CURSORS_PATH.exists()
+
+
+def test_save_last_run_round_trips():
+    state.save_last_run()
+    data = json.loads(state.STATE_PATH.read_text())
+    assert state.get_last_run().isoformat() == data["last_run"]
+
+
+def test_store_entries_are_not_written_until_commit(tmp_path):
+    path = tmp_path / "store.json"
+    state.stage_store(path, {"A": {"x": 1, "seen_at": "2999-01-01T00:00:00+00:00"}}, max_age_days=30)
+    assert state.load_store(path) == {}
+    state.commit_cursors()
+    assert state.load_store(path)["A"]["x"] == 1
+
+
+def test_store_commit_merges_and_drops_entries_past_max_age(tmp_path):
+    path = tmp_path / "store.json"
+    state.stage_store(path, {
+        "old": {"seen_at": "2000-01-01T00:00:00+00:00"},
+        "kept": {"seen_at": "2999-01-01T00:00:00+00:00"},
+    }, max_age_days=30)
+    state.commit_cursors()
+    state.stage_store(path, {"new": {"seen_at": "2999-01-01T00:00:00+00:00"}}, max_age_days=30)
+    state.commit_cursors()
+
+    assert sorted(state.load_store(path)) == ["kept", "new"]